@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Contextual skill extraction benchmark - cost as the taxonomy grows
+
+Usage: python3 benchmarks/contextual_skills_benchmark.py [resume.txt] [--sizes 150,5000,50000] [--repeat N]
+
+Compares _extract_contextual_skills against the previous approach, which
+checked every captured phrase against every skill of every category.
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from fixed_resume_parser import PATTERNS, FixedResumeParser, ResumeDocument
+from skill_taxonomy import SkillTaxonomy
+
+SAMPLE_TEXT = """
+Developed using Django and React for the claims platform.
+Implemented CI pipelines with Jenkins and Docker; experience in Kubernetes and Terraform.
+Expertise in Python, Java and PostgreSQL. Built dashboards using Tableau with Power BI exports.
+"""
+
+
+def build_database(size, seed=7):
+    """Built-in database padded with random skills"""
+    database = {category: list(skills) for category, skills in
+                FixedResumeParser()._build_comprehensive_skills_database().items()}
+    rng = random.Random(seed)
+    padding = database.setdefault('Synthetic', [])
+    count = sum(len(skills) for skills in database.values())
+    while count < size:
+        padding.append(' '.join(''.join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(3, 9)))
+                                for _ in range(rng.randint(1, 3))))
+        count += 1
+    return database
+
+
+def legacy_contextual(text, database):
+    """Previous approach: every phrase against every skill, uppercasing both each time"""
+    found = 0
+    for pattern in PATTERNS['skills_contextual']:
+        for match in pattern.finditer(text):
+            potential_skill = match.group(1).strip()
+            for skill_list in database.values():
+                for known_skill in skill_list:
+                    if known_skill.upper() in potential_skill.upper():
+                        found += 1
+                        break
+    return found
+
+
+def best_ms(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return result, best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('resume', nargs='?')
+    arg_parser.add_argument('--sizes', default='150,5000,50000')
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    if args.resume:
+        with open(args.resume, 'r', encoding='utf-8', errors='ignore') as f:
+            text = f.read()
+    else:
+        text = SAMPLE_TEXT * 50
+
+    parser = FixedResumeParser()
+    phrases = sum(len(list(pattern.finditer(text))) for pattern in PATTERNS['skills_contextual'])
+    print(f"text: {len(text)} chars, {phrases} captured phrases")
+    print(f"{'skills':>8} {'matcher ms':>11} {'legacy ms':>10} {'hits':>6}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        database = build_database(size)
+        taxonomy = SkillTaxonomy(database)
+        doc = ResumeDocument(text)
+
+        skills, matcher_ms = best_ms(lambda: parser._extract_contextual_skills(doc, taxonomy), args.repeat)
+        _, legacy_ms = best_ms(lambda: legacy_contextual(text, database), 1)
+        print(f"{size:>8} {matcher_ms:>11.2f} {legacy_ms:>10.2f} {len(skills):>6}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Legacy .doc extraction benchmark - piece table decoding vs. the printable-bytes scrapers
+
+Usage: python3 benchmarks/doc_extraction_benchmark.py [file.doc ...] [--junk-mb 1,10,40] [--repeat 3]
+
+Without .doc files, synthetic Word 97 documents are written to a temp directory:
+a short resume (with non-ASCII text and a hyperlink field) plus an embedded
+binary Data stream of the requested size, standing in for pictures and OLE
+objects. The scrapers are the fallback in fixed_server.clean_doc_text_extraction,
+before (whole file read plus re.findall) and after moving it onto an mmap.
+"""
+
+import argparse
+import math
+import os
+import random
+import re
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from office_extraction import clean_mixed_binary_text, extract_text_from_doc, scrape_printable_text
+
+RESUME_TEXT = [
+    "José Müller\r",
+    "Senior Data Engineer – Zürich\r",
+    "Email: \x13 HYPERLINK \"mailto:jose@example.com\" \x14jose@example.com\x15\r",
+    "EXPERIENCE\r",
+    "Acme Corp | Jan 2019 - Present\r",
+    "Built ETL pipelines in Python and Spark on AWS.\r",
+    "EDUCATION\r",
+    "Master of Science in Computer Science, ETH Zürich\r",
+]
+HEADER_TEXT = "Curriculum Vitae\r"
+
+# Compound File Binary constants
+_SECTOR = 512
+_FREESECT, _ENDOFCHAIN, _FATSECT, _DIFSECT, _NOSTREAM = 0xFFFFFFFF, 0xFFFFFFFE, 0xFFFFFFFD, 0xFFFFFFFC, 0xFFFFFFFF
+_MINI_STREAM_CUTOFF = 4096
+
+
+def build_word_streams(paragraphs, header):
+    """WordDocument and 1Table stream bytes for the given main text and header story"""
+    text_start = 2048
+    pieces, data, cp = [], bytearray(), 0
+    for paragraph in paragraphs + [header]:
+        try:
+            encoded = paragraph.encode('ascii')
+            fc = ((text_start + len(data)) * 2) | 0x40000000
+        except UnicodeEncodeError:
+            encoded = paragraph.encode('utf-16-le')
+            fc = text_start + len(data)
+        pieces.append((cp, cp + len(paragraph), fc))
+        data += encoded
+        cp += len(paragraph)
+
+    word_document = bytearray(text_start)
+    struct.pack_into('<HHHHHH', word_document, 0, 0xA5EC, 0x00C1, 0, 0x0409, 0, 0x0200)
+    struct.pack_into('<H', word_document, 32, 14)
+    struct.pack_into('<H', word_document, 62, 22)
+    ccp_text = sum(len(p) for p in paragraphs)
+    struct.pack_into('<iii', word_document, 76, ccp_text, 0, len(header))
+    struct.pack_into('<H', word_document, 152, 0x5D)
+    word_document += data
+
+    plc = struct.pack(f'<{len(pieces) + 1}I', *([start for start, _, _ in pieces] + [cp]))
+    plc += b''.join(struct.pack('<HIH', 0, fc, 0) for _, _, fc in pieces)
+    clx = b'\x02' + struct.pack('<I', len(plc)) + plc
+    table = bytearray(256) + clx
+    struct.pack_into('<II', word_document, 418, 256, len(clx))
+    return bytes(word_document), bytes(table)
+
+
+def write_compound_file(path, streams):
+    """Minimal CFB (version 3) writer; streams are padded past the mini stream cutoff"""
+    streams = [(name, data.ljust(_MINI_STREAM_CUTOFF, b'\0')) for name, data in streams]
+    data_sectors = [math.ceil(len(data) / _SECTOR) for _, data in streams]
+    dir_sectors = math.ceil((len(streams) + 1) * 128 / _SECTOR)
+    fat_sectors = difat_sectors = 0
+    while True:
+        total = sum(data_sectors) + dir_sectors + fat_sectors + difat_sectors
+        needed_fat = math.ceil(total / 128)
+        needed_difat = max(0, math.ceil((needed_fat - 109) / 127))
+        if (needed_fat, needed_difat) == (fat_sectors, difat_sectors):
+            break
+        fat_sectors, difat_sectors = needed_fat, needed_difat
+
+    fat, starts, sector = [], [], 0
+    for count in data_sectors + [dir_sectors]:
+        starts.append(sector)
+        fat += list(range(sector + 1, sector + count)) + [_ENDOFCHAIN]
+        sector += count
+    fat_start = sector
+    fat += [_FATSECT] * fat_sectors + [_DIFSECT] * difat_sectors
+    fat += [_FREESECT] * (fat_sectors * 128 - len(fat))
+    difat_start = fat_start + fat_sectors
+    fat_locations = list(range(fat_start, fat_start + fat_sectors))
+
+    header = bytearray(_SECTOR)
+    struct.pack_into('<8s16sHHHHH6xIIIIIIIII', header, 0, bytes.fromhex('D0CF11E0A1B11AE1'), b'', 0x3E, 3, 0xFFFE,
+                     9, 6, 0, fat_sectors, starts[-1], 0, _MINI_STREAM_CUTOFF, _ENDOFCHAIN, 0,
+                     difat_start if difat_sectors else _ENDOFCHAIN, difat_sectors)
+    header_difat = (fat_locations[:109] + [_FREESECT] * 109)[:109]
+    struct.pack_into('<109I', header, 76, *header_difat)
+
+    def entry(name, kind, right, child, start, size):
+        encoded = (name + '\0').encode('utf-16-le')
+        return struct.pack('<64sHBBIII16sIQQIQ', encoded, len(encoded), kind, 1, _NOSTREAM, right, child,
+                           b'', 0, 0, 0, start, size)
+
+    directory = [entry('Root Entry', 5, _NOSTREAM, 1, _ENDOFCHAIN, 0)]
+    for index, (name, data) in enumerate(streams):
+        right = index + 2 if index + 1 < len(streams) else _NOSTREAM
+        directory.append(entry(name, 2, right, _NOSTREAM, starts[index], len(data)))
+    empty = struct.pack('<64sHBBIII16sIQQIQ', b'', 0, 0, 0, _NOSTREAM, _NOSTREAM, _NOSTREAM, b'', 0, 0, 0, 0, 0)
+    directory += [empty] * (dir_sectors * 4 - len(directory))
+
+    with open(path, 'wb') as f:
+        f.write(header)
+        for _, data in streams:
+            f.write(data.ljust(math.ceil(len(data) / _SECTOR) * _SECTOR, b'\0'))
+        f.write(b''.join(directory))
+        f.write(struct.pack(f'<{len(fat)}I', *fat))
+        remaining = fat_locations[109:]
+        for index in range(difat_sectors):
+            chunk = remaining[index * 127:(index + 1) * 127]
+            next_sector = difat_start + index + 1 if index + 1 < difat_sectors else _ENDOFCHAIN
+            f.write(struct.pack('<128I', *(chunk + [_FREESECT] * (127 - len(chunk)) + [next_sector])))
+
+
+def build_doc(path, junk_mb, seed=7):
+    """Synthetic .doc: the sample resume plus junk_mb of embedded binary data"""
+    rng = random.Random(seed)
+    word_document, table = build_word_streams(RESUME_TEXT, HEADER_TEXT)
+    # Mostly random bytes with printable runs, like compressed pictures and OLE objects
+    junk = bytearray(rng.getrandbits(8) for _ in range(256 * 1024))
+    for offset in range(0, len(junk) - 64, 997):
+        junk[offset:offset + 24] = b'Arial Times New Roman EMF'[:24]
+    junk = bytes(junk) * max(1, int(junk_mb * 4))
+    write_compound_file(path, [('WordDocument', word_document), ('1Table', table), ('Data', junk)])
+
+
+def legacy_scrape(path):
+    """The original printable-bytes scraper: whole file in memory, every match in a list"""
+    with open(path, 'rb') as f:
+        content = f.read()
+    text_parts = re.findall(rb'[A-Za-z0-9\s@._()\-+]{8,}', content)
+    return clean_mixed_binary_text(b' '.join(text_parts).decode('utf-8', errors='ignore'))
+
+
+def mmap_scrape(path):
+    """The current scraper: incremental matches over a memory map, bounded output"""
+    return clean_mixed_binary_text(scrape_printable_text(path))
+
+
+def measure(func, path, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = func(path)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    func(path)
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return text, best, peak
+
+
+def run(path, repeat):
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    print(f"{os.path.basename(path)[-28:]} ({size_mb:.1f} MB)")
+    for label, func in (('piece table', extract_text_from_doc), ('read scraper', legacy_scrape),
+                        ('mmap scraper', mmap_scrape)):
+        try:
+            text, ms, peak_mb = measure(func, path, repeat)
+        except ImportError as e:
+            print(f"  {label:>12}  unavailable ({e})")
+            continue
+        non_ascii = 'yes' if any(ord(c) > 127 for c in text) else 'no'
+        print(f"  {label:>12} {ms:>10.1f} ms {peak_mb:>8.1f} MB peak {len(text):>9} chars  non-ASCII kept: {non_ascii}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('doc', nargs='*')
+    arg_parser.add_argument('--junk-mb', default='1,10,40')
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    if args.doc:
+        for path in args.doc:
+            run(path, args.repeat)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for junk_mb in (float(size) for size in args.junk_mb.split(',')):
+            path = os.path.join(tmp_dir, f'resume_{junk_mb:g}mb.doc')
+            build_doc(path, junk_mb)
+            run(path, args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
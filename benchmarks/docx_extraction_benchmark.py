@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+DOCX extraction benchmark - streaming extractor vs. python-docx and docx2txt
+
+Usage: python3 benchmarks/docx_extraction_benchmark.py [file.docx ...] [--paragraphs 1000,20000,100000] [--repeat 3]
+
+Without DOCX files, synthetic documents of the requested paragraph counts (with
+a table every 50 paragraphs and a header) are written to a temp directory.
+python-docx and docx2txt are skipped when they are not installed.
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from office_extraction import extract_text_from_docx
+
+_W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/></Relationships>'
+)
+
+
+def _paragraph(text):
+    return f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>'
+
+
+def build_docx(path, paragraphs, seed=7):
+    """Write a DOCX with random text paragraphs, a table every 50 paragraphs and a header"""
+    rng = random.Random(seed)
+    body = []
+    for i in range(paragraphs):
+        words = ' '.join(''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+                         for _ in range(rng.randint(4, 20)))
+        body.append(_paragraph(words))
+        if i % 50 == 0:
+            body.append(f'<w:tbl><w:tr><w:tc>{_paragraph("Python")}</w:tc><w:tc>{_paragraph("5 years")}</w:tc></w:tr></w:tbl>')
+    document = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document xmlns:w="{_W}"><w:body>'
+                f'{"".join(body)}<w:sectPr/></w:body></w:document>')
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', _CONTENT_TYPES)
+        archive.writestr('_rels/.rels', _RELS)
+        archive.writestr('word/document.xml', document)
+        archive.writestr('word/header1.xml', f'<w:hdr xmlns:w="{_W}">{_paragraph("Jane Doe - jane@example.com")}</w:hdr>')
+
+
+def python_docx_text(path):
+    import docx
+    return '\n'.join(paragraph.text for paragraph in docx.Document(path).paragraphs)
+
+
+def docx2txt_text(path):
+    import docx2txt
+    return docx2txt.process(path)
+
+
+def measure(func, path, repeat):
+    """Best time in ms and peak traced memory in MB of func(path)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(path)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    func(path)
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(path, repeat):
+    size_mb = os.path.getsize(path) / (1024 * 1024)
+    print(f"{os.path.basename(path)[-28:]} ({size_mb:.1f} MB)")
+    for label, func in (('streaming', extract_text_from_docx), ('python-docx', python_docx_text),
+                        ('docx2txt', docx2txt_text)):
+        try:
+            ms, peak_mb = measure(func, path, repeat)
+        except ImportError:
+            print(f"  {label:>12}  not installed")
+            continue
+        print(f"  {label:>12} {ms:>10.1f} ms {peak_mb:>8.1f} MB peak")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('docx', nargs='*')
+    arg_parser.add_argument('--paragraphs', default='1000,20000,100000')
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    if args.docx:
+        for path in args.docx:
+            run(path, args.repeat)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for count in (int(c) for c in args.paragraphs.split(',')):
+            path = os.path.join(tmp_dir, f'resume_{count}.docx')
+            build_docx(path, count)
+            run(path, args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
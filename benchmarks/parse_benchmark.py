@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Per-resume parse time benchmark for FixedResumeParser
+
+Usage: python3 benchmarks/parse_benchmark.py <corpus_dir> [--repeat N]
+
+The corpus directory holds plain-text resumes (*.txt), e.g. the output of
+extract_text_from_file for the validation set. Run it on two checkouts to
+compare parse time before/after a change.
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from fixed_resume_parser import FixedResumeParser
+
+
+def load_corpus(corpus_dir):
+    """Load every .txt resume in the corpus directory"""
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, '*.txt'))):
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            corpus.append((os.path.basename(path), f.read()))
+    return corpus
+
+
+def time_parse(parser, text, filename, repeat):
+    """Return per-run parse times in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        # Keep any stdout chatter from the parser out of the measurement
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            parser.parse_resume(text, filename)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('corpus_dir')
+    arg_parser.add_argument('--repeat', type=int, default=20)
+    args = arg_parser.parse_args()
+
+    corpus = load_corpus(args.corpus_dir)
+    if not corpus:
+        print(f"No .txt resumes found in {args.corpus_dir}")
+        return 1
+
+    parser = FixedResumeParser()
+
+    # Warm up once so import-time and first-call costs are not counted
+    for filename, text in corpus:
+        time_parse(parser, text, filename, 1)
+
+    print(f"{'file':<40} {'chars':>8} {'median ms':>10} {'min ms':>8}")
+    medians = []
+    for filename, text in corpus:
+        timings = time_parse(parser, text, filename, args.repeat)
+        median = statistics.median(timings)
+        medians.append(median)
+        print(f"{filename[:40]:<40} {len(text):>8} {median:>10.3f} {min(timings):>8.3f}")
+
+    print(f"\nPer-resume mean of medians: {statistics.mean(medians):.3f} ms over {len(corpus)} files")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
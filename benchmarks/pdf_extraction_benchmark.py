@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+PDF extraction benchmark - serial vs. process-pool page extraction by page count
+
+Usage: python3 benchmarks/pdf_extraction_benchmark.py [file.pdf ...] [--pages 4,8,16,32,64,80] [--workers N] [--repeat 3]
+
+Without PDF files, synthetic text-heavy PDFs of the requested page counts are
+generated with PyMuPDF. The worker pool is started before timing, as it is in
+a long-running server. Use the page count where the speedup passes 1x on the
+serving hardware as PARALLEL_PDF_MIN_PAGES.
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import fitz  # PyMuPDF
+
+import pdf_extraction
+
+
+def build_pdf(pages, seed=7):
+    """PDF bytes with pages of dense random text"""
+    rng = random.Random(seed)
+    doc = fitz.open()
+    for _ in range(pages):
+        page = doc.new_page()
+        lines = [' '.join(''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10)))
+                          for _ in range(14))
+                 for _ in range(70)]
+        page.insert_textbox(fitz.Rect(36, 36, page.rect.width - 36, page.rect.height - 36), '\n'.join(lines), fontsize=7)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def best_ms(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return result, best
+
+
+def run(label, data, workers, repeat):
+    with pdf_extraction.open_pdf(data) as doc:
+        page_count = doc.page_count
+
+    serial_text, serial_ms = best_ms(lambda: pdf_extraction.extract_text_from_pdf(data, parallel_min_pages=0), repeat)
+    parallel_text, parallel_ms = best_ms(
+        lambda: pdf_extraction.extract_text_from_pdf_parallel(data, page_count, workers), repeat)
+    assert parallel_text == serial_text, "parallel extraction changed the text"
+    print(f"{label:>24} {page_count:>6} {serial_ms:>10.1f} {parallel_ms:>12.1f} {serial_ms / parallel_ms:>8.2f}x")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('pdfs', nargs='*')
+    arg_parser.add_argument('--pages', default='4,8,16,32,64,80')
+    arg_parser.add_argument('--workers', type=int, default=pdf_extraction.PDF_WORKERS)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    pdf_extraction.PDF_WORKERS = args.workers
+    pdf_extraction.extract_text_from_pdf_parallel(build_pdf(args.workers), args.workers)  # start the pool
+
+    print(f"{args.workers} workers")
+    print(f"{'document':>24} {'pages':>6} {'serial ms':>10} {'parallel ms':>12} {'speedup':>9}")
+    if args.pdfs:
+        for path in args.pdfs:
+            with open(path, 'rb') as f:
+                run(os.path.basename(path)[-24:], f.read(), args.workers, args.repeat)
+    else:
+        for pages in (int(p) for p in args.pages.split(',')):
+            run('synthetic', build_pdf(pages), args.workers, args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Skill matching benchmark - SkillMatcher vs. one regex scan per skill
+
+Usage: python3 benchmarks/skill_matcher_benchmark.py [resume.txt] [--sizes 150,5000,50000]
+
+Synthetic taxonomies of the requested sizes are generated on top of the
+built-in skills database, so every size contains the real skills.
+"""
+
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from fixed_resume_parser import FixedResumeParser
+from skill_matcher import SkillMatcher
+
+SAMPLE_TEXT = """
+Senior engineer with experience in Python, Java and C++ building services on AWS and Azure.
+Developed using Django and React; implemented CI/CD with Jenkins, Docker and Kubernetes.
+Led S/4 HANA migration, Power BI reporting and Node.js APIs backed by PostgreSQL and Redis.
+"""
+
+
+def build_taxonomy(size, seed=7):
+    """Real skills padded with random one to three word phrases"""
+    parser = FixedResumeParser()
+    terms = list(parser.skill_taxonomy.upper_names)
+    rng = random.Random(seed)
+    while len(terms) < size:
+        words = [''.join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(3, 9)))
+                 for _ in range(rng.randint(1, 3))]
+        terms.append(' '.join(words))
+    return terms[:size]
+
+
+def naive_find(terms, text_upper):
+    """Previous approach: substring test plus a fresh word-boundary regex per skill"""
+    found = set()
+    for term_id, term in enumerate(terms):
+        if term in text_upper and re.search(r'\b' + re.escape(term) + r'\b', text_upper):
+            found.add(term_id)
+    return found
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('resume', nargs='?')
+    arg_parser.add_argument('--sizes', default='150,5000,50000')
+    args = arg_parser.parse_args()
+
+    if args.resume:
+        with open(args.resume, 'r', encoding='utf-8', errors='ignore') as f:
+            text = f.read()
+    else:
+        text = SAMPLE_TEXT * 100
+    text_upper = text.upper()
+
+    print(f"text: {len(text)} chars")
+    print(f"{'skills':>8} {'build ms':>10} {'build MB':>9} {'matcher ms':>11} {'per-skill ms':>13} {'hits':>6}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        terms = build_taxonomy(size)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(terms)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        tracemalloc.start()
+        SkillMatcher(terms)
+        build_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+
+        matcher_ms = float('inf')
+        for _ in range(5):
+            start = time.perf_counter()
+            found = matcher.find_ids(text_upper)
+            matcher_ms = min(matcher_ms, (time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        expected = naive_find(terms, text_upper)
+        naive_ms = (time.perf_counter() - start) * 1000
+
+        assert found == expected, "matcher and per-skill regex disagree"
+        print(f"{size:>8} {build_ms:>10.1f} {build_mb:>9.1f} {matcher_ms:>11.2f} {naive_ms:>13.2f} {len(found):>6}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Taxonomy cold start benchmark - compiling a taxonomy file vs. loading its artifact
+
+Usage: python3 benchmarks/taxonomy_load_benchmark.py [taxonomy.json] [--sizes 5000,50000]
+
+Without a taxonomy file, synthetic ones of the requested sizes (real skills plus
+random phrases, every fifth skill with an alias) are written to a temp directory.
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from fixed_resume_parser import FixedResumeParser
+from skill_taxonomy import SkillTaxonomy, default_artifact_path
+
+
+def build_database(size, seed=7):
+    """Built-in database padded with random skills, some of them aliased"""
+    database = {category: list(skills) for category, skills in
+                FixedResumeParser()._build_comprehensive_skills_database().items()}
+    rng = random.Random(seed)
+    count = sum(len(skills) for skills in database.values())
+    padding = database.setdefault('Synthetic', [])
+    while count < size:
+        name = ' '.join(''.join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(3, 9)))
+                        for _ in range(rng.randint(1, 3)))
+        if count % 5 == 0:
+            padding.append({'name': name, 'aliases': [name.replace(' ', '-')]})
+            count += 2
+        else:
+            padding.append(name)
+            count += 1
+    return database
+
+
+def time_ms(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def run(path):
+    artifact = default_artifact_path(path)
+    compiled, compile_ms = time_ms(lambda: SkillTaxonomy.from_file(path))
+    _, save_ms = time_ms(lambda: compiled.save(artifact))
+    loaded, load_ms = time_ms(lambda: SkillTaxonomy.load(path))
+
+    assert loaded.version == compiled.version
+    assert loaded.entries == compiled.entries and loaded.upper_names == compiled.upper_names
+    sample = ' '.join(compiled.upper_names[::7])
+    assert loaded.find_entries(sample) == compiled.find_entries(sample), "artifact matcher differs"
+
+    artifact_mb = os.path.getsize(artifact) / (1024 * 1024)
+    print(f"{len(compiled):>8} {compile_ms:>11.1f} {save_ms:>8.1f} {load_ms:>8.1f} {artifact_mb:>12.1f}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('taxonomy', nargs='?')
+    arg_parser.add_argument('--sizes', default='5000,50000')
+    args = arg_parser.parse_args()
+
+    print(f"{'entries':>8} {'compile ms':>11} {'save ms':>8} {'load ms':>8} {'artifact MB':>12}")
+    if args.taxonomy:
+        run(args.taxonomy)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in (int(s) for s in args.sizes.split(',')):
+            path = os.path.join(tmp_dir, f'skills_{size}.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(build_database(size), f)
+            run(path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,341 +1,468 @@
-#!/usr/bin/env python3
-"""
-Clean Apple-like Resume Parser Server
-Minimalistic design with 91% accuracy
-"""
-
-from flask import Flask, request, jsonify, render_template_string
-from flask_cors import CORS
-from werkzeug.utils import secure_filename
-import os
-import time
-import uuid
-import logging
-from fixed_resume_parser import FixedResumeParser
-from fixed_server import extract_text_from_file
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-app = Flask(__name__)
-CORS(app)
-
-UPLOAD_FOLDER = 'uploads'
-ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt'}
-MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-parser = FixedResumeParser()
-
-def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
-
-def generate_transaction_id():
-    return str(uuid.uuid4())[:8]
-
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Resume Parser</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', sans-serif;
-            background: #f5f5f7; min-height: 100vh; color: #1d1d1f;
-        }
-        .container {
-            max-width: 520px; margin: 80px auto; padding: 0 24px;
-        }
-        h1 {
-            font-size: 2.5rem; font-weight: 700; text-align: center;
-            margin-bottom: 8px; letter-spacing: -0.03em;
-        }
-        .subtitle {
-            text-align: center; color: #86868b; margin-bottom: 48px;
-            font-size: 1.1rem; font-weight: 400;
-        }
-        .upload-area {
-            background: white; border: 2px dashed #d1d1d6;
-            border-radius: 12px; padding: 48px 32px; text-align: center;
-            transition: all 0.2s ease; cursor: pointer; margin-bottom: 32px;
-        }
-        .upload-area:hover { border-color: #007aff; }
-        .upload-area.dragover { border-color: #007aff; background: #f0f8ff; }
-        .upload-icon {
-            width: 48px; height: 48px; margin: 0 auto 16px;
-            background: #f0f8ff; border-radius: 50%;
-            display: flex; align-items: center; justify-content: center;
-        }
-        #fileInput { display: none; }
-        .upload-text {
-            font-size: 1.1rem; font-weight: 500; margin-bottom: 4px;
-        }
-        .upload-subtext { color: #86868b; font-size: 0.95rem; }
-        .upload-btn {
-            background: #007aff; color: white; border: none;
-            padding: 12px 24px; border-radius: 8px; font-size: 1rem;
-            font-weight: 500; cursor: pointer; margin-top: 16px;
-            transition: background 0.2s ease;
-        }
-        .upload-btn:hover { background: #0056cc; }
-        .loading {
-            display: none; text-align: center; margin: 32px 0;
-        }
-        .spinner {
-            border: 2px solid #f0f0f0; border-top: 2px solid #007aff;
-            border-radius: 50%; width: 24px; height: 24px;
-            animation: spin 1s linear infinite; margin: 0 auto 12px;
-        }
-        @keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
-        .results { margin-top: 32px; display: none; }
-        .result-section {
-            background: white; border-radius: 8px; padding: 20px;
-            margin-bottom: 16px; border: 1px solid #e5e5e7;
-        }
-        .result-title {
-            font-weight: 600; margin-bottom: 12px; color: #1d1d1f;
-            font-size: 1.1rem;
-        }
-        .result-item { margin-bottom: 8px; color: #424245; }
-        .result-item strong { color: #1d1d1f; }
-        .json-output {
-            background: #1d1d1f; color: #ffffff; padding: 16px;
-            border-radius: 8px; font-family: 'SF Mono', monospace;
-            font-size: 0.85rem; max-height: 300px; overflow-y: auto;
-            white-space: pre-wrap; margin-top: 16px;
-        }
-        .error {
-            background: #ffeaea; border: 1px solid #ff6b6b;
-            color: #d63031; padding: 12px; border-radius: 8px;
-            margin: 16px 0; display: none;
-        }
-        .stats {
-            display: grid; grid-template-columns: repeat(3, 1fr);
-            gap: 12px; margin: 24px 0;
-        }
-        .stat {
-            background: white; padding: 16px; border-radius: 8px;
-            text-align: center; border: 1px solid #e5e5e7;
-        }
-        .stat-number {
-            font-size: 1.4rem; font-weight: 700; color: #007aff;
-        }
-        .stat-label {
-            color: #86868b; font-size: 0.8rem; margin-top: 4px;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Resume Parser</h1>
-        <p class="subtitle">Parse resumes with 91% accuracy</p>
-
-        <div class="upload-area" onclick="document.getElementById('fileInput').click()">
-            <div class="upload-icon">
-                <svg width="24" height="24" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="1.5" d="M7 16a4 4 0 01-.88-7.903A5 5 0 1115.9 6L16 6a5 5 0 011 9.9M15 13l-3-3m0 0l-3 3m3-3v12"/>
-                </svg>
-            </div>
-            <div class="upload-text">Drop resume here or click to browse</div>
-            <div class="upload-subtext">PDF, DOC, DOCX, TXT (Max 10MB)</div>
-            <button class="upload-btn" type="button">Choose File</button>
-            <input type="file" id="fileInput" accept=".pdf,.doc,.docx,.txt">
-        </div>
-
-        <div class="error" id="errorDiv"></div>
-
-        <div class="loading" id="loadingDiv">
-            <div class="spinner"></div>
-            <p>Processing resume...</p>
-        </div>
-
-        <div class="results" id="resultsDiv">
-            <div class="stats" id="statsDiv"></div>
-            <div id="resultCards"></div>
-            <div class="json-output" id="jsonOutput"></div>
-        </div>
-    </div>
-
-    <script>
-        const uploadArea = document.querySelector('.upload-area');
-        const fileInput = document.getElementById('fileInput');
-        const loadingDiv = document.getElementById('loadingDiv');
-        const resultsDiv = document.getElementById('resultsDiv');
-        const errorDiv = document.getElementById('errorDiv');
-
-        uploadArea.addEventListener('dragover', (e) => {
-            e.preventDefault();
-            uploadArea.classList.add('dragover');
-        });
-
-        uploadArea.addEventListener('dragleave', () => {
-            uploadArea.classList.remove('dragover');
-        });
-
-        uploadArea.addEventListener('drop', (e) => {
-            e.preventDefault();
-            uploadArea.classList.remove('dragover');
-            const files = e.dataTransfer.files;
-            if (files.length > 0) {
-                processFile(files[0]);
-            }
-        });
-
-        fileInput.addEventListener('change', (e) => {
-            if (e.target.files.length > 0) {
-                processFile(e.target.files[0]);
-            }
-        });
-
-        function showError(message) {
-            errorDiv.textContent = message;
-            errorDiv.style.display = 'block';
-            loadingDiv.style.display = 'none';
-            resultsDiv.style.display = 'none';
-        }
-
-        function processFile(file) {
-            errorDiv.style.display = 'none';
-            resultsDiv.style.display = 'none';
-            loadingDiv.style.display = 'block';
-
-            const formData = new FormData();
-            formData.append('file', file);
-
-            fetch('/api/parse', {
-                method: 'POST',
-                body: formData
-            })
-            .then(response => response.json())
-            .then(data => {
-                loadingDiv.style.display = 'none';
-                if (data.success) {
-                    displayResults(data);
-                } else {
-                    showError(data.error || 'Failed to parse resume');
-                }
-            })
-            .catch(error => {
-                console.error('Error:', error);
-                showError('Network error occurred');
-            });
-        }
-
-        function displayResults(data) {
-            const statsDiv = document.getElementById('statsDiv');
-            const resultCards = document.getElementById('resultCards');
-            const jsonOutput = document.getElementById('jsonOutput');
-
-            // Extract contact information from nested structure
-            const contactInfo = data.ContactInformation || {};
-            const candidateName = contactInfo.CandidateName?.FormattedName || 'Not found';
-            const email = contactInfo.EmailAddresses?.[0]?.Address || 'Not found';
-            const phone = contactInfo.Telephones?.[0]?.Raw || 'Not found';
-            const positions = data.EmploymentHistory?.Positions?.length || 0;
-            const skillsCount = data.Skills?.length || 0;
-
-            // Display stats
-            statsDiv.innerHTML = `
-                <div class="stat">
-                    <div class="stat-number">${skillsCount}</div>
-                    <div class="stat-label">Skills</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-number">${positions}</div>
-                    <div class="stat-label">Positions</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-number">${Math.round((data.processing_time || 0) * 1000)}ms</div>
-                    <div class="stat-label">Processing</div>
-                </div>
-            `;
-
-            // Display parsed results
-            resultCards.innerHTML = `
-                <div class="result-section">
-                    <div class="result-title">Contact Information</div>
-                    <div class="result-item"><strong>Name:</strong> ${candidateName}</div>
-                    <div class="result-item"><strong>Email:</strong> ${email}</div>
-                    <div class="result-item"><strong>Phone:</strong> ${phone}</div>
-                </div>
-                <div class="result-section">
-                    <div class="result-title">Experience</div>
-                    <div class="result-item"><strong>Positions:</strong> ${positions}</div>
-                    <div class="result-item"><strong>Experience:</strong> ${data.experience_months || 0} months</div>
-                </div>
-            `;
-
-            // Display JSON
-            jsonOutput.textContent = JSON.stringify(data, null, 2);
-            resultsDiv.style.display = 'block';
-        }
-    </script>
-</body>
-</html>
-"""
-
-@app.route('/')
-def index():
-    return render_template_string(HTML_TEMPLATE)
-
-@app.route('/api/parse', methods=['POST'])
-def parse_resume():
-    try:
-        if 'file' not in request.files:
-            return jsonify({'success': False, 'error': 'No file provided'})
-
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({'success': False, 'error': 'No file selected'})
-
-        if not allowed_file(file.filename):
-            return jsonify({'success': False, 'error': 'File type not allowed'})
-
-        start_time = time.time()
-
-        # Save file temporarily and extract text
-        import tempfile
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
-            file.save(temp_file.name)
-            text = extract_text_from_file(temp_file.name, file.filename)
-            os.unlink(temp_file.name)  # Clean up temp file
-
-        if not text or text.strip() == "" or text.startswith('Unable to extract'):
-            return jsonify({'success': False, 'error': 'Could not extract text from file'})
-
-        # Parse resume
-        result = parser.parse_resume(text, file.filename)
-
-        # Add metadata
-        result['success'] = True
-        result['textkernel_format'] = True
-        result['processing_time'] = time.time() - start_time
-        result['transaction_id'] = generate_transaction_id()
-
-        return jsonify(result)
-
-    except Exception as e:
-        logger.error(f"Error parsing resume: {str(e)}")
-        return jsonify({'success': False, 'error': f'Processing error: {str(e)}'})
-
-@app.route('/api/health')
-def health():
-    return jsonify({'status': 'healthy', 'accuracy': '91%'})
-
-if __name__ == '__main__':
-    print("🎯 CLEAN RESUME PARSER SERVER")
-    print("=" * 50)
-    print("🚀 Server Status: PRODUCTION READY")
-    print("📊 Accuracy Score: 91%")
-    print("⚡ Processing Speed: < 100ms average")
-    print("=" * 50)
-    print("🌐 Web Interface: http://localhost:8001")
-    print("🔗 API Endpoint: http://localhost:8001/api/parse")
-    print("❤️  Health Check: http://localhost:8001/api/health")
-    print("=" * 50)
-    print("✅ Ready to process resumes!")
-
+#!/usr/bin/env python3
+"""
+Clean Apple-like Resume Parser Server
+Minimalistic design with 91% accuracy
+"""
+
+from flask import Flask, request, jsonify, render_template_string, g
+from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.utils import secure_filename
+import os
+import threading
+import time
+import uuid
+import hmac
+import logging
+from fixed_resume_parser import FixedResumeParser
+from extraction_cache import ExtractionCache
+from fixed_server import (EXTRACTOR_VERSION, UploadedFile, extraction_failed, get_flag, get_max_skills,
+                          metrics_response, parse_failure, timed_json_response, track_parse_request)
+from parse_cache import ParseCache, file_digest
+from parse_metrics import CACHE_STATS, REQUEST_STATS, StageTimer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+app = Flask(__name__)
+CORS(app)
+
+UPLOAD_FOLDER = 'uploads'
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
+
+# Poll interval for the skills taxonomy file (0 disables the watcher)
+TAXONOMY_WATCH_INTERVAL = float(os.environ.get('TAXONOMY_WATCH_INTERVAL', '5'))
+# Admin endpoints require a matching X-Admin-Token header and are disabled while it is unset
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+# Memory budget of the parse result cache (0 disables it) and optional SQLite file for a persistent tier
+PARSE_CACHE_SIZE_MB = float(os.environ.get('PARSE_CACHE_SIZE_MB', '64'))
+PARSE_CACHE_DB = os.environ.get('PARSE_CACHE_DB')
+# Optional SQLite file of the extracted text cache, kept across restarts and parser upgrades
+EXTRACTION_CACHE_DB = os.environ.get('EXTRACTION_CACHE_DB')
+
+os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+parser = FixedResumeParser()
+_taxonomy_reload_lock = threading.Lock()
+parse_cache = ParseCache(int(PARSE_CACHE_SIZE_MB * 1024 * 1024), PARSE_CACHE_DB)
+CACHE_STATS.register('parse_result', lambda: (parse_cache.memory_hits + parse_cache.disk_hits, parse_cache.misses))
+
+def parse_cache_version(taxonomy):
+    """Version of cached parse results: the extractor plus the parser with the given taxonomy"""
+    return f"{EXTRACTOR_VERSION}/{parser.version_for(taxonomy)}"
+
+def purge_parse_cache():
+    """Drop stored parse results of other parser, taxonomy or extractor versions"""
+    removed = parse_cache.purge(parse_cache_version(parser.skill_taxonomy))
+    if removed:
+        logger.info(f"Dropped {removed} cached parse results from older versions")
+
+purge_parse_cache()
+extraction_cache = ExtractionCache(EXTRACTION_CACHE_DB) if EXTRACTION_CACHE_DB else None
+if extraction_cache:
+    # Texts from older extractor versions can never be hit again
+    stale_extractions = extraction_cache.purge(EXTRACTOR_VERSION)
+    if stale_extractions:
+        logger.info(f"Dropped {stale_extractions} cached extractions from older extractor versions")
+    CACHE_STATS.register('extracted_text', lambda: (extraction_cache.hits, extraction_cache.misses))
+
+def reload_taxonomy():
+    """Recompile the taxonomy file and swap it into the shared parser"""
+    # Requests already parsing finish on the taxonomy they started with
+    with _taxonomy_reload_lock:
+        taxonomy = parser.reload_taxonomy()
+        # Results of parses still running on the old taxonomy are dropped at the next purge
+        purge_parse_cache()
+        return taxonomy
+
+def _taxonomy_file_state(path):
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None
+
+def watch_taxonomy_file(interval):
+    """Poll the taxonomy file and hot-reload it whenever it changes"""
+    last_state = _taxonomy_file_state(parser.taxonomy_path)
+    while True:
+        time.sleep(interval)
+        state = _taxonomy_file_state(parser.taxonomy_path)
+        if state is None or state == last_state:
+            continue
+        last_state = state
+        try:
+            reload_taxonomy()
+        except Exception as e:
+            logger.error(f"Taxonomy reload failed, keeping version {parser.skill_taxonomy.version[:12]}: {str(e)}")
+
+if parser.taxonomy_path and TAXONOMY_WATCH_INTERVAL > 0:
+    threading.Thread(target=watch_taxonomy_file, args=(TAXONOMY_WATCH_INTERVAL,),
+                     name='taxonomy-watcher', daemon=True).start()
+
+def admin_authorized():
+    """True when ADMIN_TOKEN is configured and the request carries it"""
+    if not ADMIN_TOKEN:
+        return False
+    token = request.headers.get('X-Admin-Token', '')
+    return hmac.compare_digest(token.encode('utf-8'), ADMIN_TOKEN.encode('utf-8'))
+
+def generate_transaction_id():
+    return str(uuid.uuid4())[:8]
+
+HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Resume Parser</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', sans-serif;
+            background: #f5f5f7; min-height: 100vh; color: #1d1d1f;
+        }
+        .container {
+            max-width: 520px; margin: 80px auto; padding: 0 24px;
+        }
+        h1 {
+            font-size: 2.5rem; font-weight: 700; text-align: center;
+            margin-bottom: 8px; letter-spacing: -0.03em;
+        }
+        .subtitle {
+            text-align: center; color: #86868b; margin-bottom: 48px;
+            font-size: 1.1rem; font-weight: 400;
+        }
+        .upload-area {
+            background: white; border: 2px dashed #d1d1d6;
+            border-radius: 12px; padding: 48px 32px; text-align: center;
+            transition: all 0.2s ease; cursor: pointer; margin-bottom: 32px;
+        }
+        .upload-area:hover { border-color: #007aff; }
+        .upload-area.dragover { border-color: #007aff; background: #f0f8ff; }
+        .upload-icon {
+            width: 48px; height: 48px; margin: 0 auto 16px;
+            background: #f0f8ff; border-radius: 50%;
+            display: flex; align-items: center; justify-content: center;
+        }
+        #fileInput { display: none; }
+        .upload-text {
+            font-size: 1.1rem; font-weight: 500; margin-bottom: 4px;
+        }
+        .upload-subtext { color: #86868b; font-size: 0.95rem; }
+        .upload-btn {
+            background: #007aff; color: white; border: none;
+            padding: 12px 24px; border-radius: 8px; font-size: 1rem;
+            font-weight: 500; cursor: pointer; margin-top: 16px;
+            transition: background 0.2s ease;
+        }
+        .upload-btn:hover { background: #0056cc; }
+        .loading {
+            display: none; text-align: center; margin: 32px 0;
+        }
+        .spinner {
+            border: 2px solid #f0f0f0; border-top: 2px solid #007aff;
+            border-radius: 50%; width: 24px; height: 24px;
+            animation: spin 1s linear infinite; margin: 0 auto 12px;
+        }
+        @keyframes spin { 0% { transform: rotate(0deg); } 100% { transform: rotate(360deg); } }
+        .results { margin-top: 32px; display: none; }
+        .result-section {
+            background: white; border-radius: 8px; padding: 20px;
+            margin-bottom: 16px; border: 1px solid #e5e5e7;
+        }
+        .result-title {
+            font-weight: 600; margin-bottom: 12px; color: #1d1d1f;
+            font-size: 1.1rem;
+        }
+        .result-item { margin-bottom: 8px; color: #424245; }
+        .result-item strong { color: #1d1d1f; }
+        .json-output {
+            background: #1d1d1f; color: #ffffff; padding: 16px;
+            border-radius: 8px; font-family: 'SF Mono', monospace;
+            font-size: 0.85rem; max-height: 300px; overflow-y: auto;
+            white-space: pre-wrap; margin-top: 16px;
+        }
+        .error {
+            background: #ffeaea; border: 1px solid #ff6b6b;
+            color: #d63031; padding: 12px; border-radius: 8px;
+            margin: 16px 0; display: none;
+        }
+        .stats {
+            display: grid; grid-template-columns: repeat(3, 1fr);
+            gap: 12px; margin: 24px 0;
+        }
+        .stat {
+            background: white; padding: 16px; border-radius: 8px;
+            text-align: center; border: 1px solid #e5e5e7;
+        }
+        .stat-number {
+            font-size: 1.4rem; font-weight: 700; color: #007aff;
+        }
+        .stat-label {
+            color: #86868b; font-size: 0.8rem; margin-top: 4px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>Resume Parser</h1>
+        <p class="subtitle">Parse resumes with 91% accuracy</p>
+
+        <div class="upload-area" onclick="document.getElementById('fileInput').click()">
+            <div class="upload-icon">
+                <svg width="24" height="24" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                    <path stroke-linecap="round" stroke-linejoin="round" stroke-width="1.5" d="M7 16a4 4 0 01-.88-7.903A5 5 0 1115.9 6L16 6a5 5 0 011 9.9M15 13l-3-3m0 0l-3 3m3-3v12"/>
+                </svg>
+            </div>
+            <div class="upload-text">Drop resume here or click to browse</div>
+            <div class="upload-subtext">PDF, DOC, DOCX, TXT (Max 10MB)</div>
+            <button class="upload-btn" type="button">Choose File</button>
+            <input type="file" id="fileInput" accept=".pdf,.doc,.docx,.txt">
+        </div>
+
+        <div class="error" id="errorDiv"></div>
+
+        <div class="loading" id="loadingDiv">
+            <div class="spinner"></div>
+            <p>Processing resume...</p>
+        </div>
+
+        <div class="results" id="resultsDiv">
+            <div class="stats" id="statsDiv"></div>
+            <div id="resultCards"></div>
+            <div class="json-output" id="jsonOutput"></div>
+        </div>
+    </div>
+
+    <script>
+        const uploadArea = document.querySelector('.upload-area');
+        const fileInput = document.getElementById('fileInput');
+        const loadingDiv = document.getElementById('loadingDiv');
+        const resultsDiv = document.getElementById('resultsDiv');
+        const errorDiv = document.getElementById('errorDiv');
+
+        uploadArea.addEventListener('dragover', (e) => {
+            e.preventDefault();
+            uploadArea.classList.add('dragover');
+        });
+
+        uploadArea.addEventListener('dragleave', () => {
+            uploadArea.classList.remove('dragover');
+        });
+
+        uploadArea.addEventListener('drop', (e) => {
+            e.preventDefault();
+            uploadArea.classList.remove('dragover');
+            const files = e.dataTransfer.files;
+            if (files.length > 0) {
+                processFile(files[0]);
+            }
+        });
+
+        fileInput.addEventListener('change', (e) => {
+            if (e.target.files.length > 0) {
+                processFile(e.target.files[0]);
+            }
+        });
+
+        function showError(message) {
+            errorDiv.textContent = message;
+            errorDiv.style.display = 'block';
+            loadingDiv.style.display = 'none';
+            resultsDiv.style.display = 'none';
+        }
+
+        function processFile(file) {
+            errorDiv.style.display = 'none';
+            resultsDiv.style.display = 'none';
+            loadingDiv.style.display = 'block';
+
+            const formData = new FormData();
+            formData.append('file', file);
+
+            fetch('/api/parse', {
+                method: 'POST',
+                body: formData
+            })
+            .then(response => response.json())
+            .then(data => {
+                loadingDiv.style.display = 'none';
+                if (data.success) {
+                    displayResults(data);
+                } else {
+                    showError(data.error || 'Failed to parse resume');
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                showError('Network error occurred');
+            });
+        }
+
+        function displayResults(data) {
+            const statsDiv = document.getElementById('statsDiv');
+            const resultCards = document.getElementById('resultCards');
+            const jsonOutput = document.getElementById('jsonOutput');
+
+            // Extract contact information from nested structure
+            const contactInfo = data.ContactInformation || {};
+            const candidateName = contactInfo.CandidateName?.FormattedName || 'Not found';
+            const email = contactInfo.EmailAddresses?.[0]?.Address || 'Not found';
+            const phone = contactInfo.Telephones?.[0]?.Raw || 'Not found';
+            const positions = data.EmploymentHistory?.Positions?.length || 0;
+            const skillsCount = data.Skills?.length || 0;
+
+            // Display stats
+            statsDiv.innerHTML = `
+                <div class="stat">
+                    <div class="stat-number">${skillsCount}</div>
+                    <div class="stat-label">Skills</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-number">${positions}</div>
+                    <div class="stat-label">Positions</div>
+                </div>
+                <div class="stat">
+                    <div class="stat-number">${Math.round((data.processing_time || 0) * 1000)}ms</div>
+                    <div class="stat-label">Processing</div>
+                </div>
+            `;
+
+            // Display parsed results
+            resultCards.innerHTML = `
+                <div class="result-section">
+                    <div class="result-title">Contact Information</div>
+                    <div class="result-item"><strong>Name:</strong> ${candidateName}</div>
+                    <div class="result-item"><strong>Email:</strong> ${email}</div>
+                    <div class="result-item"><strong>Phone:</strong> ${phone}</div>
+                </div>
+                <div class="result-section">
+                    <div class="result-title">Experience</div>
+                    <div class="result-item"><strong>Positions:</strong> ${positions}</div>
+                    <div class="result-item"><strong>Experience:</strong> ${data.experience_months || 0} months</div>
+                </div>
+            `;
+
+            // Display JSON
+            jsonOutput.textContent = JSON.stringify(data, null, 2);
+            resultsDiv.style.display = 'block';
+        }
+    </script>
+</body>
+</html>
+"""
+
+@app.route('/')
+def index():
+    return render_template_string(HTML_TEMPLATE)
+
+@app.route('/api/parse', methods=['POST'])
+@track_parse_request
+def parse_resume():
+    try:
+        if 'file' not in request.files:
+            return parse_failure('rejected', 'No file provided')
+
+        file = request.files['file']
+        if file.filename == '':
+            return parse_failure('rejected', 'No file selected')
+
+        start_time = time.time()
+        timer = StageTimer()
+        with UploadedFile(file) as upload:
+            # The upload's bytes, not its name, decide the format and extractor
+            g.file_format = upload.detect_format()
+            if g.file_format is None:
+                return parse_failure('rejected', 'File type not allowed')
+            digest = file_digest(upload.contents)
+            timer.lap('upload')
+            max_skills = get_max_skills(request.values)
+            trace = get_flag(request.values, 'trace')
+
+            # One taxonomy snapshot for both the key and the parse, even across a reload
+            taxonomy = parser.skill_taxonomy
+            version = parse_cache_version(taxonomy)
+
+            # Same bytes, extractor, options and parser version give the same result;
+            # traced requests always parse, since the trace describes that parse
+            cache_key = None
+            if not (parser.trace_enabled if trace is None else trace):
+                cache_key = ParseCache.key(digest, version, g.file_format, max_skills, file.filename)
+            result = parse_cache.get(cache_key) if cache_key else None
+            timer.lap('cache_lookup')
+
+            if result is None:
+                # Extracted text only depends on the bytes, so it outlives parser and taxonomy changes
+                text = extraction_cache.get(digest, EXTRACTOR_VERSION, g.file_format) if extraction_cache else None
+                if text is None:
+                    text = upload.extract_text(g.file_format)
+                    # Failures are never parsed, so neither cache ever holds one
+                    if extraction_failed(text):
+                        return parse_failure('extraction_failed', 'Could not extract text from file')
+                    if extraction_cache:
+                        extraction_cache.put(digest, EXTRACTOR_VERSION, g.file_format, text)
+                timer.lap('file_extraction')
+
+        if result is None:
+            # Parse resume (a temporary copy of the upload is already removed)
+            result = parser.parse_resume(text, file.filename, max_skills=max_skills, trace=trace, timings=True,
+                                         taxonomy=taxonomy)
+            timer.merge(result.pop('Timings'))
+            if cache_key:
+                parse_cache.put(cache_key, result, version)
+
+        # Add metadata
+        result['success'] = True
+        result['textkernel_format'] = True
+        result['file_format'] = g.file_format
+        result['processing_time'] = time.time() - start_time
+        result['transaction_id'] = generate_transaction_id()
+
+        return timed_json_response(result, timer, get_flag(request.values, 'timings'))
+
+    except RequestEntityTooLarge:
+        return parse_failure('rejected', f'File too large (limit {MAX_FILE_SIZE // (1024 * 1024)}MB)'), 413
+    except Exception as e:
+        logger.error(f"Error parsing resume: {str(e)}")
+        return parse_failure('error', f'Processing error: {str(e)}')
+
+@app.route('/api/health')
+def health():
+    return jsonify({'status': 'healthy', 'accuracy': '91%', 'taxonomy_version': parser.skill_taxonomy.version[:12],
+                    'in_flight': REQUEST_STATS.in_flight, 'parse_cache': parse_cache.stats(),
+                    'extraction_cache': extraction_cache.stats() if extraction_cache else None})
+
+@app.route('/metrics')
+def metrics():
+    return metrics_response()
+
+@app.route('/api/admin/reload-taxonomy', methods=['POST'])
+def reload_taxonomy_endpoint():
+    if not admin_authorized():
+        return jsonify({'success': False, 'error': 'Forbidden'}), 403
+
+    try:
+        taxonomy = reload_taxonomy()
+        return jsonify({'success': True, 'skills': len(taxonomy), 'taxonomy_version': taxonomy.version[:12]})
+    except Exception as e:
+        logger.error(f"Taxonomy reload failed: {str(e)}")
+        return jsonify({'success': False, 'error': f'Reload error: {str(e)}'})
+
+if __name__ == '__main__':
+    print("🎯 CLEAN RESUME PARSER SERVER")
+    print("=" * 50)
+    print("🚀 Server Status: PRODUCTION READY")
+    print("📊 Accuracy Score: 91%")
+    print("⚡ Processing Speed: < 100ms average")
+    print("=" * 50)
+    print("🌐 Web Interface: http://localhost:8001")
+    print("🔗 API Endpoint: http://localhost:8001/api/parse")
+    print("❤️  Health Check: http://localhost:8001/api/health")
+    print("📈 Metrics: http://localhost:8001/metrics")
+    print("📚 Taxonomy Reload: POST http://localhost:8001/api/admin/reload-taxonomy")
+    print("=" * 50)
+    print("✅ Ready to process resumes!")
+
     app.run(host='0.0.0.0', port=8001, debug=False)
\ No newline at end of file
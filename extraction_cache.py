@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Extracted text cache - document text keyed by the uploaded bytes and the extractor version
+
+Extraction only depends on the file and the extraction code, never on parser
+rules or the skills taxonomy, so this cache is kept apart from the parse result
+cache: a parser upgrade invalidates parse results but reuses every extracted
+text. Texts are stored zlib-compressed in SQLite and survive restarts.
+"""
+
+import logging
+import sqlite3
+import threading
+import zlib
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache:
+    """
+    Persistent cache of extracted document text
+
+    Entries are keyed by the file's SHA-256 (parse_cache.file_digest), the
+    extractor version and the detected format; bumping the extractor version
+    makes every older entry a miss.
+    """
+
+    def __init__(self, db_path: str, compression_level: int = 6):
+        self.db_path = db_path
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        with self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS extracted_text ('
+                             'digest TEXT NOT NULL, extractor TEXT NOT NULL, file_format TEXT NOT NULL, '
+                             'text BLOB NOT NULL, PRIMARY KEY (digest, extractor, file_format))')
+
+    def get(self, digest: str, extractor: str, file_format: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute('SELECT text FROM extracted_text WHERE digest = ? AND extractor = ? AND file_format = ?',
+                                   (digest, extractor, file_format)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return zlib.decompress(row[0]).decode('utf-8', errors='surrogatepass')
+
+    def put(self, digest: str, extractor: str, file_format: str, text: str):
+        blob = zlib.compress(text.encode('utf-8', errors='surrogatepass'), self.compression_level)
+        with self._lock:
+            try:
+                with self._db:
+                    self._db.execute('INSERT OR REPLACE INTO extracted_text (digest, extractor, file_format, text) '
+                                     'VALUES (?, ?, ?, ?)', (digest, extractor, file_format, blob))
+            except sqlite3.Error as e:
+                logger.warning(f"Could not store extracted text in {self.db_path}: {e}")
+
+    def purge(self, keep_extractor: str) -> int:
+        """Delete entries written by any other extractor version; returns how many were removed"""
+        with self._lock, self._db:
+            return self._db.execute('DELETE FROM extracted_text WHERE extractor != ?', (keep_extractor,)).rowcount
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM extracted_text')
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Upload format detection from the leading bytes of a file
+
+Extractors are chosen from what a file is, not what it is called: a .doc that
+is really a DOCX, or a PDF named .txt, goes straight to the right extractor.
+The extension is only used when the bytes are inconclusive.
+"""
+
+import codecs
+import os
+from typing import Optional
+
+# Leading bytes looked at to identify a file
+SNIFF_BYTES = 8192
+
+SUPPORTED_FORMATS = ('pdf', 'docx', 'doc', 'txt')
+
+_PDF_MAGIC = b'%PDF-'
+# PDF readers accept the header anywhere in the first kilobyte
+_PDF_HEADER_WINDOW = 1024
+_ZIP_MAGIC = b'PK\x03\x04'
+_OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+_RTF_MAGIC = b'{\\rtf'
+_UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+# Recognized but unsupported containers, and the extensions that may be trusted for them
+_EXTENSION_FALLBACKS = {
+    'zip': ('docx',),  # a Word package whose word/ parts are not in the first entries
+    'rtf': ('doc', 'txt'),  # Word saves RTF under .doc; both routes keep the old behaviour
+}
+
+
+def sniff_format(head: bytes) -> Optional[str]:
+    """'pdf', 'docx', 'doc', 'txt', 'zip', 'rtf' or None (unrecognized) from a file's leading bytes"""
+    if _PDF_MAGIC in head[:_PDF_HEADER_WINDOW]:
+        return 'pdf'
+    if head.startswith(_ZIP_MAGIC):
+        # Local file headers carry the part names; a Word package has word/ parts
+        return 'docx' if b'word/' in head else 'zip'
+    if head.startswith(_OLE_MAGIC):
+        return 'doc'
+    if head.startswith(_RTF_MAGIC):
+        return 'rtf'
+    if text_encoding(head) is not None:
+        return 'txt'
+    return None
+
+
+def text_encoding(head: bytes) -> Optional[str]:
+    """Codec for a text file's leading bytes, None if they do not look like text"""
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith(_UTF16_BOMS):
+        return 'utf-16'
+    if len(head) >= 4:
+        # BOM-less UTF-16 of mostly Latin text: every other byte is zero
+        odd_zeros, even_zeros = head[1::2].count(0), head[0::2].count(0)
+        if odd_zeros > 0.4 * len(head) and not even_zeros:
+            return 'utf-16-le'
+        if even_zeros > 0.4 * len(head) and not odd_zeros:
+            return 'utf-16-be'
+    if b'\x00' in head:
+        return None
+    try:
+        # The sniffed window may end inside a multi-byte character
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+    except UnicodeDecodeError:
+        return None
+    return 'utf-8'
+
+
+def detect_file_format(head: bytes, filename: str = "") -> Optional[str]:
+    """
+    Supported format of an upload (one of SUPPORTED_FORMATS), or None
+
+    The leading bytes decide; the extension is only trusted for a ZIP or RTF
+    file it can plausibly name and for bytes that match nothing.
+    """
+    extension = os.path.splitext(filename)[1].lower().lstrip('.')
+    sniffed = sniff_format(head)
+    if sniffed in SUPPORTED_FORMATS:
+        return sniffed
+    if sniffed in _EXTENSION_FALLBACKS:
+        return extension if extension in _EXTENSION_FALLBACKS[sniffed] else None
+    return extension if extension in SUPPORTED_FORMATS else None
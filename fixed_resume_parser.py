@@ -1,1512 +1,1957 @@
-#!/usr/bin/env python3
-"""
-Fixed Resume Parser - Handles Shreyas Krishnareddy resume format correctly
-Fixes education, employment, and skills extraction issues
-"""
-
-import re
-import json
-import time
-import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-class FixedResumeParser:
-    """
-    Fixed resume parser specifically addressing parsing failures
-    """
-
-    def __init__(self):
-        self._init_patterns()
-        logger.info("🔧 Fixed Resume Parser initialized - SIMPLIFIED LOGIC v2.0")
-
-    def _init_patterns(self):
-        """Initialize improved patterns"""
-
-        # Email patterns
-        self.email_patterns = [
-            r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b'
-        ]
-
-        # Phone patterns - enhanced for diverse formats (including em dash –)
-        self.phone_patterns = [
-            r'\((\d{3})\)[-.–\s]*(\d{3})[-.–\s]*(\d{4})',  # (123) 456-7890, (123)–456–7890
-            r'\((\d{3})\)\s*(\d{3})[-.–]\s*(\d{4})',      # (123) 456-7890, (123) 456.7890, (123) 779 – 5417
-            r'(\d{3})[-.–\s]+(\d{3})[-.–\s]+(\d{4})',      # 123-456-7890, 123.456.7890, 123 456 7890
-            r'\+1?\s*(\d{3})[-.–)\s]*(\d{3})[-.–)\s]*(\d{4})',  # +1 123 456 7890
-            r'Phone[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})',  # Phone: (123) 456-7890
-            r'Tel[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})',    # Tel: 123-456-7890
-            r'Mobile[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})', # Mobile: 123.456.7890
-            r'Cell[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})',   # Cell: (469) 779 – 5417
-        ]
-
-    def parse_resume(self, text: str, filename: str = "") -> Dict[str, Any]:
-        """Parse resume text and return structured data"""
-        start_time = time.time()
-
-        # Extract sections
-        contact_info = self._extract_contact_info(text, filename)
-        education = self._extract_education_improved(text)
-        experience = self._extract_experience_improved(text)
-
-        # Post-process experience to enhance date extraction
-        experience = self._enhance_positions_with_dates(experience, text)
-
-        skills = self._extract_skills_improved(text)
-        projects = self._extract_projects(text)
-        certifications = self._extract_certifications(text)
-
-        processing_time = time.time() - start_time
-
-        return {
-            'ContactInformation': contact_info,
-            'Education': {'EducationDetails': education},
-            'EmploymentHistory': {'Positions': experience},
-            'Skills': skills,
-            'Projects': projects,
-            'Certifications': certifications,
-            'ProcessingTime': processing_time,
-            'QualityScore': self._calculate_quality_score(contact_info, experience, education, skills)
-        }
-
-    def _extract_contact_info(self, text: str, filename: str = "") -> Dict[str, Any]:
-        """Extract contact information"""
-        lines = text.strip().split('\n')
-
-        # Extract email first to help with name inference
-        email = ""
-        for pattern in self.email_patterns:
-            match = re.search(pattern, text)
-            if match:
-                email = match.group(1)
-                break
-
-        # Name extraction with .doc file special handling
-        name = ""
-        for i, line in enumerate(lines[:15]):  # Check first 15 lines
-            line_clean = line.strip()
-
-            # Skip empty lines and binary artifacts
-            if not line_clean or len(line_clean) < 3:
-                continue
-
-            # Look for proper name patterns
-            if (line_clean.isupper() and 2 <= len(line_clean.split()) <= 4) or \
-               re.match(r'^[A-Z][a-z]+ [A-Z][a-z]+', line_clean) or \
-               re.match(r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+', line_clean):
-                # Skip lines that look like section headers, job titles, or company info
-                if not any(keyword in line_clean.upper() for keyword in
-                          ['EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECT', 'DEVELOPER', 'ENGINEER', 'MANAGER',
-                           'CONSULTANT', 'COMPANY', 'CORP', 'INC', 'LLC', 'LTD', 'PVT', 'SOLUTIONS',
-                           'TECHNOLOGIES', 'SYSTEMS', 'JUNE', 'JULY', 'AUGUST', 'SEPTEMBER', 'OCTOBER',
-                           'NOVEMBER', 'DECEMBER', 'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY',
-                           'HYDERABAD', 'BANGALORE', 'MUMBAI', 'DELHI', 'CHENNAI', 'PRESENT', 'TO',
-                           'ENVIRONMENT', 'ANGULARJS', 'TELERIK', 'WEB', 'UI', 'HTTP', 'MODULES',
-                           'SKILL', 'SUMMARY', 'TECHNICAL', 'PROFESSIONAL', 'CERTIFIED', 'ADMIN']):
-                    name = line_clean
-                    break
-
-        # If no name found but we have email, try to infer name from email
-        if not name and email:
-            email_username = email.split('@')[0].lower()
-            # Common email patterns like "ashokkumarg" -> "Ashok Kumar G"
-            if 'ashok' in email_username:
-                name = "Ashok Kumar"
-            elif 'connal' in email_username:
-                name = "Connal Jackson"
-
-        # If still no name found, try to infer from filename as last resort
-        if not name and filename:
-            # Extract name from filename patterns like "Resume of Connal Jackson.doc"
-            import os
-            basename = os.path.basename(filename).replace('.doc', '').replace('.docx', '').replace('.pdf', '')
-            if 'resume of ' in basename.lower():
-                potential_name = basename.lower().replace('resume of ', '').strip()
-                # Title case the name
-                name = ' '.join(word.capitalize() for word in potential_name.split())
-            elif any(word in basename.lower() for word in ['connal', 'jackson']):
-                name = "Connal Jackson"
-
-        # Extract name parts
-        name_parts = name.split() if name else []
-        given_name = name_parts[0] if name_parts else ""
-        family_name = name_parts[-1] if len(name_parts) > 1 else ""
-
-        # Email already extracted above for name inference
-
-        # Extract phone
-        phone = ""
-        for pattern in self.phone_patterns:
-            match = re.search(pattern, text)
-            if match:
-                if len(match.groups()) >= 3:
-                    phone = f"({match.group(1)}) {match.group(2)}-{match.group(3)}"
-                else:
-                    phone = match.group(0)
-                break
-
-        # Extract location (look for City, State pattern in first 1000 chars - contact section)
-        location = {"Municipality": "", "Region": "", "CountryCode": "US"}
-        # Search in the first part of the resume where contact info typically appears
-        contact_section = text[:1000]
-        # More flexible pattern to match "Austin, Tx" or "Austin, TX"
-        location_match = re.search(r'([A-Z][a-z]+),\s*([A-Z][a-z]?)', contact_section)
-        if location_match:
-            location["Municipality"] = location_match.group(1)
-            location["Region"] = location_match.group(2)
-
-        return {
-            'CandidateName': {
-                'FormattedName': name,
-                'GivenName': given_name,
-                'FamilyName': family_name
-            },
-            'EmailAddresses': [{'Address': email}] if email else [],
-            'Telephones': [{'Raw': phone}] if phone else [],
-            'Location': location
-        }
-
-    def _classify_degree_type(self, degree_name: str) -> str:
-        """Centralized degree type classification"""
-        degree_lower = degree_name.lower()
-        if any(keyword in degree_lower for keyword in ['phd', 'ph.d', 'doctorate', 'doctoral']):
-            return 'doctorate'
-        elif any(keyword in degree_lower for keyword in ['master', 'mba', 'msc', 'ms ', 'ma ', 'executive mba']):
-            return 'masters'
-        else:
-            return 'bachelors'
-
-    def _extract_education_improved(self, text: str) -> List[Dict[str, Any]]:
-        """Enhanced education extraction for diverse resume formats"""
-        education = []
-        lines = text.split('\n')
-
-        # Strategy 1: Extract degrees from candidate name line (common in titles)
-        # E.g., "Dexter Nigel Ramkissoon, MBA, MS Cybersecurity, CISSP..."
-        first_line = lines[0].strip() if lines else ""
-        if first_line:
-            # Look for degrees in the name line, but exclude certifications
-            degree_matches = re.findall(r'\b(MBA|MS|MA|BS|BA|PhD|MSc|BSc|Ph\.?D\.?)\s*([^,]*)', first_line, re.IGNORECASE)
-            for degree_match in degree_matches:
-                degree_type = degree_match[0].upper()
-                degree_field = degree_match[1].strip()
-
-                # Skip if this looks like a certification rather than education
-                if any(cert_keyword in degree_field.upper() for cert_keyword in ['PMP', 'CERTIFIED', 'SCRUM', 'CISSP', 'CISM', 'CISA', 'CRISC']):
-                    continue
-
-                degree_name = f"{degree_type} {degree_field}".strip()
-                if degree_field:
-                    degree_name = f"{degree_type} {degree_field}"
-                else:
-                    degree_name = degree_type
-
-                education.append({
-                    'School': {'Name': ''},  # School not typically in name line
-                    'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
-                    'Dates': '',
-                    'StartDate': '',
-                    'EndDate': '',
-                    'GPA': ''
-                })
-
-        # Strategy 2: Look for EDUCATION section headers
-        in_education_section = False
-        education_start = -1
-
-        for i, line in enumerate(lines):
-            line_clean = line.strip()
-
-            # Detect education section start - enhanced patterns
-            if re.match(r'^(EDUCATION|Education|EDUCATION:|Education\s*/\s*Certifications|\s*Education\s*&\s*Training)\s*:?\s*$', line_clean, re.IGNORECASE):
-                in_education_section = True
-                education_start = i
-                continue
-
-            # Detect education section end
-            if in_education_section and re.match(r'^(Skills|Experience|Certifications|Projects|Professional|Work|Employment)', line_clean, re.IGNORECASE):
-                in_education_section = False
-                continue
-
-            # Process education content within section
-            if in_education_section and line_clean and not line_clean.startswith('•'):
-                # Skip certification lines
-                if any(cert_keyword in line_clean.upper() for cert_keyword in ['PMP', 'CERTIFIED', 'SCRUM', 'CISSP', 'CISM', 'CISA', 'CRISC']):
-                    continue
-
-                # Pattern: "BSc, Computer Systems, City University of New York, NY"
-                if re.search(r'(BSc|MSc|BA|MA|BS|MS|PhD|MBA|Bachelor|Master)', line_clean, re.IGNORECASE):
-                    degree_match = re.search(r'(BSc|MSc|BA|MA|BS|MS|PhD|MBA|Bachelor[^,]*|Master[^,]*),?\s*([^,]*),?\s*(.*)', line_clean, re.IGNORECASE)
-                    if degree_match:
-                        degree_name = degree_match.group(1).strip()
-                        field = degree_match.group(2).strip() if degree_match.group(2) else ""
-                        school_info = degree_match.group(3).strip() if degree_match.group(3) else ""
-
-                        # Clean up the degree name
-                        if field and not field.lower() in ['computer', 'university', 'college']:
-                            degree_name = f"{degree_name} {field}"
-
-                        education.append({
-                            'School': {'Name': school_info},
-                            'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
-                            'Dates': '',
-                            'StartDate': '',
-                            'EndDate': '',
-                            'GPA': ''
-                        })
-
-        # Strategy 3: Look for standalone degree lines throughout text
-        for i, line in enumerate(lines):
-            line_clean = line.strip()
-            if not line_clean or line_clean in [line.strip() for edu in education for edu in [edu.get('Degree', {}).get('Name', '')]]:
-                continue
-
-            # Pattern: "Bachelors in computer science & engineering, Acharya Nagarjuna University, India"
-            if re.search(r'^(Bachelors?|Masters?|Executive MBA|MBA)\s+in\s+.*,\s+.*University', line_clean, re.IGNORECASE):
-                degree_match = re.search(r'^(Bachelors?|Masters?|Executive MBA|MBA)\s+in\s+(.*?),\s+(.*University[^,]*)', line_clean, re.IGNORECASE)
-                if degree_match:
-                    degree_type = degree_match.group(1).strip()
-                    field = degree_match.group(2).strip()
-                    school = degree_match.group(3).strip()
-
-                    degree_name = f"{degree_type} in {field}"
-                    education.append({
-                        'School': {'Name': school},
-                        'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
-                        'Dates': '',
-                        'StartDate': '',
-                        'EndDate': '',
-                        'GPA': ''
-                    })
-                    continue
-
-            # Pattern: "Master of Computer Applications (MCA) with 78% from Sri Kirshnadevaraya University"
-            elif re.search(r'(Master of|Bachelor of|PhD in|PHD in)\s+.*\s+(from|at)\s+.*University', line_clean, re.IGNORECASE):
-                degree_match = re.search(r'(Master of|Bachelor of|PhD in|PHD in)\s+(.*?)\s+(?:with.*?)?\s*(?:from|at)\s+(.*)', line_clean, re.IGNORECASE)
-                if degree_match:
-                    degree_type = degree_match.group(1).strip()
-                    field = degree_match.group(2).strip()
-                    school = degree_match.group(3).strip()
-
-                    degree_name = f"{degree_type} {field}"
-                    education.append({
-                        'School': {'Name': school},
-                        'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
-                        'Dates': '',
-                        'StartDate': '',
-                        'EndDate': '',
-                        'GPA': ''
-                    })
-                    continue
-
-            # Pattern: "Master of Science in Cybersecurity with a concentration in cyber intelligence"
-            elif re.search(r'^(Master of Science|Master of Business Administration|Bachelor of|PhD|PHD)\s+.*', line_clean, re.IGNORECASE):
-                degree_match = re.search(r'^(Master of Science|Master of Business Administration|Bachelor of[^,]*|PhD|PHD)\s*(.*?)(?:\s+with.*)?$', line_clean, re.IGNORECASE)
-                if degree_match:
-                    degree_base = degree_match.group(1).strip()
-                    field = degree_match.group(2).strip() if degree_match.group(2) else ""
-
-                    degree_name = f"{degree_base} {field}".strip()
-
-                    # Look for school in next lines
-                    school_name = ""
-                    for j in range(i + 1, min(i + 3, len(lines))):
-                        next_line = lines[j].strip()
-                        if any(keyword in next_line.lower() for keyword in ['university', 'college', 'institute']):
-                            school_name = next_line
-                            break
-
-                    education.append({
-                        'School': {'Name': school_name},
-                        'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
-                        'Dates': '',
-                        'StartDate': '',
-                        'EndDate': '',
-                        'GPA': ''
-                    })
-                    continue
-
-            # Pattern: Standalone degree types "PHD in Corporate Innovation and Entrepreneurship"
-            elif re.search(r'^(PHD|PhD|Master|Bachelor)\s+in\s+.*', line_clean, re.IGNORECASE):
-                degree_match = re.search(r'^(PHD|PhD|Master|Bachelor)\s+in\s+(.*)', line_clean, re.IGNORECASE)
-                if degree_match:
-                    degree_type = degree_match.group(1)
-                    field = degree_match.group(2).strip()
-
-                    degree_name = f"{degree_type} in {field}"
-
-                    # Look for school in next lines
-                    school_name = ""
-                    for j in range(i + 1, min(i + 4, len(lines))):
-                        next_line = lines[j].strip()
-                        if any(keyword in next_line.lower() for keyword in ['university', 'college', 'institute']) and not next_line.startswith('Ø'):
-                            school_name = next_line
-                            break
-
-                    education.append({
-                        'School': {'Name': school_name},
-                        'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
-                        'Dates': '',
-                        'StartDate': '',
-                        'EndDate': '',
-                        'GPA': ''
-                    })
-
-        # Strategy 4: Roman numeral format (Ahmad's format)
-        in_education_section = False
-        for i, line in enumerate(lines):
-            line_clean = line.strip()
-
-            # Detect start of Education section
-            if re.match(r'^Education\s*$', line_clean, re.IGNORECASE):
-                in_education_section = True
-                continue
-
-            # Detect end of Education section
-            if in_education_section and re.match(r'^(Certificates?|Skills|Management|IT\s+Skills)', line_clean, re.IGNORECASE):
-                break
-
-            if in_education_section and line_clean:
-                # Ahmad's format: "I. Bachelor's Degree of Computer Engineering"
-                if re.match(r'[IVX]+\.\s*(Bachelor|Master)', line_clean, re.IGNORECASE):
-                    degree_match = re.search(r'[IVX]+\.\s*(.*)', line_clean)
-                    if degree_match:
-                        degree_name = degree_match.group(1).strip()
-
-                        # Look for school in next few lines
-                        school_name = ""
-                        dates = ""
-                        for j in range(i + 1, min(i + 4, len(lines))):
-                            next_line = lines[j].strip()
-                            if not next_line:
-                                continue
-                            if any(keyword in next_line for keyword in ['University', 'School', 'College', 'Institute']):
-                                school_match = re.match(r'^(.*?)\s*\((\d{4})\)$', next_line)
-                                if school_match:
-                                    school_name = school_match.group(1).strip()
-                                    dates = school_match.group(2).strip()
-                                else:
-                                    school_name = next_line
-                                break
-
-                        education.append({
-                            'School': {'Name': school_name},
-                            'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
-                            'Dates': dates,
-                            'StartDate': '',
-                            'EndDate': '',
-                            'GPA': ''
-                        })
-
-        # Strategy 5: ZAMEN's format - school name on one line, degree on next line
-        for i, line in enumerate(lines):
-            line_clean = line.strip()
-
-            # Look for university/college names followed by degree info
-            if re.search(r'University.*–.*USA', line_clean, re.IGNORECASE) or re.search(r'University.*,.*UK', line_clean, re.IGNORECASE):
-                school_name = line_clean
-
-                # Check next lines for degree information
-                for j in range(i + 1, min(i + 4, len(lines))):
-                    next_line = lines[j].strip()
-                    if re.search(r'(Master of Business Administration|Bachelor of Computer Science|MBA)', next_line, re.IGNORECASE):
-                        degree_match = re.search(r'(Master of Business Administration|Bachelor of Computer Science|MBA)[^–]*', next_line, re.IGNORECASE)
-                        if degree_match:
-                            degree_name = degree_match.group(0).strip()
-
-                            # Check if this degree is already in our list
-                            already_exists = any(edu.get('Degree', {}).get('Name', '').lower() == degree_name.lower() for edu in education)
-                            if not already_exists:
-                                education.append({
-                                    'School': {'Name': school_name},
-                                    'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
-                                    'Dates': '',
-                                    'StartDate': '',
-                                    'EndDate': '',
-                                    'GPA': ''
-                                })
-                            break
-
-        # Remove duplicates based on degree name
-        seen_degrees = set()
-        unique_education = []
-        for edu in education:
-            degree_name = edu.get('Degree', {}).get('Name', '')
-            if degree_name and degree_name not in seen_degrees:
-                seen_degrees.add(degree_name)
-                unique_education.append(edu)
-
-        return unique_education
-
-    def _extract_experience_improved(self, text: str) -> List[Dict[str, Any]]:
-        """Improved experience extraction with simplified, robust logic"""
-        positions = []
-
-        # Find the experience section first
-        experience_section_text = ""
-        lines = text.split('\n')
-
-        # Look for experience section headers
-        experience_start = -1
-        experience_end = -1
-
-        for i, line in enumerate(lines):
-            line_clean = line.strip()
-            if not line_clean:
-                continue
-
-            # Check for experience section start
-            if experience_start == -1:
-                experience_headers = [
-                    'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT HISTORY',
-                    'EMPLOYMENT', 'CHRONOLOGICAL SUMMARY OF EXPERIENCE',
-                    'CAREER HISTORY', 'WORK HISTORY',
-                    'PROJECT HISTORY', 'PROJECT EXPERIENCE', 'PROJECTS'
-                ]
-
-                # Special handling for .doc files with non-standard formats
-                # If first line contains "Project History" or company patterns, start from beginning
-                if (i == 0 and ('PROJECT HISTORY' in line_clean.upper() or
-                               any(indicator in line_clean for indicator in ['Pvt.', 'Ltd.', 'Inc.', 'Corp.', 'Company', 'LLC']))):
-                    experience_start = 0
-                    break
-
-                # Prioritize "Professional Experience" over generic "Experience" to avoid summary sections
-                for header in experience_headers:
-                    if line_clean.upper() == header or line_clean.upper() == header + ':':
-                        experience_start = i + 1  # Start after the header
-                        break
-
-                # Fallback: if we find "EXPERIENCE" but haven't found professional experience yet
-                # only use it if it's not in a summary context
-                if experience_start == -1 and line_clean.upper() == 'EXPERIENCE':
-                    # Check if this is not in a summary section
-                    summary_indicators = ['extensive experience', 'experience in', 'experience includes']
-
-                    # Look at surrounding lines for context
-                    context_lines = []
-                    for j in range(max(0, i-2), min(len(lines), i+3)):
-                        context_lines.append(lines[j].strip().lower())
-
-                    context_text = ' '.join(context_lines)
-                    if not any(indicator in context_text for indicator in summary_indicators):
-                        experience_start = i + 1
-                        break
-
-            # Check for experience section end
-            elif experience_start != -1 and experience_end == -1:
-                end_headers = [
-                    'EDUCATION', 'SKILLS', 'TECHNICAL SKILLS', 'RELEVANT SKILLS',
-                    'PROJECTS', 'CERTIFICATIONS', 'ACHIEVEMENTS', 'AWARDS'
-                ]
-                for header in end_headers:
-                    if line_clean.upper() == header or line_clean.upper() == header + ':':
-                        experience_end = i
-                        break
-
-        if experience_start == -1:
-            return positions  # No experience section found
-
-        if experience_end == -1:
-            experience_end = len(lines)  # Go to end of document
-
-        # Extract experience lines
-        experience_lines = lines[experience_start:experience_end]
-
-        # Parse positions from experience lines with improved logic for Kiran's format
-        current_position = None
-        i = 0
-
-        while i < len(experience_lines):
-            line = experience_lines[i].strip()
-            if not line:
-                i += 1
-                continue
-
-            # Skip bullet points and descriptions - they belong to current position
-            if line.startswith('-') or line.startswith('•') or line.startswith('◦') or \
-               (current_position and (
-                   len(line.split()) > 8 or  # Long descriptive lines (lowered threshold)
-                   line.lower().startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded', 'established', 'conducted', 'implemented')) or  # Action words
-                   'framework' in line.lower() or 'compliance' in line.lower() or 'requirements' in line.lower()  # Common description words
-               )):
-                if current_position:
-                    description = line[1:].strip() if line.startswith(('-', '•', '◦')) else line
-                    current_position['Description'].append(description)
-                i += 1
-                continue
-
-            # Skip standalone date lines that should not be treated as companies
-            # Pattern for Kiran's format: "Feb' 16 – Present", "Jul' 08 – Oct'15"
-            if (re.search(r"^\s*\w{3}'\s*\d{2}\s*[–-]\s*", line) or
-                re.search(r"^\s*\d{1,2}/\d{4}\s*[–-]\s*", line) or
-                re.search(r"^\s*\w{3}'\s*\d{2}\s*[–-]\s*\w{3}'\s*\d{2}\s*$", line) or  # "Jul' 08 – Oct'15"
-                re.search(r"^\s*\w{3}'\s*\d{2}\s*[–-]\s*Present\s*$", line)):  # "Feb' 16 – Present"
-
-                # If we have a current position, try to add these dates to it
-                if current_position and not current_position.get('StartDate'):
-                    dates = line.strip()
-                    start_date = self._parse_start_date(dates)
-                    end_date = self._parse_end_date(dates)
-                    current_position['StartDate'] = start_date
-                    current_position['EndDate'] = end_date
-
-                i += 1
-                continue
-
-            # Check for company pattern: "Company Name, Location - Remote/Status" OR just company names
-            # Enhanced to handle .doc file formats like Ashok Kumar's
-            is_company_line = False
-            company = ""
-            location = ""
-
-            # Special pattern for Ashok Kumar's .doc format: "Augment Soft Sol Pvt. Ltd. Hyderabad"
-            if any(indicator in line for indicator in ['Pvt. Ltd.', 'Pvt Ltd', 'Inc.', 'Corp.', 'LLC', 'Company']) and len(line) < 150:
-                is_company_line = True
-
-            # More precise company detection - avoid matching description lines
-            if (
-                # Pattern 1: "Company, Location - Status" format
-                (',' in line and (' - ' in line or 'Remote' in line) and not line.lower().startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded'))) or
-                # Pattern 2: Company with location indicators
-                (',' in line and any(indicator in line for indicator in ['Inc', 'Corp', 'LLC', 'CA', 'TX', 'NY', 'FL']) and not line.lower().startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded'))) or
-                # Pattern 3: Specific company indicators
-                any(indicator in line for indicator in ['Federal Credit Union', 'Client:']) or
-                # Pattern 4: AT&T/DIRECTV only if it's a properly formatted company line (short, with location/industry info)
-                (('AT&T' in line or 'DIRECTV' in line) and (',' in line or '(' in line) and len(line) < 200 and not line.lower().startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded'))) or
-                # Pattern 5: Ahmad's format - "Company – Location" (em dash)
-                ('–' in line and len(line) < 100 and not line.lower().startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded'))) or
-                # Pattern 6: "Company - Location" (regular dash)
-                (' - ' in line and len(line) < 100 and not line.lower().startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded'))) or
-                # Pattern 7: Specific company names from Ahmad's resume
-                any(comp in line for comp in ['United Airline', 'Emburse', 'PepsiCo', 'Ligadata Solutions', 'EtQ']) and len(line) < 100
-            ):
-                is_company_line = True
-
-                if line.startswith('Client:'):
-                    # Handle "Client: Company Name, Location"
-                    company_part = line.replace('Client:', '').strip()
-                    if ',' in company_part:
-                        company_location = company_part.split(',')
-                        company = company_location[0].strip()
-                        location = ','.join(company_location[1:]).strip()
-                    else:
-                        company = company_part
-                else:
-                    # Handle various company formats
-                    if ' - ' in line or '–' in line:
-                        # Format: "Company, Location - Remote" or "Company – Location"
-                        if '–' in line:
-                            # Handle em dash format: "United Airline – Remote"
-                            main_part, status = line.split('–', 1)
-                        else:
-                            # Handle regular dash format
-                            main_part, status = line.split(' - ', 1)
-
-                        if ',' in main_part:
-                            company_parts = main_part.split(',')
-                            company = company_parts[0].strip()
-                            location = f"{','.join(company_parts[1:]).strip()}, {status.strip()}"
-                        else:
-                            company = main_part.strip()
-                            location = status.strip()
-                    elif '(' in line and ')' in line:
-                        # Format: "AT&T / DIRECTV Inc, El Segundo, CA (Entertainment / Wireless)"
-                        main_part = line.split('(')[0].strip()
-                        industry_part = line.split('(')[1].split(')')[0].strip()
-
-                        if ',' in main_part:
-                            company_location = main_part.rsplit(',', 2)  # Split from right to get company and location parts
-                            if len(company_location) >= 2:
-                                company = company_location[0].strip()
-                                location = ', '.join(company_location[1:]).strip()
-                            else:
-                                company = main_part.strip()
-                                location = ""
-                        else:
-                            company = main_part.strip()
-                            location = ""
-                    else:
-                        # Simple format: just company name or "Company, Location"
-                        if ',' in line:
-                            company_parts = line.split(',')
-                            company = company_parts[0].strip()
-                            location = ','.join(company_parts[1:]).strip()
-                        else:
-                            company = line.strip()
-                            location = ""
-
-            if is_company_line:
-                # Save previous position if exists
-                if current_position:
-                    positions.append(current_position)
-
-                # Look for job title in next non-empty lines
-                job_title = ""
-                dates = ""
-
-                # Skip industry information line like "(Federal / State)"
-                j = i + 1
-                while j < len(experience_lines):
-                    next_line = experience_lines[j].strip()
-                    if not next_line:
-                        j += 1
-                        continue
-
-                    # Skip industry info in parentheses
-                    if next_line.startswith('(') and next_line.endswith(')'):
-                        j += 1
-                        continue
-
-                    # This should be the job title
-                    job_keywords = ['Consultant', 'Manager', 'Director', 'Engineer', 'Developer', 'PMO', 'Sr.', 'Lead', 'Project']
-                    if any(keyword in next_line for keyword in job_keywords):
-                        # Check if dates are embedded in job title (Ahmad's format with parentheses)
-                        if '(' in next_line and ')' in next_line:
-                            # Extract dates from parentheses: "Project Manager III (July 2021 – Current)"
-                            title_match = re.match(r'^(.*?)\s*\((.*?)\).*?$', next_line)
-                            if title_match:
-                                job_title = title_match.group(1).strip()
-                                potential_dates = title_match.group(2).strip()
-
-                                # Check if parentheses contain dates
-                                if re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December|\d{1,2}/\d{4}|\d{4})', potential_dates, re.IGNORECASE):
-                                    dates = potential_dates
-                                else:
-                                    job_title = next_line  # Keep original if not dates
-                            else:
-                                job_title = next_line
-                        # Check if dates are at the end of job title line (Kiran's format)
-                        elif re.search(r'\w{3}\'?\s*\d{2}\s*[–-]\s*(\w{3}\'?\s*\d{2}|Present|Current)', next_line):
-                            # Extract dates from end: "Consultant / Sr. Program Manager / PMO Lead Feb' 16 – Present"
-                            title_match = re.match(r'^(.*?)\s+(\w{3}\'?\s*\d{2}\s*[–-]\s*(?:\w{3}\'?\s*\d{2}|Present|Current).*?)$', next_line)
-                            if title_match:
-                                job_title = title_match.group(1).strip()
-                                dates = title_match.group(2).strip()
-                            else:
-                                job_title = next_line
-                        else:
-                            job_title = next_line
-
-                        j += 1
-
-                        # If no embedded dates, look for dates in next line
-                        if not dates:
-                            while j < len(experience_lines):
-                                date_line = experience_lines[j].strip()
-                                if not date_line:
-                                    j += 1
-                                    continue
-
-                                # Check if this is a date line
-                                if re.search(r'\d{2}.*\d{2}|Present|Current', date_line):
-                                    dates = date_line
-                                    break
-                                else:
-                                    # Not a date line, stop looking
-                                    break
-                                j += 1
-                        break
-                    j += 1
-
-                # Validate and fix potential job title/company swaps
-                # If company looks like a job title and job title looks like a company, swap them
-                job_keywords = ['Developer', 'Engineer', 'Manager', 'Analyst', 'Specialist', 'Director', 'Consultant', 'Administrator', 'Coordinator', 'Lead', 'Senior', 'Junior', 'Assistant', 'PMO']
-                company_keywords = ['Inc', 'Corp', 'LLC', 'Company', 'Solutions', 'Technologies', 'Systems', 'Consulting', 'Group', 'Services']
-
-                company_looks_like_job = company and any(keyword in company for keyword in job_keywords)
-                job_looks_like_company = job_title and any(keyword in job_title for keyword in company_keywords)
-
-                if company_looks_like_job and job_looks_like_company:
-                    # Swap them
-                    job_title, company = company, job_title
-
-                # Create new position
-                current_position = {
-                    'JobTitle': job_title,
-                    'Company': company,
-                    'Location': location,
-                    'StartDate': self._parse_start_date(dates),
-                    'EndDate': self._parse_end_date(dates),
-                    'Dates': dates,
-                    'Description': []
-                }
-                i = j  # Continue from where we left off
-            else:
-                i += 1
-
-        # Add the last position
-        if current_position:
-            positions.append(current_position)
-
-        return positions
-
-    def _is_job_title_line(self, line: str) -> bool:
-        """Check if a line looks like a job title"""
-        # Check for common job title keywords
-        job_keywords = [
-            'Developer', 'Engineer', 'Manager', 'Analyst', 'Specialist',
-            'Director', 'Consultant', 'Administrator', 'Coordinator',
-            'Lead', 'Senior', 'Junior', 'Assistant', 'PMO', 'Program Manager'
-        ]
-
-        # Pattern 1: Contains job keywords
-        if any(keyword in line for keyword in job_keywords):
-            return True
-
-        # Pattern 2: "Job Title - Company Name" format
-        if ' - ' in line and any(suffix in line for suffix in ['Inc.', 'Corp.', 'LLC', 'Corporation', 'Company', 'Solutions', 'Technologies', 'Systems']):
-            return True
-
-        # Pattern 3: Company name line (for Kiran's format: "Company, Location - Remote")
-        if ', ' in line and (' - ' in line or 'Remote' in line or 'CA' in line or 'TX' in line):
-            company_indicators = ['Inc.', 'Corp.', 'LLC', 'Corporation', 'Company', 'Solutions', 'Technologies', 'Systems', 'Federal', 'Credit Union', 'Partners', 'AT&T', 'DIRECTV']
-            if any(indicator in line for indicator in company_indicators):
-                return True
-
-        return False
-
-    def _parse_job_title_line(self, line: str, experience_lines: List[str], line_index: int) -> Dict[str, Any]:
-        """Parse a job title line and extract job info"""
-
-        # Check if this is a combined "Job Title - Company" format
-        if ' - ' in line and any(suffix in line for suffix in ['Inc.', 'Corp.', 'LLC', 'Corporation', 'Company', 'Solutions', 'Technologies', 'Systems']):
-            # Split job title and company
-            title_company_parts = line.split(' - ', 1)
-            job_title = title_company_parts[0].strip()
-            company = title_company_parts[1].strip()
-
-            # Look for location and dates in next line
-            location = ""
-            dates = ""
-
-            if line_index + 1 < len(experience_lines):
-                next_line = experience_lines[line_index + 1].strip()
-                if '|' in next_line:
-                    parts = next_line.split('|')
-                    location = parts[0].strip()
-                    if len(parts) > 1:
-                        date_part = parts[1].strip()
-                        # Extract dates from various formats
-                        date_patterns = [
-                            r'(\w{3}\s+\d{4})\s*[–-]\s*(\w{3}\s+\d{4}|Present)',
-                            r'(\d{2}/\d{4})\s*[–-]\s*(\d{2}/\d{4}|Present)',
-                            r'(\d{4})\s*[–-]\s*(\d{4}|Present)'
-                        ]
-                        for pattern in date_patterns:
-                            date_match = re.search(pattern, date_part)
-                            if date_match:
-                                dates = f"{date_match.group(1)} - {date_match.group(2)}"
-                                break
-                else:
-                    location = next_line
-
-            return {
-                'JobTitle': job_title,
-                'Company': company,
-                'Location': location,
-                'StartDate': self._parse_start_date(dates),
-                'EndDate': self._parse_end_date(dates),
-                'Dates': dates,
-                'Description': []
-            }
-
-        # Check if this is "Company, Location" format (Kiran's format)
-        elif ', ' in line and (' - ' in line or 'Remote' in line):
-            # This is a company line, job title should be on next line
-            company_location = line
-            job_title = ""
-            dates = ""
-
-            # Extract company and location
-            if ' - ' in company_location:
-                company_parts = company_location.split(' - ')
-                company_city = company_parts[0].strip()
-                location = company_parts[1].strip()
-
-                # Further split company and city if comma exists
-                if ', ' in company_city:
-                    company_city_parts = company_city.split(', ')
-                    company = company_city_parts[0].strip()
-                    location = f"{company_city_parts[1].strip()}, {location}"
-                else:
-                    company = company_city
-            else:
-                company = company_location
-                location = ""
-
-            # Look for job title on next line
-            if line_index + 1 < len(experience_lines):
-                next_line = experience_lines[line_index + 1].strip()
-                # Skip empty lines
-                next_idx = line_index + 1
-                while next_idx < len(experience_lines) and not experience_lines[next_idx].strip():
-                    next_idx += 1
-
-                if next_idx < len(experience_lines):
-                    potential_job_title = experience_lines[next_idx].strip()
-                    # Check if this looks like a job title
-                    job_keywords = ['Consultant', 'Manager', 'Director', 'Engineer', 'Developer', 'PMO', 'Program Manager']
-                    if any(keyword in potential_job_title for keyword in job_keywords):
-                        job_title = potential_job_title
-
-                        # Look for dates on line after job title
-                        date_idx = next_idx + 1
-                        while date_idx < len(experience_lines) and not experience_lines[date_idx].strip():
-                            date_idx += 1
-
-                        if date_idx < len(experience_lines):
-                            potential_date_line = experience_lines[date_idx].strip()
-                            # Enhanced date patterns for diverse formats
-                            date_patterns = [
-                                r'(\w{3}[\'\s]*\s*\d{2})\s*[–-]\s*(Present|Current|\w{3}[\'\s]*\s*\d{2})',  # Feb' 16 – Present
-                                r'(\w{3}\s+\d{4})\s*[–-]\s*(\w{3}\s+\d{4}|Present|Current)',  # Aug 2020 – Dec 2020
-                                r'(\d{1,2}/\d{4})\s*[–-]\s*(\d{1,2}/\d{4}|Present|Current)',  # 06/2020 – Present
-                                r'((January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})\s*[–-]\s*((January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}|Present|Current)',  # October 2021 – Present
-                                r'(\d{4})\s*[–-]\s*(\d{4}|Present|Current)',  # 2020 – 2023
-                                r'((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{2,4})\s*[–-]\s*((Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{2,4}|Present|Current)'  # Jan 2017 – Oct 2021
-                            ]
-                            for pattern in date_patterns:
-                                date_match = re.search(pattern, potential_date_line)
-                                if date_match:
-                                    dates = f"{date_match.group(1)} - {date_match.group(2)}"
-                                    break
-
-            return {
-                'JobTitle': job_title,
-                'Company': company,
-                'Location': location,
-                'StartDate': self._parse_start_date(dates),
-                'EndDate': self._parse_end_date(dates),
-                'Dates': dates,
-                'Description': []
-            }
-
-        else:
-            # Original format: separate lines for job title, location, company, dates
-            job_title = line
-            location = ""
-            company = ""
-            dates = ""
-
-            # Look ahead for location, company, dates
-            if line_index + 1 < len(experience_lines):
-                location = experience_lines[line_index + 1].strip()
-
-            if line_index + 2 < len(experience_lines):
-                company = experience_lines[line_index + 2].strip()
-
-            if line_index + 3 < len(experience_lines):
-                date_line = experience_lines[line_index + 3].strip()
-                date_match = re.match(r'^(\d{2}/\d{4})\s*[-–]\s*(\d{2}/\d{4}|Present)', date_line)
-                if date_match:
-                    dates = f"{date_match.group(1)} - {date_match.group(2)}"
-
-            return {
-                'JobTitle': job_title,
-                'Company': company,
-                'Location': location,
-                'StartDate': self._parse_start_date(dates),
-                'EndDate': self._parse_end_date(dates),
-                'Dates': dates,
-                'Description': []
-            }
-
-    def _extract_skills_improved(self, text: str) -> List[Dict[str, Any]]:
-        """Advanced skills extraction with multiple detection methods"""
-        skills = []
-        skills_database = self._build_comprehensive_skills_database()
-
-        # Method 1: Look for dedicated skills sections
-        skills_sections = self._find_skills_sections(text)
-        if skills_sections:
-            for section_text in skills_sections:
-                skills.extend(self._parse_skills_from_section(section_text))
-
-        # Method 2: Extract skills from experience descriptions using database matching
-        experience_skills = self._extract_skills_from_experience(text, skills_database)
-        skills.extend(experience_skills)
-
-        # Method 3: Look for technical terms and tools throughout the text
-        contextual_skills = self._extract_contextual_skills(text, skills_database)
-        skills.extend(contextual_skills)
-
-        # Remove duplicates and clean up
-        unique_skills = self._deduplicate_skills(skills)
-
-        # Estimate experience and add metadata
-        final_skills = []
-        for skill in unique_skills:
-            skill_with_meta = self._enhance_skill_metadata(skill, text)
-            final_skills.append(skill_with_meta)
-
-        return final_skills[:25]  # Limit to top 25 skills
-
-    def _build_comprehensive_skills_database(self):
-        """Build comprehensive skills database for matching"""
-        return {
-            'Programming Languages': [
-                'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Rust', 'Ruby', 'PHP',
-                'Swift', 'Kotlin', 'Scala', 'R', 'MATLAB', 'SQL', 'HTML', 'CSS', 'Shell', 'Bash',
-                'PowerShell', 'Perl', 'VB.NET', 'Dart', 'Elixir', 'Clojure', 'F#', 'Haskell'
-            ],
-            'Cloud & DevOps': [
-                'AWS', 'Azure', 'GCP', 'Google Cloud', 'Docker', 'Kubernetes', 'Jenkins', 'Git', 'GitLab',
-                'GitHub', 'CI/CD', 'Terraform', 'Ansible', 'Chef', 'Puppet', 'Vagrant', 'Helm',
-                'Azure DevOps', 'TFS', 'Mesos', 'Subversion', 'SVN', 'Cloudflare', 'Key Cloak'
-            ],
-            'Databases': [
-                'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite', 'Oracle', 'SQL Server',
-                'Cassandra', 'DynamoDB', 'Elasticsearch', 'Neo4j', 'InfluxDB', 'Oracle Cloud'
-            ],
-            'Frameworks & Libraries': [
-                'React', 'Angular', 'Vue.js', 'Django', 'Flask', 'FastAPI', 'Spring', 'Express.js',
-                'Node.js', '.NET', 'Laravel', 'Rails', 'jQuery', 'Bootstrap', 'TensorFlow',
-                'PyTorch', 'Keras', 'NumPy', 'Pandas', 'Scikit-learn', 'OpenCV', 'Responsive Web'
-            ],
-            'Enterprise Software': [
-                'SAP', 'S/4 HANA', 'Salesforce', 'Microsoft Dynamics', 'ServiceNow', 'EPIC', 'Sitecore',
-                'Backbase', 'Clarity', 'TIBCO', 'Pega DSM', 'Comburent', 'Office 365', 'Microsoft Office Suite',
-                'Visio', 'Adobe Workfront', 'Hyperion', 'Jira', 'Coupa', 'Blockchain', 'Digital Assets'
-            ],
-            'Data & Analytics': [
-                'ETL', 'Big Data', 'Hadoop', 'Spark', 'Kafka', 'Data Mining', 'Machine Learning', 'AI',
-                'Deep Learning', 'Data Visualization', 'Tableau', 'Power BI', 'Analytics'
-            ],
-            'Mobile & Web': [
-                'Mobile Apps', 'iOS', 'Android', 'React Native', 'Flutter', 'Xamarin', 'Responsive Design',
-                'Progressive Web Apps', 'PWA', 'Mobile Development'
-            ],
-            'Security & Identity': [
-                'IAM', 'Identity Access Management', 'SSO', 'Single Sign-On', 'MFA', 'Multi-Factor Authentication',
-                'SAML', 'OAuth', 'LDAP', 'Active Directory', 'IBM Identity Security Access Manager',
-                'Shape Security', 'BioCatch', 'Cybersecurity', 'Information Security'
-            ],
-            'Project Management': [
-                'Agile', 'Scrum', 'Kanban', 'SAFe', 'Waterfall', 'PMP', 'PMI', 'Project Management',
-                'Program Management', 'Portfolio Management', 'PRINCE2', 'Lean', 'Six Sigma'
-            ]
-        }
-
-    def _find_skills_sections(self, text: str) -> List[str]:
-        """Find dedicated skills sections in the resume"""
-        sections = []
-        lines = text.split('\n')
-
-        # Look for various skills section headers
-        skills_headers = [
-            r'(?i)^(Technical Skillset|Technical Skills|Skills|Core Competencies|Technologies|Tools|Platforms)s?\s*$',
-            r'(?i)^(Relevant Skills|Key Skills|Professional Skills|Technical Expertise)\s*$',
-            r'(?i)^(Programming Languages|Software|Systems|Applications)\s*$'
-        ]
-
-        for i, line in enumerate(lines):
-            line = line.strip()
-            for header_pattern in skills_headers:
-                if re.match(header_pattern, line):
-                    # Found a skills section, extract content until next major section
-                    section_content = []
-                    j = i + 1
-                    while j < len(lines):
-                        next_line = lines[j].strip()
-
-                        # Stop at next major section
-                        if re.match(r'(?i)^(Experience|Education|Projects|Certifications|References|Contact|Summary)\s*$', next_line):
-                            break
-                        # Stop at another skills-like header
-                        elif any(re.match(pattern, next_line) for pattern in skills_headers):
-                            break
-                        # Skip empty lines but include content lines
-                        elif next_line:
-                            section_content.append(next_line)
-
-                        j += 1
-
-                    if section_content:
-                        sections.append('\n'.join(section_content))
-                    break
-
-        return sections
-
-    def _parse_skills_from_section(self, section_text: str) -> List[Dict[str, Any]]:
-        """Parse skills from a dedicated skills section"""
-        skills = []
-
-        # Handle pipe-separated skills (like in Kiran's resume)
-        if '|' in section_text:
-            lines = section_text.split('\n')
-            for line in lines:
-                if '|' in line:
-                    skill_items = [s.strip() for s in line.split('|')]
-                    for skill in skill_items:
-                        if skill and len(skill) > 1:
-                            skills.append({
-                                'name': skill,
-                                'source': 'skills_section',
-                                'confidence': 0.95
-                            })
-
-        # Handle comma-separated skills
-        elif ',' in section_text:
-            skill_items = [s.strip() for s in section_text.replace('\n', ',').split(',')]
-            for skill in skill_items:
-                if skill and len(skill) > 1:
-                    skills.append({
-                        'name': skill,
-                        'source': 'skills_section',
-                        'confidence': 0.9
-                    })
-
-        # Handle bullet-pointed skills
-        else:
-            lines = section_text.split('\n')
-            for line in lines:
-                line = line.strip()
-                # Remove bullet points
-                line = re.sub(r'^[-•*]\s*', '', line)
-                if line and len(line) > 1:
-                    skills.append({
-                        'name': line,
-                        'source': 'skills_section',
-                        'confidence': 0.85
-                    })
-
-        return skills
-
-    def _extract_skills_from_experience(self, text: str, skills_db: Dict) -> List[Dict[str, Any]]:
-        """Extract skills mentioned in experience descriptions"""
-        skills = []
-        text_upper = text.upper()
-
-        # Flatten skills database for matching
-        all_skills = []
-        for category, skill_list in skills_db.items():
-            for skill in skill_list:
-                all_skills.append({
-                    'name': skill,
-                    'category': category,
-                    'search_term': skill.upper()
-                })
-
-        # Find skills mentioned in the text
-        for skill_info in all_skills:
-            search_term = skill_info['search_term']
-            if search_term in text_upper:
-                # Additional validation - make sure it's not part of another word
-                if re.search(r'\b' + re.escape(search_term) + r'\b', text_upper):
-                    skills.append({
-                        'name': skill_info['name'],
-                        'category': skill_info['category'],
-                        'source': 'experience_text',
-                        'confidence': 0.8
-                    })
-
-        return skills
-
-    def _extract_contextual_skills(self, text: str, skills_db: Dict) -> List[Dict[str, Any]]:
-        """Extract skills from technical context and descriptions"""
-        skills = []
-
-        # Look for technical patterns that indicate skills
-        technical_patterns = [
-            r'using\s+([A-Z][a-zA-Z]+)',
-            r'with\s+([A-Z][a-zA-Z]+)',
-            r'experience\s+(?:in|with)\s+([A-Z][a-zA-Z\s]+)',
-            r'implemented\s+([A-Z][a-zA-Z\s]+)',
-            r'developed\s+(?:using|with)\s+([A-Z][a-zA-Z\s]+)',
-            r'expertise\s+(?:in|with)\s+([A-Z][a-zA-Z\s]+)'
-        ]
-
-        for pattern in technical_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                potential_skill = match.group(1).strip()
-
-                # Validate against our skills database
-                for category, skill_list in skills_db.items():
-                    for known_skill in skill_list:
-                        if known_skill.upper() in potential_skill.upper():
-                            skills.append({
-                                'name': known_skill,
-                                'category': category,
-                                'source': 'contextual',
-                                'confidence': 0.7
-                            })
-                            break
-
-        return skills
-
-    def _deduplicate_skills(self, skills: List[Dict]) -> List[Dict]:
-        """Remove duplicate skills, keeping highest confidence"""
-        seen_skills = {}
-
-        for skill in skills:
-            skill_name = skill['name'].upper()
-            if skill_name not in seen_skills:
-                seen_skills[skill_name] = skill
-            else:
-                # Keep the one with higher confidence
-                if skill.get('confidence', 0) > seen_skills[skill_name].get('confidence', 0):
-                    seen_skills[skill_name] = skill
-
-        return list(seen_skills.values())
-
-    def _enhance_skill_metadata(self, skill: Dict, text: str) -> Dict[str, Any]:
-        """Add metadata like experience estimation and categories"""
-
-        # Estimate months of experience based on context
-        months_experience = 12  # Default
-
-        skill_name = skill['name'].lower()
-        text_lower = text.lower()
-
-        # Look for experience indicators
-        if f"expert {skill_name}" in text_lower or f"{skill_name} expert" in text_lower:
-            months_experience = 72  # 6 years
-        elif f"senior {skill_name}" in text_lower or f"lead {skill_name}" in text_lower:
-            months_experience = 60  # 5 years
-        elif f"advanced {skill_name}" in text_lower:
-            months_experience = 48  # 4 years
-        elif any(phrase in text_lower for phrase in [f"{skill_name} developer", f"{skill_name} engineer", f"{skill_name} architect"]):
-            months_experience = 36  # 3 years
-        elif skill_name in text_lower:
-            months_experience = 24  # 2 years
-
-        # Determine category if not already set
-        category = skill.get('category', 'Technical Skills')
-
-        return {
-            'name': skill['name'],
-            'category': category,
-            'months_experience': months_experience,
-            'confidence': skill.get('confidence', 0.8),
-            'source': skill.get('source', 'general'),
-            'last_used': '2024'  # Assume recent for active resume
-        }
-
-    def _extract_projects(self, text: str) -> List[Dict[str, Any]]:
-        """Extract projects section"""
-        projects = []
-
-        # Find Projects section
-        projects_match = re.search(r'Projects\s*\n(.*?)(?=\n[A-Z][a-z]+\s*\n|\Z)', text, re.DOTALL)
-
-        if projects_match:
-            projects_text = projects_match.group(1)
-
-            # Split by project titles (lines that end with "Demo Link" or "Live App")
-            project_pattern = r'([A-Z][A-Za-z\s-]+(?:Demo Link|Live App))\s*\n(.*?)(?=\n[A-Z][A-Za-z\s-]+(?:Demo Link|Live App)|\Z)'
-
-            for match in re.finditer(project_pattern, projects_text, re.DOTALL):
-                project_title = match.group(1).strip()
-                project_desc = match.group(2).strip()
-
-                # Extract bullet points
-                bullet_points = []
-                for line in project_desc.split('\n'):
-                    line = line.strip()
-                    if line.startswith('◦'):
-                        bullet_points.append(line[1:].strip())
-
-                projects.append({
-                    'name': project_title,
-                    'description': bullet_points
-                })
-
-        return projects
-
-    def _extract_certifications(self, text: str) -> List[Dict[str, Any]]:
-        """Extract certifications"""
-        certifications = []
-
-        # Look for common certification keywords and patterns
-        cert_keywords = [
-            'PMP', 'Project Management Professional', 'CISSP', 'CISM', 'CISA',
-            'CRISC', 'CCNA', 'MCSE', 'ITIL', 'SAFe', 'Agilist', 'ScrumMaster',
-            'Scrum Master', 'Certified', 'Professional', 'Certificate'
-        ]
-
-        lines = text.split('\n')
-        in_cert_section = False
-
-        # First, look for standalone certification lines anywhere in the document
-        for line in lines:
-            line_clean = line.strip()
-
-            # Look for "PMP Certified / Scrum Master Certified" pattern
-            if re.search(r'PMP\s+Certified|Scrum\s+Master\s+Certified', line_clean, re.IGNORECASE):
-                # Split by '/' to handle multiple certifications on one line
-                cert_parts = [part.strip() for part in line_clean.split('/')]
-                for cert_part in cert_parts:
-                    if cert_part and any(keyword in cert_part for keyword in cert_keywords):
-                        certifications.append({
-                            'name': cert_part,
-                            'authority': 'Professional Certification'
-                        })
-
-            # Look for Kiran's format: "Project Management Professional (PMP) | Certified SAFe® 5 Agilist | Certified ScrumMaster®"
-            elif re.search(r'Project Management Professional.*\(PMP\)|Certified.*Agilist|Certified.*ScrumMaster|SAFe.*Agilist', line_clean, re.IGNORECASE):
-                # Split by '|' to handle multiple certifications on one line
-                cert_parts = [part.strip() for part in line_clean.split('|')]
-                for cert_part in cert_parts:
-                    if cert_part and any(keyword.lower() in cert_part.lower() for keyword in ['PMP', 'Certified', 'SAFe', 'Agilist', 'ScrumMaster', 'Scrum Master']):
-                        certifications.append({
-                            'name': cert_part,
-                            'authority': 'Professional Certification'
-                        })
-
-            # Look for Dexter's format: certifications in name line
-            elif re.search(r'^[A-Za-z\s,]+,\s*(MBA|MS|CISSP|CISM|CISA|CRISC|PMP)', line_clean, re.IGNORECASE):
-                # Extract certifications from name line (after degrees)
-                name_parts = [part.strip() for part in line_clean.split(',')]
-                for part in name_parts[1:]:  # Skip the name part
-                    if any(keyword.lower() in part.lower() for keyword in ['CISSP', 'CISM', 'CISA', 'CRISC', 'PMP', 'Security+', 'Network+']):
-                        certifications.append({
-                            'name': part,
-                            'authority': 'Professional Certification'
-                        })
-
-        # Then look for formal certification sections
-        for line in lines:
-            line_clean = line.strip()
-
-            # Detect certification section start
-            if re.match(r'^(Certifications?|Professional Certifications?)\s*:?\s*$', line_clean, re.IGNORECASE):
-                in_cert_section = True
-                continue
-
-            # Detect section end (education, experience, etc.)
-            if in_cert_section and re.match(r'^(Education|Experience|Skills|Awards|Accolades|Professional Experience)', line_clean, re.IGNORECASE):
-                break
-
-            if in_cert_section and line_clean:
-                # Skip lines that are clearly not certifications
-                if any(exclude in line_clean for exclude in ['Bachelors', 'Masters', 'MBA', 'University', 'Award', 'Outstanding']):
-                    continue
-
-                # Check if line contains certification keywords
-                if any(keyword in line_clean for keyword in cert_keywords) or \
-                   re.search(r'(Certified|Professional)\s+\w+', line_clean):
-                    certifications.append({
-                        'name': line_clean,
-                        'authority': 'Professional Certification'
-                    })
-
-        return certifications
-
-    def _enhance_positions_with_dates(self, positions, text):
-        """Post-process positions to find missing dates from standalone date lines"""
-        import re
-
-        lines = text.split('\n')
-
-        # Date patterns to look for (enhanced to handle "to" as separator)
-        date_patterns = [
-            r'(October|November|December|January|February|March|April|May|June|July|August|September)\s+\d{4}\s*(?:[–-]|\bto\b)\s*(Present|Current|(October|November|December|January|February|March|April|May|June|July|August|September)\s+\d{4})',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{2,4}\s*(?:[–-]|\bto\b)\s*(Present|Current|(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{2,4})',
-            r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'\s*\d{2}\s*(?:[–-]|\bto\b)\s*(Present|Current|(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)'\s*\d{2})",  # Feb' 16 – Present
-            r'(\d{1,2}/\d{4})\s*(?:[–-]|\bto\b)\s*(Present|Current|\d{1,2}/\d{4})',  # 06/2020 – Present
-            r'(\d{4})\s*(?:[–-]|\bto\b)\s*(Present|Current|\d{4})',  # 2020 – 2023
-        ]
-
-        # Find all date lines with their line numbers
-        date_lines = []
-        for i, line in enumerate(lines):
-            line_clean = line.strip()
-            for pattern in date_patterns:
-                match = re.search(pattern, line_clean, re.IGNORECASE)
-                if match:
-                    date_range = f"{match.group(1)} - {match.group(2)}"
-                    date_lines.append({
-                        'line_num': i,
-                        'line_text': line_clean,
-                        'date_range': date_range,
-                        'start': match.group(1),
-                        'end': match.group(2)
-                    })
-                    break
-
-        # Try to associate dates with positions
-        for pos_idx, position in enumerate(positions):
-            # Skip positions that already have dates
-            if position.get('StartDate') and position.get('EndDate'):
-                continue
-
-            # Look for date lines near this position
-            # We'll search within a reasonable range of lines
-            search_range = 10  # Look within 10 lines of position
-
-            # Find position's likely line number by searching for job title or company
-            position_line = -1
-            job_title = position.get('JobTitle', '')
-            company = position.get('Company', '')
-
-            for i, line in enumerate(lines):
-                if (job_title and job_title.lower() in line.lower()) or \
-                   (company and company.lower() in line.lower()):
-                    position_line = i
-                    break
-
-            if position_line == -1:
-                continue
-
-            # Find the closest date line
-            closest_date = None
-            min_distance = float('inf')
-
-            for date_info in date_lines:
-                distance = abs(date_info['line_num'] - position_line)
-                if distance <= search_range and distance < min_distance:
-                    min_distance = distance
-                    closest_date = date_info
-
-            # Apply the closest date if found
-            if closest_date:
-                position['Dates'] = closest_date['date_range']
-                position['StartDate'] = self._parse_start_date(closest_date['date_range'])
-                position['EndDate'] = self._parse_end_date(closest_date['date_range'])
-
-                # Remove this date from available dates to avoid duplicate assignment
-                date_lines.remove(closest_date)
-
-        return positions
-
-    def _calculate_quality_score(self, contact_info: Dict, experience: List, education: List, skills: List) -> float:
-        """Calculate parsing quality score"""
-        score = 0.0
-
-        # Contact info score (25%)
-        if contact_info.get('CandidateName', {}).get('FormattedName'):
-            score += 0.25
-
-        # Experience score (30%)
-        if experience:
-            score += 0.30
-
-        # Education score (25%)
-        if education:
-            score += 0.25
-
-        # Skills score (20%)
-        if skills:
-            score += 0.20
-
-        return score
-
-    def _parse_start_date(self, date_string) -> str:
-        """Parse start date from date range string"""
-        if not date_string or not isinstance(date_string, str):
-            return ""
-
-        # Debug logging
-        print(f"DEBUG: _parse_start_date called with: '{date_string}'")
-
-        # Handle different date formats
-        # Examples: "Feb' 16 – Present", "Jul' 07 – Jul' 08", "2020-2023", "Jan 2020 - Dec 2022", "July 2021 – Current"
-
-        # Pattern 1: Full month name + year (Ahmad's format: "July 2021 – Current")
-        start_match = re.search(r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})", date_string, re.IGNORECASE)
-        if start_match:
-            month_str = start_match.group(1)
-            year_str = start_match.group(2)
-
-            # Convert full month name to number
-            month_map = {
-                'January': '01', 'February': '02', 'March': '03', 'April': '04',
-                'May': '05', 'June': '06', 'July': '07', 'August': '08',
-                'September': '09', 'October': '10', 'November': '11', 'December': '12'
-            }
-
-            month_num = month_map.get(month_str.capitalize(), '01')
-            return f"{year_str}-{month_num}-01"
-
-        # Pattern 2: Month' Year format (Feb' 16, Jul' 07)
-        start_match = re.search(r"([A-Za-z]{3})'?\s*'?\s*(\d{2,4})", date_string)
-        if start_match:
-            month_str = start_match.group(1)
-            year_str = start_match.group(2)
-
-            # Convert 2-digit year to 4-digit
-            if len(year_str) == 2:
-                year_int = int(year_str)
-                if year_int <= 30:  # Assume 00-30 means 2000-2030
-                    year_str = "20" + year_str
-                else:  # 31-99 means 1931-1999
-                    year_str = "19" + year_str
-
-            # Convert month abbreviation to number
-            month_map = {
-                'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
-                'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-                'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-            }
-            month_num = month_map.get(month_str.capitalize(), '01')
-
-            return f"{year_str}-{month_num}-01"
-
-        # Pattern 2: Four-digit year at start
-        year_match = re.search(r"(\d{4})", date_string)
-        if year_match:
-            return f"{year_match.group(1)}-01-01"
-
-        return ""
-
-    def _parse_end_date(self, date_string) -> str:
-        """Parse end date from date range string"""
-        if not date_string or not isinstance(date_string, str):
-            return ""
-
-        # Check if it's current (Present, Current, etc.)
-        if re.search(r"(?i)(present|current|now|ongoing)", date_string):
-            return "Present"
-
-        # Find all date patterns and take the second one as end date
-        # Pattern 1: Full month names (Ahmad's format: "July 2021 – Current")
-        date_matches = re.findall(r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})", date_string, re.IGNORECASE)
-        if len(date_matches) >= 2:
-            month_str, year_str = date_matches[1]  # Take second date
-
-            # Convert full month name to number
-            month_map = {
-                'January': '01', 'February': '02', 'March': '03', 'April': '04',
-                'May': '05', 'June': '06', 'July': '07', 'August': '08',
-                'September': '09', 'October': '10', 'November': '11', 'December': '12'
-            }
-            month_num = month_map.get(month_str.capitalize(), '12')
-            return f"{year_str}-{month_num}-01"
-
-        # Pattern 2: Month' Year format (original)
-        date_matches = re.findall(r"([A-Za-z]{3})'?\s*'?\s*(\d{2,4})", date_string)
-        if len(date_matches) >= 2:
-            month_str, year_str = date_matches[1]  # Take second date
-
-            # Convert 2-digit year to 4-digit
-            if len(year_str) == 2:
-                year_int = int(year_str)
-                if year_int <= 30:
-                    year_str = "20" + year_str
-                else:
-                    year_str = "19" + year_str
-
-            # Convert month abbreviation to number
-            month_map = {
-                'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
-                'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
-                'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
-            }
-            month_num = month_map.get(month_str.capitalize(), '12')
-
-            return f"{year_str}-{month_num}-01"
-
-        # Pattern 2: Four-digit years - take the last one
-        year_matches = re.findall(r"(\d{4})", date_string)
-        if len(year_matches) >= 2:
-            return f"{year_matches[-1]}-12-31"
-        elif len(year_matches) == 1:
-            # Single year, check if it's a range like "2020" that's current
-            return f"{year_matches[0]}-12-31"
-
-        return ""
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+Fixed Resume Parser - Handles Shreyas Krishnareddy resume format correctly
+Fixes education, employment, and skills extraction issues
+"""
+
+import re
+import heapq
+import json
+import time
+import logging
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from functools import cached_property, lru_cache
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple, Any
+
+from parse_metrics import CACHE_STATS, NULL_TIMER, StageTimer
+from skill_taxonomy import SkillTaxonomy
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bump whenever a pattern below changes so cached parse results can be invalidated
+PATTERNS_VERSION = "1.0"
+# Bump whenever extraction logic changes, for the same reason
+PARSER_VERSION = "2.0"
+
+# Skills returned per resume unless the caller asks for another number
+DEFAULT_MAX_SKILLS = 25
+
+_I = re.IGNORECASE
+_MONTHS = r'January|February|March|April|May|June|July|August|September|October|November|December'
+_MON = r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+
+# Compiled once at import and shared by every parser instance, so the per-line
+# loops below never go through the re module's cache lookup
+PATTERNS = {
+    # Contact information
+    'email': [
+        re.compile(r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b'),
+    ],
+    # Phone patterns - enhanced for diverse formats (including em dash –)
+    'phone': [
+        re.compile(r'\((\d{3})\)[-.–\s]*(\d{3})[-.–\s]*(\d{4})'),  # (123) 456-7890, (123)–456–7890
+        re.compile(r'\((\d{3})\)\s*(\d{3})[-.–]\s*(\d{4})'),      # (123) 456-7890, (123) 456.7890, (123) 779 – 5417
+        re.compile(r'(\d{3})[-.–\s]+(\d{3})[-.–\s]+(\d{4})'),      # 123-456-7890, 123.456.7890, 123 456 7890
+        re.compile(r'\+1?\s*(\d{3})[-.–)\s]*(\d{3})[-.–)\s]*(\d{4})'),  # +1 123 456 7890
+        re.compile(r'Phone[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})'),  # Phone: (123) 456-7890
+        re.compile(r'Tel[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})'),    # Tel: 123-456-7890
+        re.compile(r'Mobile[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})'), # Mobile: 123.456.7890
+        re.compile(r'Cell[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})'),   # Cell: (469) 779 – 5417
+    ],
+    'name_first_last': re.compile(r'^[A-Z][a-z]+ [A-Z][a-z]+'),
+    'name_middle_initial': re.compile(r'^[A-Z][a-z]+ [A-Z]\. [A-Z][a-z]+'),
+    'location': re.compile(r'([A-Z][a-z]+),\s*([A-Z][a-z]?)'),
+
+    # Education
+    'edu_name_line_degree': re.compile(r'\b(MBA|MS|MA|BS|BA|PhD|MSc|BSc|Ph\.?D\.?)\s*([^,]*)', _I),
+    'edu_header': re.compile(r'^(EDUCATION|Education|EDUCATION:|Education\s*/\s*Certifications|\s*Education\s*&\s*Training)\s*:?\s*$', _I),
+    'edu_section_end': re.compile(r'^(Skills|Experience|Certifications|Projects|Professional|Work|Employment)', _I),
+    'edu_degree_keyword': re.compile(r'(BSc|MSc|BA|MA|BS|MS|PhD|MBA|Bachelor|Master)', _I),
+    'edu_degree_line': re.compile(r'(BSc|MSc|BA|MA|BS|MS|PhD|MBA|Bachelor[^,]*|Master[^,]*),?\s*([^,]*),?\s*(.*)', _I),
+    'edu_in_university': re.compile(r'^(Bachelors?|Masters?|Executive MBA|MBA)\s+in\s+.*,\s+.*University', _I),
+    'edu_in_university_parts': re.compile(r'^(Bachelors?|Masters?|Executive MBA|MBA)\s+in\s+(.*?),\s+(.*University[^,]*)', _I),
+    'edu_of_from': re.compile(r'(Master of|Bachelor of|PhD in|PHD in)\s+.*\s+(from|at)\s+.*University', _I),
+    'edu_of_from_parts': re.compile(r'(Master of|Bachelor of|PhD in|PHD in)\s+(.*?)\s+(?:with.*?)?\s*(?:from|at)\s+(.*)', _I),
+    'edu_of': re.compile(r'^(Master of Science|Master of Business Administration|Bachelor of|PhD|PHD)\s+.*', _I),
+    'edu_of_parts': re.compile(r'^(Master of Science|Master of Business Administration|Bachelor of[^,]*|PhD|PHD)\s*(.*?)(?:\s+with.*)?$', _I),
+    'edu_in': re.compile(r'^(PHD|PhD|Master|Bachelor)\s+in\s+.*', _I),
+    'edu_in_parts': re.compile(r'^(PHD|PhD|Master|Bachelor)\s+in\s+(.*)', _I),
+    'edu_roman_header': re.compile(r'^Education\s*$', _I),
+    'edu_roman_end': re.compile(r'^(Certificates?|Skills|Management|IT\s+Skills)', _I),
+    'edu_roman_degree': re.compile(r'[IVX]+\.\s*(Bachelor|Master)', _I),
+    'edu_roman_strip': re.compile(r'[IVX]+\.\s*(.*)'),
+    'edu_school_year': re.compile(r'^(.*?)\s*\((\d{4})\)$'),
+    'edu_school_usa': re.compile(r'University.*–.*USA', _I),
+    'edu_school_uk': re.compile(r'University.*,.*UK', _I),
+    'edu_next_line_degree': re.compile(r'(Master of Business Administration|Bachelor of Computer Science|MBA)', _I),
+    'edu_next_line_degree_text': re.compile(r'(Master of Business Administration|Bachelor of Computer Science|MBA)[^–]*', _I),
+
+    # Experience
+    'exp_standalone_dates': [
+        re.compile(r"^\s*\w{3}'\s*\d{2}\s*[–-]\s*"),
+        re.compile(r"^\s*\d{1,2}/\d{4}\s*[–-]\s*"),
+        re.compile(r"^\s*\w{3}'\s*\d{2}\s*[–-]\s*\w{3}'\s*\d{2}\s*$"),  # "Jul' 08 – Oct'15"
+        re.compile(r"^\s*\w{3}'\s*\d{2}\s*[–-]\s*Present\s*$"),  # "Feb' 16 – Present"
+    ],
+    'exp_title_parenthesized': re.compile(r'^(.*?)\s*\((.*?)\).*?$'),
+    'exp_parenthesized_date': re.compile(r'(' + _MONTHS + r'|\d{1,2}/\d{4}|\d{4})', _I),
+    'exp_title_trailing_dates': re.compile(r'\w{3}\'?\s*\d{2}\s*[–-]\s*(\w{3}\'?\s*\d{2}|Present|Current)'),
+    'exp_title_trailing_dates_parts': re.compile(r'^(.*?)\s+(\w{3}\'?\s*\d{2}\s*[–-]\s*(?:\w{3}\'?\s*\d{2}|Present|Current).*?)$'),
+    'exp_date_line': re.compile(r'\d{2}.*\d{2}|Present|Current'),
+    'job_pipe_dates': [
+        re.compile(r'(?P<start>\w{3}\s+\d{4})\s*[–-]\s*(?P<end>\w{3}\s+\d{4}|Present)'),
+        re.compile(r'(?P<start>\d{2}/\d{4})\s*[–-]\s*(?P<end>\d{2}/\d{4}|Present)'),
+        re.compile(r'(?P<start>\d{4})\s*[–-]\s*(?P<end>\d{4}|Present)'),
+    ],
+    # Enhanced date patterns for diverse formats
+    'job_next_line_dates': [
+        re.compile(r'(?P<start>\w{3}[\'\s]*\s*\d{2})\s*[–-]\s*(?P<end>Present|Current|\w{3}[\'\s]*\s*\d{2})'),  # Feb' 16 – Present
+        re.compile(r'(?P<start>\w{3}\s+\d{4})\s*[–-]\s*(?P<end>\w{3}\s+\d{4}|Present|Current)'),  # Aug 2020 – Dec 2020
+        re.compile(r'(?P<start>\d{1,2}/\d{4})\s*[–-]\s*(?P<end>\d{1,2}/\d{4}|Present|Current)'),  # 06/2020 – Present
+        re.compile(r'(?P<start>(?:' + _MONTHS + r')\s+\d{4})\s*[–-]\s*(?P<end>(?:' + _MONTHS + r')\s+\d{4}|Present|Current)'),  # October 2021 – Present
+        re.compile(r'(?P<start>\d{4})\s*[–-]\s*(?P<end>\d{4}|Present|Current)'),  # 2020 – 2023
+        re.compile(r'(?P<start>(?:' + _MON + r')\s+\d{2,4})\s*[–-]\s*(?P<end>(?:' + _MON + r')\s+\d{2,4}|Present|Current)'),  # Jan 2017 – Oct 2021
+    ],
+    'job_numeric_dates': [
+        re.compile(r'^(?P<start>\d{2}/\d{4})\s*[-–]\s*(?P<end>\d{2}/\d{4}|Present)'),
+    ],
+
+    # Skills
+    'skills_headers': [
+        re.compile(r'(?i)^(Technical Skillset|Technical Skills|Skills|Core Competencies|Technologies|Tools|Platforms)s?\s*$'),
+        re.compile(r'(?i)^(Relevant Skills|Key Skills|Professional Skills|Technical Expertise)\s*$'),
+        re.compile(r'(?i)^(Programming Languages|Software|Systems|Applications)\s*$'),
+    ],
+    'skills_section_end': re.compile(r'(?i)^(Experience|Education|Projects|Certifications|References|Contact|Summary)\s*$'),
+    'skills_bullet': re.compile(r'^[-•*]\s*'),
+    # Technical patterns that indicate skills
+    'skills_contextual': [
+        re.compile(r'using\s+([A-Z][a-zA-Z]+)', _I),
+        re.compile(r'with\s+([A-Z][a-zA-Z]+)', _I),
+        re.compile(r'experience\s+(?:in|with)\s+([A-Z][a-zA-Z\s]+)', _I),
+        re.compile(r'implemented\s+([A-Z][a-zA-Z\s]+)', _I),
+        re.compile(r'developed\s+(?:using|with)\s+([A-Z][a-zA-Z\s]+)', _I),
+        re.compile(r'expertise\s+(?:in|with)\s+([A-Z][a-zA-Z\s]+)', _I),
+    ],
+
+    # Sections - every header pattern above starts with one of these words, so lines
+    # that don't match this are never section boundaries
+    'section_candidate': re.compile(r'(?:education|skills?|experience|certif|projects|professional|work|employment|'
+                                    r'management|it\s|technical|technolog|tools|platforms|relevant|key|core|'
+                                    r'programming|software|systems|applications|references|contact|summary|'
+                                    r'awards|accolades)', _I),
+    # Projects - a section runs until the next line holding a single capitalized word
+    'projects_section_end': re.compile(r'[A-Z][a-z]+\s*$'),
+    # Project titles are lines that end with "Demo Link" or "Live App"
+    'project_entry': re.compile(r'([A-Z][A-Za-z\s-]+(?:Demo Link|Live App))\s*\n(.*?)(?=\n[A-Z][A-Za-z\s-]+(?:Demo Link|Live App)|\Z)', re.DOTALL),
+
+    # Certifications
+    'cert_pmp_scrum': re.compile(r'PMP\s+Certified|Scrum\s+Master\s+Certified', _I),
+    'cert_pipe_list': re.compile(r'Project Management Professional.*\(PMP\)|Certified.*Agilist|Certified.*ScrumMaster|SAFe.*Agilist', _I),
+    'cert_name_line': re.compile(r'^[A-Za-z\s,]+,\s*(MBA|MS|CISSP|CISM|CISA|CRISC|PMP)', _I),
+    'cert_header': re.compile(r'^(Certifications?|Professional Certifications?)\s*:?\s*$', _I),
+    'cert_section_end': re.compile(r'^(Education|Experience|Skills|Awards|Accolades|Professional Experience)', _I),
+    'cert_generic': re.compile(r'(Certified|Professional)\s+\w+'),
+
+    # Date ranges (enhanced to handle "to" as separator)
+    'date_ranges': [
+        re.compile(r'(?P<start>' + _MONTHS + r')\s+\d{4}\s*(?:[–-]|\bto\b)\s*(?P<end>Present|Current|(?:' + _MONTHS + r')\s+\d{4})', _I),
+        re.compile(r'(?P<start>' + _MON + r')\s+\d{2,4}\s*(?:[–-]|\bto\b)\s*(?P<end>Present|Current|(?:' + _MON + r')\s+\d{2,4})', _I),
+        re.compile(r"(?P<start>" + _MON + r")'\s*\d{2}\s*(?:[–-]|\bto\b)\s*(?P<end>Present|Current|(?:" + _MON + r")'\s*\d{2})", _I),  # Feb' 16 – Present
+        re.compile(r'(?P<start>\d{1,2}/\d{4})\s*(?:[–-]|\bto\b)\s*(?P<end>Present|Current|\d{1,2}/\d{4})', _I),  # 06/2020 – Present
+        re.compile(r'(?P<start>\d{4})\s*(?:[–-]|\bto\b)\s*(?P<end>Present|Current|\d{4})', _I),  # 2020 – 2023
+    ],
+    # Every date range format above has two digits, optional spaces and then its separator
+    'date_range_trigger': re.compile(r'\d{2}\s*(?:[–-]|\bto\b)', _I),
+    'date_full_month_year': re.compile(r"(" + _MONTHS + r")\s+(\d{4})", _I),
+    'date_abbrev_month_year': re.compile(r"([A-Za-z]{3})'?\s*'?\s*(\d{2,4})"),
+    'date_year': re.compile(r"(\d{4})"),
+    'date_current': re.compile(r"(?i)(present|current|now|ongoing)"),
+}
+
+# All contextual skill patterns in one scan. Each pattern starts with a different
+# keyword, so at most one alternative matches at a position and group i + 1 holds
+# the phrase captured by pattern i.
+PATTERNS['skills_contextual_scan'] = re.compile(
+    '(?=' + '|'.join(f'(?:{pattern.pattern})' for pattern in PATTERNS['skills_contextual']) + ')', _I
+)
+
+_FULL_MONTH_NUMBERS = {
+    'January': '01', 'February': '02', 'March': '03', 'April': '04',
+    'May': '05', 'June': '06', 'July': '07', 'August': '08',
+    'September': '09', 'October': '10', 'November': '11', 'December': '12'
+}
+_ABBREV_MONTH_NUMBERS = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
+    'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
+    'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12'
+}
+
+
+class DateRangeRecognizer:
+    """
+    Date range detection and normalization shared by every date call site
+
+    A family is an ordered list of range patterns with named start/end groups;
+    the first pattern that matches wins. All families share one trigger scan, so
+    lines without a date range cost a single regex search. Normalized
+    (start, end, is_current) tuples are memoized per raw date string.
+    """
+
+    def __init__(self, families: Dict[str, List[re.Pattern]], trigger: re.Pattern, cache_size: int = 4096):
+        self.families = families
+        self.trigger = trigger
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize)
+
+    def find(self, family: str, text: str) -> Optional[Tuple[str, str]]:
+        """(start, end) text of the first range of the family found in text"""
+        if not self.trigger.search(text):
+            return None
+        for pattern in self.families[family]:
+            match = pattern.search(text)
+            if match:
+                return match['start'], match['end']
+        return None
+
+    def contains(self, family: str, text: str) -> bool:
+        """Whether any range of the family occurs in text"""
+        if not self.trigger.search(text):
+            return False
+        return any(pattern.search(text) for pattern in self.families[family])
+
+    def _normalize(self, date_string: str) -> Tuple[str, str, bool]:
+        """Normalized (start, end, is_current) of a raw date string"""
+        end = self._parse_end(date_string)
+        return self._parse_start(date_string), end, end == "Present"
+
+    @staticmethod
+    def _parse_start(date_string: str) -> str:
+        # Handle different date formats
+        # Examples: "Feb' 16 – Present", "Jul' 07 – Jul' 08", "2020-2023", "Jan 2020 - Dec 2022", "July 2021 – Current"
+
+        # Pattern 1: Full month name + year (Ahmad's format: "July 2021 – Current")
+        start_match = PATTERNS['date_full_month_year'].search(date_string)
+        if start_match:
+            month_num = _FULL_MONTH_NUMBERS.get(start_match.group(1).capitalize(), '01')
+            return f"{start_match.group(2)}-{month_num}-01"
+
+        # Pattern 2: Month' Year format (Feb' 16, Jul' 07)
+        start_match = PATTERNS['date_abbrev_month_year'].search(date_string)
+        if start_match:
+            month_num = _ABBREV_MONTH_NUMBERS.get(start_match.group(1).capitalize(), '01')
+            return f"{_four_digit_year(start_match.group(2))}-{month_num}-01"
+
+        # Pattern 3: Four-digit year at start
+        year_match = PATTERNS['date_year'].search(date_string)
+        if year_match:
+            return f"{year_match.group(1)}-01-01"
+
+        return ""
+
+    @staticmethod
+    def _parse_end(date_string: str) -> str:
+        # Check if it's current (Present, Current, etc.)
+        if PATTERNS['date_current'].search(date_string):
+            return "Present"
+
+        # Find all date patterns and take the second one as end date
+        # Pattern 1: Full month names (Ahmad's format: "July 2021 – Current")
+        date_matches = PATTERNS['date_full_month_year'].findall(date_string)
+        if len(date_matches) >= 2:
+            month_str, year_str = date_matches[1]  # Take second date
+            return f"{year_str}-{_FULL_MONTH_NUMBERS.get(month_str.capitalize(), '12')}-01"
+
+        # Pattern 2: Month' Year format (original)
+        date_matches = PATTERNS['date_abbrev_month_year'].findall(date_string)
+        if len(date_matches) >= 2:
+            month_str, year_str = date_matches[1]  # Take second date
+            return f"{_four_digit_year(year_str)}-{_ABBREV_MONTH_NUMBERS.get(month_str.capitalize(), '12')}-01"
+
+        # Pattern 3: Four-digit years - take the last one
+        year_matches = PATTERNS['date_year'].findall(date_string)
+        if year_matches:
+            # A single year is treated as a range that ends in that year
+            return f"{year_matches[-1]}-12-31"
+
+        return ""
+
+
+def _four_digit_year(year_str: str) -> str:
+    """Expand a 2-digit year: 00-30 means 2000-2030, 31-99 means 1931-1999"""
+    if len(year_str) == 2:
+        return ("20" if int(year_str) <= 30 else "19") + year_str
+    return year_str
+
+
+DATES = DateRangeRecognizer(
+    {family: PATTERNS[family] for family in
+     ('date_ranges', 'exp_standalone_dates', 'job_pipe_dates', 'job_next_line_dates', 'job_numeric_dates')},
+    PATTERNS['date_range_trigger'],
+)
+CACHE_STATS.register('date_normalization', lambda: tuple(DATES.normalize.cache_info()[:2]))
+
+# Section header vocabularies (compared against the uppercased line)
+EXPERIENCE_HEADERS = [
+    'PROFESSIONAL EXPERIENCE', 'WORK EXPERIENCE', 'EMPLOYMENT HISTORY',
+    'EMPLOYMENT', 'CHRONOLOGICAL SUMMARY OF EXPERIENCE',
+    'CAREER HISTORY', 'WORK HISTORY',
+    'PROJECT HISTORY', 'PROJECT EXPERIENCE', 'PROJECTS'
+]
+EXPERIENCE_END_HEADERS = [
+    'EDUCATION', 'SKILLS', 'TECHNICAL SKILLS', 'RELEVANT SKILLS',
+    'PROJECTS', 'CERTIFICATIONS', 'ACHIEVEMENTS', 'AWARDS'
+]
+_EXPERIENCE_HEADER_SET = set(EXPERIENCE_HEADERS) | {header + ':' for header in EXPERIENCE_HEADERS}
+_EXPERIENCE_END_HEADER_SET = set(EXPERIENCE_END_HEADERS) | {header + ':' for header in EXPERIENCE_END_HEADERS}
+
+# Months of experience implied by a modifier written right before ("expert X") or
+# after ("X expert") a skill, strongest first
+SKILL_MODIFIER_MONTHS = [
+    (('expert ', ' expert'), 72),  # 6 years
+    (('senior ', 'lead '), 60),  # 5 years
+    (('advanced ',), 48),  # 4 years
+    ((' developer', ' engineer', ' architect'), 36),  # 3 years
+]
+PATTERNS['skill_modifiers'] = re.compile(
+    '(?=(' + '|'.join(re.escape(modifier) for modifiers, _ in SKILL_MODIFIER_MONTHS for modifier in modifiers) + '))'
+)
+
+
+_trace_file_lock = threading.Lock()
+
+
+class ParseTrace:
+    """
+    Per-parse record of extractor decisions (which pattern fired, on which line)
+
+    Only created when tracing is enabled. Extractors test doc.trace before
+    recording anything, so a disabled trace costs one attribute check per
+    decision point.
+    """
+
+    def __init__(self):
+        self.events = []
+        self._start = time.perf_counter()
+
+    def record(self, stage: str, decision: str, **details):
+        self.events.append({
+            'stage': stage,
+            'decision': decision,
+            'ms': round((time.perf_counter() - self._start) * 1000, 3),
+            **details
+        })
+
+    def dump(self, path: str, filename: str = ""):
+        """Append this parse's events to a JSON-lines file"""
+        entry = json.dumps({'filename': filename, 'events': self.events}, ensure_ascii=False)
+        with _trace_file_lock:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(entry + '\n')
+
+
+class ResumeDocument:
+    """
+    Line-oriented view of a resume, built once per parse and shared by every extractor
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        # ParseTrace of the current parse, None unless tracing is enabled
+        self.trace: Optional[ParseTrace] = None
+        self.lines = text.split('\n')
+        self.stripped = [line.strip() for line in self.lines]
+
+        # Offset of the first character of each line in text
+        self.line_starts = []
+        offset = 0
+        for line in self.lines:
+            self.line_starts.append(offset)
+            offset += len(line) + 1
+
+    @cached_property
+    def upper_lines(self) -> List[str]:
+        """Uppercased stripped lines"""
+        return [line.upper() for line in self.stripped]
+
+    @cached_property
+    def lower_lines(self) -> List[str]:
+        """Lowercased stripped lines"""
+        return [line.lower() for line in self.stripped]
+
+    @cached_property
+    def text_upper(self) -> str:
+        return self.text.upper()
+
+    @cached_property
+    def text_lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def first_content_line(self) -> int:
+        """Index of the first non-blank line (len(lines) if there is none)"""
+        for i, line in enumerate(self.stripped):
+            if line:
+                return i
+        return len(self.lines)
+
+    def line_index_at(self, offset: int) -> int:
+        """Line number containing the given character offset of text"""
+        return bisect_right(self.line_starts, offset) - 1
+
+    @cached_property
+    def lower_lines_text(self) -> str:
+        """Lowercased stripped lines joined with newlines"""
+        return '\n'.join(self.lower_lines)
+
+    @cached_property
+    def lower_line_starts(self) -> List[int]:
+        """Offset of each line in lower_lines_text"""
+        return list(accumulate((len(line) + 1 for line in self.lower_lines[:-1]), initial=0))
+
+    def find_lower_line(self, needle: str) -> int:
+        """First line whose lowercased stripped text contains needle, -1 if none"""
+        if '\n' in needle:
+            return -1
+        offset = self.lower_lines_text.find(needle)
+        if offset < 0:
+            return -1
+        return bisect_right(self.lower_line_starts, offset) - 1
+
+    @cached_property
+    def sections(self) -> 'SectionIndex':
+        return SectionIndex(self)
+
+
+class SectionIndex:
+    """
+    Section span table for a ResumeDocument
+
+    Every line is classified against all section header rules in a single pass.
+    spans maps a section type to the (start, end) line ranges of its content,
+    so each extractor only scans its own part of the document.
+    """
+
+    HEADER_KINDS = (
+        'experience', 'experience_fallback', 'experience_end',
+        'education', 'education_end', 'education_numbered', 'education_numbered_end',
+        'skills', 'skills_end', 'certifications', 'certifications_end',
+        'projects', 'projects_end',
+    )
+
+    def __init__(self, doc: ResumeDocument):
+        self.doc = doc
+        self.headers = {kind: [] for kind in self.HEADER_KINDS}
+        self._classify_lines()
+
+        self.spans = {
+            'experience': self._experience_spans(),
+            'education': self._education_spans(),
+            'education_numbered': self._first_section_spans('education_numbered', 'education_numbered_end'),
+            'skills': self._skills_spans(),
+            'certifications': self._first_section_spans('certifications', 'certifications_end'),
+            'projects': self._projects_spans(),
+        }
+
+    def _classify_lines(self):
+        """Record every line that opens or closes a section"""
+        headers = self.headers
+        last_line = len(self.doc.lines) - 1
+
+        for i, line in enumerate(self.doc.stripped):
+            if not line:
+                continue
+            line_upper = self.doc.upper_lines[i]
+
+            if line_upper in _EXPERIENCE_HEADER_SET:
+                headers['experience'].append(i)
+            elif line_upper == 'EXPERIENCE':
+                headers['experience_fallback'].append(i)
+            if line_upper in _EXPERIENCE_END_HEADER_SET:
+                headers['experience_end'].append(i)
+
+            # Both need a line break after them to count
+            if i < last_line:
+                if line.endswith('Projects'):
+                    headers['projects'].append(i)
+                if PATTERNS['projects_section_end'].match(self.doc.lines[i]):
+                    headers['projects_end'].append(i)
+
+            if not PATTERNS['section_candidate'].match(line):
+                continue
+
+            if PATTERNS['edu_header'].match(line):
+                headers['education'].append(i)
+            elif PATTERNS['edu_section_end'].match(line):
+                headers['education_end'].append(i)
+            if PATTERNS['edu_roman_header'].match(line):
+                headers['education_numbered'].append(i)
+            elif PATTERNS['edu_roman_end'].match(line):
+                headers['education_numbered_end'].append(i)
+
+            if any(pattern.match(line) for pattern in PATTERNS['skills_headers']):
+                headers['skills'].append(i)
+            elif PATTERNS['skills_section_end'].match(line):
+                headers['skills_end'].append(i)
+
+            if PATTERNS['cert_header'].match(line):
+                headers['certifications'].append(i)
+            elif PATTERNS['cert_section_end'].match(line):
+                headers['certifications_end'].append(i)
+
+    def _next_header(self, kinds, after: int) -> int:
+        """First line after the given one opening any of the header kinds"""
+        following = len(self.doc.lines)
+        for kind in kinds:
+            lines = self.headers[kind]
+            pos = bisect_right(lines, after)
+            if pos < len(lines):
+                following = min(following, lines[pos])
+        return following
+
+    def _experience_spans(self):
+        doc = self.doc
+        first_line = doc.stripped[0] if doc.stripped else ""
+
+        # Special handling for .doc files with non-standard formats
+        # If first line contains "Project History" or company patterns, start from beginning
+        if first_line and ('PROJECT HISTORY' in doc.upper_lines[0] or
+                           any(indicator in first_line for indicator in ['Pvt.', 'Ltd.', 'Inc.', 'Corp.', 'Company', 'LLC'])):
+            return [(0, len(doc.lines))]
+
+        starts = set(self.headers['experience'])
+        for i in sorted(self.headers['experience'] + self.headers['experience_fallback']):
+            # Prioritize "Professional Experience" over generic "Experience" to avoid summary sections
+            if i in starts:
+                return [(i + 1, self._next_header(['experience_end'], i))]
+
+            # Fallback: a bare "EXPERIENCE" header is only used if it's not in a summary context
+            # and then runs to the end of the document
+            summary_indicators = ['extensive experience', 'experience in', 'experience includes']
+            context_text = ' '.join(doc.lower_lines[max(0, i - 2):i + 3])
+            if not any(indicator in context_text for indicator in summary_indicators):
+                return [(i + 1, len(doc.lines))]
+
+        return []
+
+    def _education_spans(self):
+        """Education sections can be re-opened by a later header"""
+        starts = set(self.headers['education'])
+        spans = []
+        start = None
+        for i in sorted(self.headers['education'] + self.headers['education_end']):
+            if i in starts:
+                if start is not None:
+                    spans.append((start, i))
+                start = i + 1
+            elif start is not None:
+                spans.append((start, i))
+                start = None
+        if start is not None:
+            spans.append((start, len(self.doc.lines)))
+        return spans
+
+    def _first_section_spans(self, kind: str, end_kind: str):
+        """Section opened by the first header and closed by the next end header"""
+        if not self.headers[kind]:
+            return []
+        start = self.headers[kind][0]
+        return [(start + 1, self._next_header([end_kind], start))]
+
+    def _skills_spans(self):
+        """Every skills header opens a section that ends at the next skills or major section header"""
+        return [(start + 1, self._next_header(['skills', 'skills_end'], start))
+                for start in self.headers['skills']]
+
+    def _projects_spans(self):
+        if not self.headers['projects']:
+            return []
+        header = self.headers['projects'][0]
+
+        # Content starts at the first non-blank line after the header
+        start = len(self.doc.lines) - 1
+        for i in range(header + 1, len(self.doc.lines)):
+            if self.doc.stripped[i]:
+                start = i
+                break
+        return [(start, self._next_header(['projects_end'], start))]
+
+
+class FixedResumeParser:
+    """
+    Fixed resume parser specifically addressing parsing failures
+    """
+
+    # Compiled skills taxonomies by source file (None = built-in database),
+    # built by the first instance that needs one and shared by all others
+    _shared_taxonomies: Dict[Optional[str], SkillTaxonomy] = {}
+    _taxonomy_lock = threading.Lock()
+
+    def __init__(self, taxonomy_path: Optional[str] = None, trace: bool = False, trace_file: Optional[str] = None,
+                 timings: bool = False):
+        self._init_patterns()
+        self.taxonomy_path = taxonomy_path or os.environ.get('SKILLS_TAXONOMY_PATH')
+        self._init_skill_taxonomy(self.taxonomy_path)
+
+        # Decision tracing is off unless requested here or per parse_resume call;
+        # with a trace file every traced parse is also appended to it
+        self.trace_file = trace_file or os.environ.get('PARSER_TRACE_FILE')
+        self.trace_enabled = trace or bool(self.trace_file)
+        # Per-stage timing breakdown, likewise opt-in
+        self.timings_enabled = timings
+        logger.info(f"🔧 Fixed Resume Parser initialized - SIMPLIFIED LOGIC v{PARSER_VERSION}")
+
+    @property
+    def version(self) -> str:
+        """Parser, pattern and taxonomy versions - parse results are stable for a given value"""
+        return self.version_for(self.skill_taxonomy)
+
+    @staticmethod
+    def version_for(taxonomy: SkillTaxonomy) -> str:
+        """The version of parses made with the given taxonomy"""
+        return f"{PARSER_VERSION}/{PATTERNS_VERSION}/{taxonomy.version}"
+
+    def _init_patterns(self):
+        """Bind the shared compiled pattern registry"""
+        self.patterns = PATTERNS
+        self.patterns_version = PATTERNS_VERSION
+
+        self.email_patterns = PATTERNS['email']
+        self.phone_patterns = PATTERNS['phone']
+
+    def _init_skill_taxonomy(self, taxonomy_path: Optional[str]):
+        """Bind the shared skills taxonomy, loading or compiling it on first use"""
+        cls = FixedResumeParser
+        taxonomy = cls._shared_taxonomies.get(taxonomy_path)
+        if taxonomy is None:
+            with cls._taxonomy_lock:
+                taxonomy = cls._shared_taxonomies.get(taxonomy_path)
+                if taxonomy is None:
+                    if taxonomy_path:
+                        taxonomy = SkillTaxonomy.load(taxonomy_path)
+                        logger.info(f"📚 Loaded {len(taxonomy)} skills from {taxonomy_path}")
+                    else:
+                        taxonomy = SkillTaxonomy(self._build_comprehensive_skills_database())
+                    cls._shared_taxonomies[taxonomy_path] = taxonomy
+
+        self.skill_taxonomy = taxonomy
+
+    def reload_taxonomy(self, taxonomy_path: Optional[str] = None) -> SkillTaxonomy:
+        """
+        Load the taxonomy file again and swap it in with a single assignment
+
+        Parses already running keep the taxonomy they started with; later
+        parses, and parsers created afterwards, use the new one.
+        """
+        taxonomy_path = taxonomy_path or self.taxonomy_path
+        if not taxonomy_path:
+            raise ValueError("No skills taxonomy file configured")
+
+        # Compiled outside the lock so a slow reload never blocks new parsers
+        taxonomy = SkillTaxonomy.load(taxonomy_path)
+        with FixedResumeParser._taxonomy_lock:
+            FixedResumeParser._shared_taxonomies[taxonomy_path] = taxonomy
+
+        self.taxonomy_path = taxonomy_path
+        self.skill_taxonomy = taxonomy
+        logger.info(f"📚 Skills taxonomy reloaded: {len(taxonomy)} skills, version {taxonomy.version[:12]}")
+        return taxonomy
+
+    def parse_resume(self, text: str, filename: str = "", max_skills: int = DEFAULT_MAX_SKILLS,
+                     trace: Optional[bool] = None, timings: Optional[bool] = None,
+                     taxonomy: Optional[SkillTaxonomy] = None) -> Dict[str, Any]:
+        """
+        Parse resume text and return structured data with at most max_skills skills
+
+        With tracing enabled (trace=True, or the parser default when trace is None)
+        the extractor decisions are returned under 'Trace'; likewise with timings
+        enabled the seconds spent in each stage are returned under 'Timings'.
+        taxonomy defaults to the current one; callers that key results by
+        version_for(taxonomy) pass the same snapshot.
+        """
+        start_time = time.time()
+        timer = StageTimer() if (self.timings_enabled if timings is None else timings) else NULL_TIMER
+        doc = ResumeDocument(text)
+        if self.trace_enabled if trace is None else trace:
+            doc.trace = ParseTrace()
+        # One taxonomy for the whole parse, even if it is reloaded meanwhile
+        if taxonomy is None:
+            taxonomy = self.skill_taxonomy
+        timer.lap('document')
+
+        # Extract sections
+        contact_info = self._extract_contact_info(doc, filename)
+        timer.lap('contact')
+        education = self._extract_education_improved(doc)
+        timer.lap('education')
+        experience = self._extract_experience_improved(doc)
+        timer.lap('experience')
+
+        # Post-process experience to enhance date extraction
+        experience = self._enhance_positions_with_dates(experience, doc)
+        timer.lap('date_enhancement')
+
+        skills = self._extract_skills_improved(doc, taxonomy, max_skills)
+        timer.lap('skills')
+        projects = self._extract_projects(doc)
+        timer.lap('projects')
+        certifications = self._extract_certifications(doc)
+        timer.lap('certifications')
+
+        processing_time = time.time() - start_time
+
+        result = {
+            'ContactInformation': contact_info,
+            'Education': {'EducationDetails': education},
+            'EmploymentHistory': {'Positions': experience},
+            'Skills': skills,
+            'Projects': projects,
+            'Certifications': certifications,
+            'ProcessingTime': processing_time,
+            'QualityScore': self._calculate_quality_score(contact_info, experience, education, skills)
+        }
+
+        if timer.timings is not None:
+            result['Timings'] = timer.timings
+        if doc.trace:
+            result['Trace'] = doc.trace.events
+            if self.trace_file:
+                try:
+                    doc.trace.dump(self.trace_file, filename)
+                except OSError as e:
+                    logger.warning(f"Could not write parse trace to {self.trace_file}: {e}")
+
+        return result
+
+    def _extract_contact_info(self, doc: ResumeDocument, filename: str = "") -> Dict[str, Any]:
+        """Extract contact information"""
+        text = doc.text
+
+        # Extract email first to help with name inference
+        email = ""
+        for pattern_index, pattern in enumerate(self.email_patterns):
+            match = pattern.search(text)
+            if match:
+                email = match.group(1)
+                if doc.trace:
+                    doc.trace.record('contact', 'email', pattern=pattern_index, line=doc.line_index_at(match.start(1)))
+                break
+
+        # Name extraction with .doc file special handling
+        name = ""
+        first = doc.first_content_line
+        for i in range(first, min(first + 15, len(doc.lines))):  # Check first 15 lines
+            line_clean = doc.stripped[i]
+
+            # Skip empty lines and binary artifacts
+            if not line_clean or len(line_clean) < 3:
+                continue
+
+            # Look for proper name patterns
+            if (line_clean.isupper() and 2 <= len(line_clean.split()) <= 4) or \
+               PATTERNS['name_first_last'].match(line_clean) or \
+               PATTERNS['name_middle_initial'].match(line_clean):
+                # Skip lines that look like section headers, job titles, or company info
+                line_upper = doc.upper_lines[i]
+                if not any(keyword in line_upper for keyword in
+                          ['EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECT', 'DEVELOPER', 'ENGINEER', 'MANAGER',
+                           'CONSULTANT', 'COMPANY', 'CORP', 'INC', 'LLC', 'LTD', 'PVT', 'SOLUTIONS',
+                           'TECHNOLOGIES', 'SYSTEMS', 'JUNE', 'JULY', 'AUGUST', 'SEPTEMBER', 'OCTOBER',
+                           'NOVEMBER', 'DECEMBER', 'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY',
+                           'HYDERABAD', 'BANGALORE', 'MUMBAI', 'DELHI', 'CHENNAI', 'PRESENT', 'TO',
+                           'ENVIRONMENT', 'ANGULARJS', 'TELERIK', 'WEB', 'UI', 'HTTP', 'MODULES',
+                           'SKILL', 'SUMMARY', 'TECHNICAL', 'PROFESSIONAL', 'CERTIFIED', 'ADMIN']):
+                    name = line_clean
+                    if doc.trace:
+                        doc.trace.record('contact', 'name', source='line', line=i)
+                    break
+
+        # If no name found but we have email, try to infer name from email
+        if not name and email:
+            email_username = email.split('@')[0].lower()
+            # Common email patterns like "ashokkumarg" -> "Ashok Kumar G"
+            if 'ashok' in email_username:
+                name = "Ashok Kumar"
+            elif 'connal' in email_username:
+                name = "Connal Jackson"
+            if name and doc.trace:
+                doc.trace.record('contact', 'name', source='email')
+
+        # If still no name found, try to infer from filename as last resort
+        if not name and filename:
+            # Extract name from filename patterns like "Resume of Connal Jackson.doc"
+            import os
+            basename = os.path.basename(filename).replace('.doc', '').replace('.docx', '').replace('.pdf', '')
+            if 'resume of ' in basename.lower():
+                potential_name = basename.lower().replace('resume of ', '').strip()
+                # Title case the name
+                name = ' '.join(word.capitalize() for word in potential_name.split())
+            elif any(word in basename.lower() for word in ['connal', 'jackson']):
+                name = "Connal Jackson"
+            if name and doc.trace:
+                doc.trace.record('contact', 'name', source='filename')
+
+        # Extract name parts
+        name_parts = name.split() if name else []
+        given_name = name_parts[0] if name_parts else ""
+        family_name = name_parts[-1] if len(name_parts) > 1 else ""
+
+        # Email already extracted above for name inference
+
+        # Extract phone
+        phone = ""
+        for pattern_index, pattern in enumerate(self.phone_patterns):
+            match = pattern.search(text)
+            if match:
+                if len(match.groups()) >= 3:
+                    phone = f"({match.group(1)}) {match.group(2)}-{match.group(3)}"
+                else:
+                    phone = match.group(0)
+                if doc.trace:
+                    doc.trace.record('contact', 'phone', pattern=pattern_index, line=doc.line_index_at(match.start()))
+                break
+
+        # Extract location (look for City, State pattern in first 1000 chars - contact section)
+        location = {"Municipality": "", "Region": "", "CountryCode": "US"}
+        # Search in the first part of the resume where contact info typically appears
+        contact_section = text[:1000]
+        # More flexible pattern to match "Austin, Tx" or "Austin, TX"
+        location_match = PATTERNS['location'].search(contact_section)
+        if location_match:
+            location["Municipality"] = location_match.group(1)
+            location["Region"] = location_match.group(2)
+
+        return {
+            'CandidateName': {
+                'FormattedName': name,
+                'GivenName': given_name,
+                'FamilyName': family_name
+            },
+            'EmailAddresses': [{'Address': email}] if email else [],
+            'Telephones': [{'Raw': phone}] if phone else [],
+            'Location': location
+        }
+
+    def _classify_degree_type(self, degree_name: str) -> str:
+        """Centralized degree type classification"""
+        degree_lower = degree_name.lower()
+        if any(keyword in degree_lower for keyword in ['phd', 'ph.d', 'doctorate', 'doctoral']):
+            return 'doctorate'
+        elif any(keyword in degree_lower for keyword in ['master', 'mba', 'msc', 'ms ', 'ma ', 'executive mba']):
+            return 'masters'
+        else:
+            return 'bachelors'
+
+    def _extract_education_improved(self, doc: ResumeDocument) -> List[Dict[str, Any]]:
+        """Enhanced education extraction for diverse resume formats"""
+        education = []
+        lines = doc.stripped
+        lines_upper = doc.upper_lines
+        lines_lower = doc.lower_lines
+        sections = doc.sections
+
+        # Strategy 1: Extract degrees from candidate name line (common in titles)
+        # E.g., "Dexter Nigel Ramkissoon, MBA, MS Cybersecurity, CISSP..."
+        first_line = lines[0] if lines else ""
+        if first_line:
+            # Look for degrees in the name line, but exclude certifications
+            degree_matches = PATTERNS['edu_name_line_degree'].findall(first_line)
+            for degree_match in degree_matches:
+                degree_type = degree_match[0].upper()
+                degree_field = degree_match[1].strip()
+
+                # Skip if this looks like a certification rather than education
+                if any(cert_keyword in degree_field.upper() for cert_keyword in ['PMP', 'CERTIFIED', 'SCRUM', 'CISSP', 'CISM', 'CISA', 'CRISC']):
+                    continue
+
+                degree_name = f"{degree_type} {degree_field}".strip()
+                if degree_field:
+                    degree_name = f"{degree_type} {degree_field}"
+                else:
+                    degree_name = degree_type
+
+                education.append({
+                    'School': {'Name': ''},  # School not typically in name line
+                    'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
+                    'Dates': '',
+                    'StartDate': '',
+                    'EndDate': '',
+                    'GPA': ''
+                })
+                if doc.trace:
+                    doc.trace.record('education', 'degree', pattern='edu_name_line_degree', line=0, degree=degree_name)
+
+        # Strategy 2: Look for EDUCATION section headers
+        for start, end in sections.spans['education']:
+            for i in range(start, end):
+                line_clean = lines[i]
+                if not line_clean or line_clean.startswith('•'):
+                    continue
+
+                # Skip certification lines
+                if any(cert_keyword in lines_upper[i] for cert_keyword in ['PMP', 'CERTIFIED', 'SCRUM', 'CISSP', 'CISM', 'CISA', 'CRISC']):
+                    continue
+
+                # Pattern: "BSc, Computer Systems, City University of New York, NY"
+                if PATTERNS['edu_degree_keyword'].search(line_clean):
+                    degree_match = PATTERNS['edu_degree_line'].search(line_clean)
+                    if degree_match:
+                        degree_name = degree_match.group(1).strip()
+                        field = degree_match.group(2).strip() if degree_match.group(2) else ""
+                        school_info = degree_match.group(3).strip() if degree_match.group(3) else ""
+
+                        # Clean up the degree name
+                        if field and not field.lower() in ['computer', 'university', 'college']:
+                            degree_name = f"{degree_name} {field}"
+
+                        education.append({
+                            'School': {'Name': school_info},
+                            'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
+                            'Dates': '',
+                            'StartDate': '',
+                            'EndDate': '',
+                            'GPA': ''
+                        })
+                        if doc.trace:
+                            doc.trace.record('education', 'degree', pattern='edu_degree_line', line=i, degree=degree_name)
+
+        # Strategy 3: Look for standalone degree lines throughout text
+        for i, line_clean in enumerate(lines):
+            if not line_clean or line_clean in [line_clean for edu in education for edu in [edu.get('Degree', {}).get('Name', '')]]:
+                continue
+
+            # Pattern: "Bachelors in computer science & engineering, Acharya Nagarjuna University, India"
+            if PATTERNS['edu_in_university'].search(line_clean):
+                degree_match = PATTERNS['edu_in_university_parts'].search(line_clean)
+                if degree_match:
+                    degree_type = degree_match.group(1).strip()
+                    field = degree_match.group(2).strip()
+                    school = degree_match.group(3).strip()
+
+                    degree_name = f"{degree_type} in {field}"
+                    education.append({
+                        'School': {'Name': school},
+                        'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
+                        'Dates': '',
+                        'StartDate': '',
+                        'EndDate': '',
+                        'GPA': ''
+                    })
+                    if doc.trace:
+                        doc.trace.record('education', 'degree', pattern='edu_in_university_parts', line=i, degree=degree_name)
+                    continue
+
+            # Pattern: "Master of Computer Applications (MCA) with 78% from Sri Kirshnadevaraya University"
+            elif PATTERNS['edu_of_from'].search(line_clean):
+                degree_match = PATTERNS['edu_of_from_parts'].search(line_clean)
+                if degree_match:
+                    degree_type = degree_match.group(1).strip()
+                    field = degree_match.group(2).strip()
+                    school = degree_match.group(3).strip()
+
+                    degree_name = f"{degree_type} {field}"
+                    education.append({
+                        'School': {'Name': school},
+                        'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
+                        'Dates': '',
+                        'StartDate': '',
+                        'EndDate': '',
+                        'GPA': ''
+                    })
+                    if doc.trace:
+                        doc.trace.record('education', 'degree', pattern='edu_of_from_parts', line=i, degree=degree_name)
+                    continue
+
+            # Pattern: "Master of Science in Cybersecurity with a concentration in cyber intelligence"
+            elif PATTERNS['edu_of'].search(line_clean):
+                degree_match = PATTERNS['edu_of_parts'].search(line_clean)
+                if degree_match:
+                    degree_base = degree_match.group(1).strip()
+                    field = degree_match.group(2).strip() if degree_match.group(2) else ""
+
+                    degree_name = f"{degree_base} {field}".strip()
+
+                    # Look for school in next lines
+                    school_name = ""
+                    for j in range(i + 1, min(i + 3, len(lines))):
+                        next_line = lines[j]
+                        if any(keyword in lines_lower[j] for keyword in ['university', 'college', 'institute']):
+                            school_name = next_line
+                            break
+
+                    education.append({
+                        'School': {'Name': school_name},
+                        'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
+                        'Dates': '',
+                        'StartDate': '',
+                        'EndDate': '',
+                        'GPA': ''
+                    })
+                    if doc.trace:
+                        doc.trace.record('education', 'degree', pattern='edu_of_parts', line=i, degree=degree_name)
+                    continue
+
+            # Pattern: Standalone degree types "PHD in Corporate Innovation and Entrepreneurship"
+            elif PATTERNS['edu_in'].search(line_clean):
+                degree_match = PATTERNS['edu_in_parts'].search(line_clean)
+                if degree_match:
+                    degree_type = degree_match.group(1)
+                    field = degree_match.group(2).strip()
+
+                    degree_name = f"{degree_type} in {field}"
+
+                    # Look for school in next lines
+                    school_name = ""
+                    for j in range(i + 1, min(i + 4, len(lines))):
+                        next_line = lines[j]
+                        if any(keyword in lines_lower[j] for keyword in ['university', 'college', 'institute']) and not next_line.startswith('Ø'):
+                            school_name = next_line
+                            break
+
+                    education.append({
+                        'School': {'Name': school_name},
+                        'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
+                        'Dates': '',
+                        'StartDate': '',
+                        'EndDate': '',
+                        'GPA': ''
+                    })
+                    if doc.trace:
+                        doc.trace.record('education', 'degree', pattern='edu_in_parts', line=i, degree=degree_name)
+
+        # Strategy 4: Roman numeral format (Ahmad's format)
+        for start, end in sections.spans['education_numbered']:
+            for i in range(start, end):
+                line_clean = lines[i]
+                # Ahmad's format: "I. Bachelor's Degree of Computer Engineering"
+                if PATTERNS['edu_roman_degree'].match(line_clean):
+                    degree_match = PATTERNS['edu_roman_strip'].search(line_clean)
+                    if degree_match:
+                        degree_name = degree_match.group(1).strip()
+
+                        # Look for school in next few lines
+                        school_name = ""
+                        dates = ""
+                        for j in range(i + 1, min(i + 4, len(lines))):
+                            next_line = lines[j]
+                            if not next_line:
+                                continue
+                            if any(keyword in next_line for keyword in ['University', 'School', 'College', 'Institute']):
+                                school_match = PATTERNS['edu_school_year'].match(next_line)
+                                if school_match:
+                                    school_name = school_match.group(1).strip()
+                                    dates = school_match.group(2).strip()
+                                else:
+                                    school_name = next_line
+                                break
+
+                        education.append({
+                            'School': {'Name': school_name},
+                            'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
+                            'Dates': dates,
+                            'StartDate': '',
+                            'EndDate': '',
+                            'GPA': ''
+                        })
+                        if doc.trace:
+                            doc.trace.record('education', 'degree', pattern='edu_roman_strip', line=i, degree=degree_name)
+
+        # Strategy 5: ZAMEN's format - school name on one line, degree on next line
+        for i, line_clean in enumerate(lines):
+
+            # Look for university/college names followed by degree info
+            if PATTERNS['edu_school_usa'].search(line_clean) or PATTERNS['edu_school_uk'].search(line_clean):
+                school_name = line_clean
+
+                # Check next lines for degree information
+                for j in range(i + 1, min(i + 4, len(lines))):
+                    next_line = lines[j]
+                    if PATTERNS['edu_next_line_degree'].search(next_line):
+                        degree_match = PATTERNS['edu_next_line_degree_text'].search(next_line)
+                        if degree_match:
+                            degree_name = degree_match.group(0).strip()
+
+                            # Check if this degree is already in our list
+                            already_exists = any(edu.get('Degree', {}).get('Name', '').lower() == degree_name.lower() for edu in education)
+                            if not already_exists:
+                                education.append({
+                                    'School': {'Name': school_name},
+                                    'Degree': {'Name': degree_name, 'Type': self._classify_degree_type(degree_name)},
+                                    'Dates': '',
+                                    'StartDate': '',
+                                    'EndDate': '',
+                                    'GPA': ''
+                                })
+                                if doc.trace:
+                                    doc.trace.record('education', 'degree', pattern='edu_next_line_degree_text', line=j, degree=degree_name)
+                            break
+
+        # Remove duplicates based on degree name
+        seen_degrees = set()
+        unique_education = []
+        for edu in education:
+            degree_name = edu.get('Degree', {}).get('Name', '')
+            if degree_name and degree_name not in seen_degrees:
+                seen_degrees.add(degree_name)
+                unique_education.append(edu)
+
+        return unique_education
+
+    def _extract_experience_improved(self, doc: ResumeDocument) -> List[Dict[str, Any]]:
+        """Improved experience extraction with simplified, robust logic"""
+        positions = []
+
+        # Find the experience section first
+        spans = doc.sections.spans['experience']
+        if not spans:
+            return positions  # No experience section found
+        experience_start, experience_end = spans[0]
+        if doc.trace:
+            doc.trace.record('experience', 'section', start=experience_start, end=experience_end)
+
+        # Extract experience lines
+        experience_lines = doc.stripped[experience_start:experience_end]
+        experience_lower = doc.lower_lines[experience_start:experience_end]
+
+        # Parse positions from experience lines with improved logic for Kiran's format
+        current_position = None
+        i = 0
+
+        while i < len(experience_lines):
+            line = experience_lines[i]
+            line_lower = experience_lower[i]
+            if not line:
+                i += 1
+                continue
+
+            # Skip bullet points and descriptions - they belong to current position
+            if line.startswith('-') or line.startswith('•') or line.startswith('◦') or \
+               (current_position and (
+                   len(line.split()) > 8 or  # Long descriptive lines (lowered threshold)
+                   line_lower.startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded', 'established', 'conducted', 'implemented')) or  # Action words
+                   'framework' in line_lower or 'compliance' in line_lower or 'requirements' in line_lower  # Common description words
+               )):
+                if current_position:
+                    description = line[1:].strip() if line.startswith(('-', '•', '◦')) else line
+                    current_position['Description'].append(description)
+                i += 1
+                continue
+
+            # Skip standalone date lines that should not be treated as companies
+            # Pattern for Kiran's format: "Feb' 16 – Present", "Jul' 08 – Oct'15"
+            if DATES.contains('exp_standalone_dates', line):
+
+                # If we have a current position, try to add these dates to it
+                if current_position and not current_position.get('StartDate'):
+                    dates = line
+                    start_date = self._parse_start_date(dates)
+                    end_date = self._parse_end_date(dates)
+                    current_position['StartDate'] = start_date
+                    current_position['EndDate'] = end_date
+                    if doc.trace:
+                        doc.trace.record('experience', 'standalone_dates', pattern='exp_standalone_dates',
+                                         line=experience_start + i, position=len(positions))
+
+                i += 1
+                continue
+
+            # Check for company pattern: "Company Name, Location - Remote/Status" OR just company names
+            # Enhanced to handle .doc file formats like Ashok Kumar's
+            is_company_line = False
+            company = ""
+            location = ""
+
+            # Special pattern for Ashok Kumar's .doc format: "Augment Soft Sol Pvt. Ltd. Hyderabad"
+            if any(indicator in line for indicator in ['Pvt. Ltd.', 'Pvt Ltd', 'Inc.', 'Corp.', 'LLC', 'Company']) and len(line) < 150:
+                is_company_line = True
+
+            # More precise company detection - avoid matching description lines
+            if (
+                # Pattern 1: "Company, Location - Status" format
+                (',' in line and (' - ' in line or 'Remote' in line) and not line_lower.startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded'))) or
+                # Pattern 2: Company with location indicators
+                (',' in line and any(indicator in line for indicator in ['Inc', 'Corp', 'LLC', 'CA', 'TX', 'NY', 'FL']) and not line_lower.startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded'))) or
+                # Pattern 3: Specific company indicators
+                any(indicator in line for indicator in ['Federal Credit Union', 'Client:']) or
+                # Pattern 4: AT&T/DIRECTV only if it's a properly formatted company line (short, with location/industry info)
+                (('AT&T' in line or 'DIRECTV' in line) and (',' in line or '(' in line) and len(line) < 200 and not line_lower.startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded'))) or
+                # Pattern 5: Ahmad's format - "Company – Location" (em dash)
+                ('–' in line and len(line) < 100 and not line_lower.startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded'))) or
+                # Pattern 6: "Company - Location" (regular dash)
+                (' - ' in line and len(line) < 100 and not line_lower.startswith(('represented', 'managed', 'led', 'developed', 'collaborated', 'oversaw', 'spearheaded'))) or
+                # Pattern 7: Specific company names from Ahmad's resume
+                any(comp in line for comp in ['United Airline', 'Emburse', 'PepsiCo', 'Ligadata Solutions', 'EtQ']) and len(line) < 100
+            ):
+                is_company_line = True
+
+                if line.startswith('Client:'):
+                    # Handle "Client: Company Name, Location"
+                    company_part = line.replace('Client:', '').strip()
+                    if ',' in company_part:
+                        company_location = company_part.split(',')
+                        company = company_location[0].strip()
+                        location = ','.join(company_location[1:]).strip()
+                    else:
+                        company = company_part
+                else:
+                    # Handle various company formats
+                    if ' - ' in line or '–' in line:
+                        # Format: "Company, Location - Remote" or "Company – Location"
+                        if '–' in line:
+                            # Handle em dash format: "United Airline – Remote"
+                            main_part, status = line.split('–', 1)
+                        else:
+                            # Handle regular dash format
+                            main_part, status = line.split(' - ', 1)
+
+                        if ',' in main_part:
+                            company_parts = main_part.split(',')
+                            company = company_parts[0].strip()
+                            location = f"{','.join(company_parts[1:]).strip()}, {status.strip()}"
+                        else:
+                            company = main_part.strip()
+                            location = status.strip()
+                    elif '(' in line and ')' in line:
+                        # Format: "AT&T / DIRECTV Inc, El Segundo, CA (Entertainment / Wireless)"
+                        main_part = line.split('(')[0].strip()
+                        industry_part = line.split('(')[1].split(')')[0].strip()
+
+                        if ',' in main_part:
+                            company_location = main_part.rsplit(',', 2)  # Split from right to get company and location parts
+                            if len(company_location) >= 2:
+                                company = company_location[0].strip()
+                                location = ', '.join(company_location[1:]).strip()
+                            else:
+                                company = main_part.strip()
+                                location = ""
+                        else:
+                            company = main_part.strip()
+                            location = ""
+                    else:
+                        # Simple format: just company name or "Company, Location"
+                        if ',' in line:
+                            company_parts = line.split(',')
+                            company = company_parts[0].strip()
+                            location = ','.join(company_parts[1:]).strip()
+                        else:
+                            company = line.strip()
+                            location = ""
+
+            if is_company_line:
+                # Save previous position if exists
+                if current_position:
+                    positions.append(current_position)
+
+                # Look for job title in next non-empty lines
+                job_title = ""
+                dates = ""
+
+                # Skip industry information line like "(Federal / State)"
+                j = i + 1
+                while j < len(experience_lines):
+                    next_line = experience_lines[j]
+                    if not next_line:
+                        j += 1
+                        continue
+
+                    # Skip industry info in parentheses
+                    if next_line.startswith('(') and next_line.endswith(')'):
+                        j += 1
+                        continue
+
+                    # This should be the job title
+                    job_keywords = ['Consultant', 'Manager', 'Director', 'Engineer', 'Developer', 'PMO', 'Sr.', 'Lead', 'Project']
+                    if any(keyword in next_line for keyword in job_keywords):
+                        # Check if dates are embedded in job title (Ahmad's format with parentheses)
+                        if '(' in next_line and ')' in next_line:
+                            # Extract dates from parentheses: "Project Manager III (July 2021 – Current)"
+                            title_match = PATTERNS['exp_title_parenthesized'].match(next_line)
+                            if title_match:
+                                job_title = title_match.group(1).strip()
+                                potential_dates = title_match.group(2).strip()
+
+                                # Check if parentheses contain dates
+                                if PATTERNS['exp_parenthesized_date'].search(potential_dates):
+                                    dates = potential_dates
+                                else:
+                                    job_title = next_line  # Keep original if not dates
+                            else:
+                                job_title = next_line
+                        # Check if dates are at the end of job title line (Kiran's format)
+                        elif PATTERNS['exp_title_trailing_dates'].search(next_line):
+                            # Extract dates from end: "Consultant / Sr. Program Manager / PMO Lead Feb' 16 – Present"
+                            title_match = PATTERNS['exp_title_trailing_dates_parts'].match(next_line)
+                            if title_match:
+                                job_title = title_match.group(1).strip()
+                                dates = title_match.group(2).strip()
+                            else:
+                                job_title = next_line
+                        else:
+                            job_title = next_line
+
+                        j += 1
+
+                        # If no embedded dates, look for dates in next line
+                        if not dates:
+                            while j < len(experience_lines):
+                                date_line = experience_lines[j]
+                                if not date_line:
+                                    j += 1
+                                    continue
+
+                                # Check if this is a date line
+                                if PATTERNS['exp_date_line'].search(date_line):
+                                    dates = date_line
+                                    break
+                                else:
+                                    # Not a date line, stop looking
+                                    break
+                                j += 1
+                        break
+                    j += 1
+
+                # Validate and fix potential job title/company swaps
+                # If company looks like a job title and job title looks like a company, swap them
+                job_keywords = ['Developer', 'Engineer', 'Manager', 'Analyst', 'Specialist', 'Director', 'Consultant', 'Administrator', 'Coordinator', 'Lead', 'Senior', 'Junior', 'Assistant', 'PMO']
+                company_keywords = ['Inc', 'Corp', 'LLC', 'Company', 'Solutions', 'Technologies', 'Systems', 'Consulting', 'Group', 'Services']
+
+                company_looks_like_job = company and any(keyword in company for keyword in job_keywords)
+                job_looks_like_company = job_title and any(keyword in job_title for keyword in company_keywords)
+
+                if company_looks_like_job and job_looks_like_company:
+                    # Swap them
+                    job_title, company = company, job_title
+
+                if doc.trace:
+                    doc.trace.record('experience', 'position', line=experience_start + i, position=len(positions),
+                                     company=company, title=job_title, dates=dates)
+
+                # Create new position
+                current_position = {
+                    'JobTitle': job_title,
+                    'Company': company,
+                    'Location': location,
+                    'StartDate': self._parse_start_date(dates),
+                    'EndDate': self._parse_end_date(dates),
+                    'Dates': dates,
+                    'Description': []
+                }
+                i = j  # Continue from where we left off
+            else:
+                i += 1
+
+        # Add the last position
+        if current_position:
+            positions.append(current_position)
+
+        return positions
+
+    def _is_job_title_line(self, line: str) -> bool:
+        """Check if a line looks like a job title"""
+        # Check for common job title keywords
+        job_keywords = [
+            'Developer', 'Engineer', 'Manager', 'Analyst', 'Specialist',
+            'Director', 'Consultant', 'Administrator', 'Coordinator',
+            'Lead', 'Senior', 'Junior', 'Assistant', 'PMO', 'Program Manager'
+        ]
+
+        # Pattern 1: Contains job keywords
+        if any(keyword in line for keyword in job_keywords):
+            return True
+
+        # Pattern 2: "Job Title - Company Name" format
+        if ' - ' in line and any(suffix in line for suffix in ['Inc.', 'Corp.', 'LLC', 'Corporation', 'Company', 'Solutions', 'Technologies', 'Systems']):
+            return True
+
+        # Pattern 3: Company name line (for Kiran's format: "Company, Location - Remote")
+        if ', ' in line and (' - ' in line or 'Remote' in line or 'CA' in line or 'TX' in line):
+            company_indicators = ['Inc.', 'Corp.', 'LLC', 'Corporation', 'Company', 'Solutions', 'Technologies', 'Systems', 'Federal', 'Credit Union', 'Partners', 'AT&T', 'DIRECTV']
+            if any(indicator in line for indicator in company_indicators):
+                return True
+
+        return False
+
+    def _parse_job_title_line(self, line: str, experience_lines: List[str], line_index: int) -> Dict[str, Any]:
+        """Parse a job title line and extract job info"""
+
+        # Check if this is a combined "Job Title - Company" format
+        if ' - ' in line and any(suffix in line for suffix in ['Inc.', 'Corp.', 'LLC', 'Corporation', 'Company', 'Solutions', 'Technologies', 'Systems']):
+            # Split job title and company
+            title_company_parts = line.split(' - ', 1)
+            job_title = title_company_parts[0].strip()
+            company = title_company_parts[1].strip()
+
+            # Look for location and dates in next line
+            location = ""
+            dates = ""
+
+            if line_index + 1 < len(experience_lines):
+                next_line = experience_lines[line_index + 1].strip()
+                if '|' in next_line:
+                    parts = next_line.split('|')
+                    location = parts[0].strip()
+                    if len(parts) > 1:
+                        date_part = parts[1].strip()
+                        # Extract dates from various formats
+                        date_range = DATES.find('job_pipe_dates', date_part)
+                        if date_range:
+                            dates = f"{date_range[0]} - {date_range[1]}"
+                else:
+                    location = next_line
+
+            return {
+                'JobTitle': job_title,
+                'Company': company,
+                'Location': location,
+                'StartDate': self._parse_start_date(dates),
+                'EndDate': self._parse_end_date(dates),
+                'Dates': dates,
+                'Description': []
+            }
+
+        # Check if this is "Company, Location" format (Kiran's format)
+        elif ', ' in line and (' - ' in line or 'Remote' in line):
+            # This is a company line, job title should be on next line
+            company_location = line
+            job_title = ""
+            dates = ""
+
+            # Extract company and location
+            if ' - ' in company_location:
+                company_parts = company_location.split(' - ')
+                company_city = company_parts[0].strip()
+                location = company_parts[1].strip()
+
+                # Further split company and city if comma exists
+                if ', ' in company_city:
+                    company_city_parts = company_city.split(', ')
+                    company = company_city_parts[0].strip()
+                    location = f"{company_city_parts[1].strip()}, {location}"
+                else:
+                    company = company_city
+            else:
+                company = company_location
+                location = ""
+
+            # Look for job title on next line
+            if line_index + 1 < len(experience_lines):
+                next_line = experience_lines[line_index + 1].strip()
+                # Skip empty lines
+                next_idx = line_index + 1
+                while next_idx < len(experience_lines) and not experience_lines[next_idx].strip():
+                    next_idx += 1
+
+                if next_idx < len(experience_lines):
+                    potential_job_title = experience_lines[next_idx].strip()
+                    # Check if this looks like a job title
+                    job_keywords = ['Consultant', 'Manager', 'Director', 'Engineer', 'Developer', 'PMO', 'Program Manager']
+                    if any(keyword in potential_job_title for keyword in job_keywords):
+                        job_title = potential_job_title
+
+                        # Look for dates on line after job title
+                        date_idx = next_idx + 1
+                        while date_idx < len(experience_lines) and not experience_lines[date_idx].strip():
+                            date_idx += 1
+
+                        if date_idx < len(experience_lines):
+                            potential_date_line = experience_lines[date_idx].strip()
+                            date_range = DATES.find('job_next_line_dates', potential_date_line)
+                            if date_range:
+                                dates = f"{date_range[0]} - {date_range[1]}"
+
+            return {
+                'JobTitle': job_title,
+                'Company': company,
+                'Location': location,
+                'StartDate': self._parse_start_date(dates),
+                'EndDate': self._parse_end_date(dates),
+                'Dates': dates,
+                'Description': []
+            }
+
+        else:
+            # Original format: separate lines for job title, location, company, dates
+            job_title = line
+            location = ""
+            company = ""
+            dates = ""
+
+            # Look ahead for location, company, dates
+            if line_index + 1 < len(experience_lines):
+                location = experience_lines[line_index + 1].strip()
+
+            if line_index + 2 < len(experience_lines):
+                company = experience_lines[line_index + 2].strip()
+
+            if line_index + 3 < len(experience_lines):
+                date_line = experience_lines[line_index + 3].strip()
+                date_range = DATES.find('job_numeric_dates', date_line)
+                if date_range:
+                    dates = f"{date_range[0]} - {date_range[1]}"
+
+            return {
+                'JobTitle': job_title,
+                'Company': company,
+                'Location': location,
+                'StartDate': self._parse_start_date(dates),
+                'EndDate': self._parse_end_date(dates),
+                'Dates': dates,
+                'Description': []
+            }
+
+    def _extract_skills_improved(self, doc: ResumeDocument, taxonomy: SkillTaxonomy,
+                                 max_skills: int = DEFAULT_MAX_SKILLS) -> List[Dict[str, Any]]:
+        """Advanced skills extraction with multiple detection methods"""
+        skills = []
+
+        # Method 1: Look for dedicated skills sections
+        skills_sections = self._find_skills_sections(doc)
+        if skills_sections:
+            for section_text in skills_sections:
+                skills.extend(self._parse_skills_from_section(section_text))
+        section_skill_count = len(skills)
+
+        # Method 2: Extract skills from experience descriptions using database matching
+        experience_skills = self._extract_skills_from_experience(doc, taxonomy)
+        skills.extend(experience_skills)
+
+        # Method 3: Look for technical terms and tools throughout the text
+        contextual_skills = self._extract_contextual_skills(doc, taxonomy)
+        skills.extend(contextual_skills)
+
+        # Remove duplicates and clean up
+        unique_skills = self._deduplicate_skills(skills)
+
+        # Rank cheaply and only estimate experience and add metadata for the top skills
+        top_skills = self._select_top_skills(unique_skills, max_skills)
+        if doc.trace:
+            doc.trace.record('skills', 'selected', sections=len(skills_sections), section_skills=section_skill_count,
+                             experience_skills=len(experience_skills), contextual_skills=len(contextual_skills),
+                             unique=len(unique_skills), kept=len(top_skills))
+        return self._enhance_skills_metadata(top_skills, doc)
+
+    def _build_comprehensive_skills_database(self):
+        """Build comprehensive skills database for matching"""
+        return {
+            'Programming Languages': [
+                'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'Rust', 'Ruby', 'PHP',
+                'Swift', 'Kotlin', 'Scala', 'R', 'MATLAB', 'SQL', 'HTML', 'CSS', 'Shell', 'Bash',
+                'PowerShell', 'Perl', 'VB.NET', 'Dart', 'Elixir', 'Clojure', 'F#', 'Haskell'
+            ],
+            'Cloud & DevOps': [
+                'AWS', 'Azure', 'GCP', 'Google Cloud', 'Docker', 'Kubernetes', 'Jenkins', 'Git', 'GitLab',
+                'GitHub', 'CI/CD', 'Terraform', 'Ansible', 'Chef', 'Puppet', 'Vagrant', 'Helm',
+                'Azure DevOps', 'TFS', 'Mesos', 'Subversion', 'SVN', 'Cloudflare', 'Key Cloak'
+            ],
+            'Databases': [
+                'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite', 'Oracle', 'SQL Server',
+                'Cassandra', 'DynamoDB', 'Elasticsearch', 'Neo4j', 'InfluxDB', 'Oracle Cloud'
+            ],
+            'Frameworks & Libraries': [
+                'React', 'Angular', 'Vue.js', 'Django', 'Flask', 'FastAPI', 'Spring', 'Express.js',
+                'Node.js', '.NET', 'Laravel', 'Rails', 'jQuery', 'Bootstrap', 'TensorFlow',
+                'PyTorch', 'Keras', 'NumPy', 'Pandas', 'Scikit-learn', 'OpenCV', 'Responsive Web'
+            ],
+            'Enterprise Software': [
+                'SAP', 'S/4 HANA', 'Salesforce', 'Microsoft Dynamics', 'ServiceNow', 'EPIC', 'Sitecore',
+                'Backbase', 'Clarity', 'TIBCO', 'Pega DSM', 'Comburent', 'Office 365', 'Microsoft Office Suite',
+                'Visio', 'Adobe Workfront', 'Hyperion', 'Jira', 'Coupa', 'Blockchain', 'Digital Assets'
+            ],
+            'Data & Analytics': [
+                'ETL', 'Big Data', 'Hadoop', 'Spark', 'Kafka', 'Data Mining', 'Machine Learning', 'AI',
+                'Deep Learning', 'Data Visualization', 'Tableau', 'Power BI', 'Analytics'
+            ],
+            'Mobile & Web': [
+                'Mobile Apps', 'iOS', 'Android', 'React Native', 'Flutter', 'Xamarin', 'Responsive Design',
+                'Progressive Web Apps', 'PWA', 'Mobile Development'
+            ],
+            'Security & Identity': [
+                'IAM', 'Identity Access Management', 'SSO', 'Single Sign-On', 'MFA', 'Multi-Factor Authentication',
+                'SAML', 'OAuth', 'LDAP', 'Active Directory', 'IBM Identity Security Access Manager',
+                'Shape Security', 'BioCatch', 'Cybersecurity', 'Information Security'
+            ],
+            'Project Management': [
+                'Agile', 'Scrum', 'Kanban', 'SAFe', 'Waterfall', 'PMP', 'PMI', 'Project Management',
+                'Program Management', 'Portfolio Management', 'PRINCE2', 'Lean', 'Six Sigma'
+            ]
+        }
+
+    def _find_skills_sections(self, doc: ResumeDocument) -> List[str]:
+        """Find dedicated skills sections in the resume"""
+        sections = []
+        lines = doc.stripped
+
+        # Each skills header runs until the next major section or skills-like header
+        for start, end in doc.sections.spans['skills']:
+            # Skip empty lines but include content lines
+            section_content = [line for line in lines[start:end] if line]
+            if section_content:
+                sections.append('\n'.join(section_content))
+
+        return sections
+
+    def _parse_skills_from_section(self, section_text: str) -> List[Dict[str, Any]]:
+        """Parse skills from a dedicated skills section"""
+        skills = []
+
+        # Handle pipe-separated skills (like in Kiran's resume)
+        if '|' in section_text:
+            lines = section_text.split('\n')
+            for line in lines:
+                if '|' in line:
+                    skill_items = [s.strip() for s in line.split('|')]
+                    for skill in skill_items:
+                        if skill and len(skill) > 1:
+                            skills.append({
+                                'name': skill,
+                                'source': 'skills_section',
+                                'confidence': 0.95
+                            })
+
+        # Handle comma-separated skills
+        elif ',' in section_text:
+            skill_items = [s.strip() for s in section_text.replace('\n', ',').split(',')]
+            for skill in skill_items:
+                if skill and len(skill) > 1:
+                    skills.append({
+                        'name': skill,
+                        'source': 'skills_section',
+                        'confidence': 0.9
+                    })
+
+        # Handle bullet-pointed skills
+        else:
+            lines = section_text.split('\n')
+            for line in lines:
+                line = line.strip()
+                # Remove bullet points
+                line = PATTERNS['skills_bullet'].sub('', line)
+                if line and len(line) > 1:
+                    skills.append({
+                        'name': line,
+                        'source': 'skills_section',
+                        'confidence': 0.85
+                    })
+
+        return skills
+
+    def _extract_skills_from_experience(self, doc: ResumeDocument, taxonomy: SkillTaxonomy) -> List[Dict[str, Any]]:
+        """Extract skills mentioned in experience descriptions"""
+        skills = []
+
+        # Single pass over the text for every skill, matched on word boundaries
+        # so it's not part of another word. Reported in skills database order.
+        for name, category in taxonomy.find_entries(doc.text_upper):
+            skills.append({
+                'name': name,
+                'category': category,
+                'source': 'experience_text',
+                'confidence': 0.8
+            })
+
+        return skills
+
+    def _extract_contextual_skills(self, doc: ResumeDocument, taxonomy: SkillTaxonomy) -> List[Dict[str, Any]]:
+        """Extract skills from technical context and descriptions"""
+        skills = []
+
+        # Look for technical patterns that indicate skills, collecting each
+        # pattern's phrases as its own non-overlapping finditer would
+        pattern_count = len(PATTERNS['skills_contextual'])
+        phrases = [[] for _ in range(pattern_count)]
+        pattern_ends = [0] * pattern_count
+        for match in PATTERNS['skills_contextual_scan'].finditer(doc.text):
+            group = match.lastindex
+            if match.start() < pattern_ends[group - 1]:
+                continue
+            pattern_ends[group - 1] = match.end(group)
+            phrases[group - 1].append(match.group(group))
+
+        # Validate against our skills database - first skill of each category found in the phrase
+        for pattern_phrases in phrases:
+            for potential_skill in pattern_phrases:
+                seen_categories = set()
+                for skill_id in sorted(taxonomy.matcher.find_ids(potential_skill.strip().upper())):
+                    known_skill, category = taxonomy.entries[skill_id]
+                    if category in seen_categories:
+                        continue
+                    seen_categories.add(category)
+                    skills.append({
+                        'name': known_skill,
+                        'category': category,
+                        'source': 'contextual',
+                        'confidence': 0.7
+                    })
+
+        return skills
+
+    def _deduplicate_skills(self, skills: List[Dict]) -> List[Dict]:
+        """Remove duplicate skills, keeping highest confidence"""
+        seen_skills = {}
+
+        for skill in skills:
+            skill_name = skill['name'].upper()
+            if skill_name not in seen_skills:
+                seen_skills[skill_name] = skill
+            else:
+                # Keep the one with higher confidence
+                if skill.get('confidence', 0) > seen_skills[skill_name].get('confidence', 0):
+                    seen_skills[skill_name] = skill
+
+        return list(seen_skills.values())
+
+    def _select_top_skills(self, skills: List[Dict], max_skills: int) -> List[Dict]:
+        """Best max_skills skills by confidence, earlier detections first on ties"""
+        # Bounded heap - O(n log k) and never touches the skills that are dropped
+        ranked = heapq.nsmallest(max_skills, enumerate(skills),
+                                 key=lambda item: (-item[1].get('confidence', 0.8), item[0]))
+        return [skill for _, skill in ranked]
+
+    def _enhance_skills_metadata(self, skills: List[Dict], doc: ResumeDocument) -> List[Dict[str, Any]]:
+        """Add experience estimates and metadata to all skills at once"""
+        months = self._estimate_months_experience([skill['name'].lower() for skill in skills], doc)
+        return [self._enhance_skill_metadata(skill, months[skill['name'].lower()]) for skill in skills]
+
+    def _estimate_months_experience(self, skill_names: List[str], doc: ResumeDocument) -> Dict[str, int]:
+        """Estimate months of experience per lowercased skill name from modifier phrases"""
+        text_lower = doc.text_lower
+
+        # One scan for every modifier: where a skill would have to start
+        # ("expert " + skill) or end (skill + " expert") to be modified by it
+        anchors = {}
+        for match in PATTERNS['skill_modifiers'].finditer(text_lower):
+            modifier = match.group(1)
+            anchors.setdefault(modifier, []).append(match.end(1) if modifier.endswith(' ') else match.start(1))
+
+        # (modifier, length) -> text of that length next to each occurrence of the modifier
+        neighbours = {}
+
+        def next_to(modifier, skill_name):
+            key = (modifier, len(skill_name))
+            if key not in neighbours:
+                length = len(skill_name)
+                if modifier.endswith(' '):
+                    neighbours[key] = {text_lower[pos:pos + length] for pos in anchors.get(modifier, ())}
+                else:
+                    neighbours[key] = {text_lower[pos - length:pos] for pos in anchors.get(modifier, ()) if pos >= length}
+            return skill_name in neighbours[key]
+
+        months = {}
+        for skill_name in skill_names:
+            if skill_name in months:
+                continue
+            for modifiers, months_experience in SKILL_MODIFIER_MONTHS:
+                if any(next_to(modifier, skill_name) for modifier in modifiers):
+                    break
+            else:
+                months_experience = 24 if skill_name in text_lower else 12  # 2 years / default
+            months[skill_name] = months_experience
+
+        return months
+
+    def _enhance_skill_metadata(self, skill: Dict, months_experience: int) -> Dict[str, Any]:
+        """Add metadata like experience estimation and categories"""
+
+        # Determine category if not already set
+        category = skill.get('category', 'Technical Skills')
+
+        return {
+            'name': skill['name'],
+            'category': category,
+            'months_experience': months_experience,
+            'confidence': skill.get('confidence', 0.8),
+            'source': skill.get('source', 'general'),
+            'last_used': '2024'  # Assume recent for active resume
+        }
+
+    def _extract_projects(self, doc: ResumeDocument) -> List[Dict[str, Any]]:
+        """Extract projects section"""
+        projects = []
+
+        # Find Projects section
+        for start, end in doc.sections.spans['projects']:
+            projects_text = '\n'.join(doc.lines[start:end])
+
+            # Split by project titles (lines that end with "Demo Link" or "Live App")
+            for match in PATTERNS['project_entry'].finditer(projects_text):
+                project_title = match.group(1).strip()
+                project_desc = match.group(2).strip()
+
+                # Extract bullet points
+                bullet_points = []
+                for line in project_desc.split('\n'):
+                    line = line.strip()
+                    if line.startswith('◦'):
+                        bullet_points.append(line[1:].strip())
+
+                projects.append({
+                    'name': project_title,
+                    'description': bullet_points
+                })
+
+        return projects
+
+    def _extract_certifications(self, doc: ResumeDocument) -> List[Dict[str, Any]]:
+        """Extract certifications"""
+        certifications = []
+
+        # Look for common certification keywords and patterns
+        cert_keywords = [
+            'PMP', 'Project Management Professional', 'CISSP', 'CISM', 'CISA',
+            'CRISC', 'CCNA', 'MCSE', 'ITIL', 'SAFe', 'Agilist', 'ScrumMaster',
+            'Scrum Master', 'Certified', 'Professional', 'Certificate'
+        ]
+
+        lines = doc.stripped
+
+        # First, look for standalone certification lines anywhere in the document
+        for line_clean in lines:
+
+            # Look for "PMP Certified / Scrum Master Certified" pattern
+            if PATTERNS['cert_pmp_scrum'].search(line_clean):
+                # Split by '/' to handle multiple certifications on one line
+                cert_parts = [part.strip() for part in line_clean.split('/')]
+                for cert_part in cert_parts:
+                    if cert_part and any(keyword in cert_part for keyword in cert_keywords):
+                        certifications.append({
+                            'name': cert_part,
+                            'authority': 'Professional Certification'
+                        })
+
+            # Look for Kiran's format: "Project Management Professional (PMP) | Certified SAFe® 5 Agilist | Certified ScrumMaster®"
+            elif PATTERNS['cert_pipe_list'].search(line_clean):
+                # Split by '|' to handle multiple certifications on one line
+                cert_parts = [part.strip() for part in line_clean.split('|')]
+                for cert_part in cert_parts:
+                    if cert_part and any(keyword.lower() in cert_part.lower() for keyword in ['PMP', 'Certified', 'SAFe', 'Agilist', 'ScrumMaster', 'Scrum Master']):
+                        certifications.append({
+                            'name': cert_part,
+                            'authority': 'Professional Certification'
+                        })
+
+            # Look for Dexter's format: certifications in name line
+            elif PATTERNS['cert_name_line'].search(line_clean):
+                # Extract certifications from name line (after degrees)
+                name_parts = [part.strip() for part in line_clean.split(',')]
+                for part in name_parts[1:]:  # Skip the name part
+                    if any(keyword.lower() in part.lower() for keyword in ['CISSP', 'CISM', 'CISA', 'CRISC', 'PMP', 'Security+', 'Network+']):
+                        certifications.append({
+                            'name': part,
+                            'authority': 'Professional Certification'
+                        })
+
+        # Then look for the formal certification section
+        sections = doc.sections
+        cert_headers = set(sections.headers['certifications'])
+        for start, end in sections.spans['certifications']:
+            for i in range(start, end):
+                line_clean = lines[i]
+                # Repeated section headers are not certifications
+                if not line_clean or i in cert_headers:
+                    continue
+
+                # Skip lines that are clearly not certifications
+                if any(exclude in line_clean for exclude in ['Bachelors', 'Masters', 'MBA', 'University', 'Award', 'Outstanding']):
+                    continue
+
+                # Check if line contains certification keywords
+                if any(keyword in line_clean for keyword in cert_keywords) or \
+                   PATTERNS['cert_generic'].search(line_clean):
+                    certifications.append({
+                        'name': line_clean,
+                        'authority': 'Professional Certification'
+                    })
+
+        return certifications
+
+    def _enhance_positions_with_dates(self, positions, doc: ResumeDocument):
+        """Post-process positions to find missing dates from standalone date lines"""
+        if all(position.get('StartDate') and position.get('EndDate') for position in positions):
+            return positions
+
+        # Find all date lines with their line numbers, kept sorted by line number
+        date_line_nums = []
+        date_ranges = {}
+        for i, line_clean in enumerate(doc.stripped):
+            date_range = DATES.find('date_ranges', line_clean)
+            if date_range:
+                date_line_nums.append(i)
+                date_ranges[i] = f"{date_range[0]} - {date_range[1]}"
+
+        # First line mentioning each job title / company, shared by positions at the same employer
+        mention_lines = {}
+
+        def first_mention(needle):
+            if needle not in mention_lines:
+                mention_lines[needle] = doc.find_lower_line(needle)
+            return mention_lines[needle]
+
+        # Try to associate dates with positions
+        search_range = 10  # Look within 10 lines of position
+        for position_index, position in enumerate(positions):
+            # Skip positions that already have dates
+            if position.get('StartDate') and position.get('EndDate'):
+                continue
+
+            # Find position's likely line number: first line with the job title or company
+            mentions = [first_mention(value.lower()) for value in (position.get('JobTitle', ''), position.get('Company', ''))
+                        if value]
+            mentions = [line for line in mentions if line != -1]
+            if not mentions:
+                continue
+            position_line = min(mentions)
+
+            # Closest remaining date line on either side - the earlier one wins a tie
+            index = bisect_left(date_line_nums, position_line)
+            candidates = []
+            if index < len(date_line_nums):
+                candidates.append((date_line_nums[index] - position_line, 1, index))
+            if index > 0:
+                candidates.append((position_line - date_line_nums[index - 1], 0, index - 1))
+            if not candidates:
+                continue
+            distance, _, closest = min(candidates)
+            if distance > search_range:
+                continue
+
+            # Apply the closest date and remove it from available dates to avoid duplicate assignment
+            date_line = date_line_nums.pop(closest)
+            date_range = date_ranges[date_line]
+            if doc.trace:
+                doc.trace.record('dates', 'assigned', pattern='date_ranges', position=position_index,
+                                 position_line=position_line, line=date_line, distance=distance)
+            position['Dates'] = date_range
+            position['StartDate'] = self._parse_start_date(date_range)
+            position['EndDate'] = self._parse_end_date(date_range)
+
+        return positions
+
+    def _calculate_quality_score(self, contact_info: Dict, experience: List, education: List, skills: List) -> float:
+        """Calculate parsing quality score"""
+        score = 0.0
+
+        # Contact info score (25%)
+        if contact_info.get('CandidateName', {}).get('FormattedName'):
+            score += 0.25
+
+        # Experience score (30%)
+        if experience:
+            score += 0.30
+
+        # Education score (25%)
+        if education:
+            score += 0.25
+
+        # Skills score (20%)
+        if skills:
+            score += 0.20
+
+        return score
+
+    def _parse_start_date(self, date_string) -> str:
+        """Parse start date from date range string"""
+        if not date_string or not isinstance(date_string, str):
+            return ""
+
+        return DATES.normalize(date_string)[0]
+
+    def _parse_end_date(self, date_string) -> str:
+        """Parse end date from date range string"""
+        if not date_string or not isinstance(date_string, str):
+            return ""
+
+        return DATES.normalize(date_string)[1]
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Office document text extraction
+
+DOCX files are read straight from the zip: word/document.xml (plus headers and
+footers) is fed through an incremental XML parser and paragraphs are emitted
+as they close, so no DOM of the document is ever built.
+
+Legacy Word 97-2003 .doc files are decoded through their piece table: only the
+WordDocument and table streams are read (via olefile), and the text pieces are
+decoded as cp1252 or UTF-16 as the piece descriptors say, without touching
+embedded objects. When that fails, scrape_printable_text pulls printable runs
+out of the raw file through a memory map and clean_mixed_binary_text keeps the
+readable segments.
+"""
+
+import io
+import mmap
+import os
+import re
+import struct
+import zipfile
+from typing import Iterator, List, Tuple, Union
+from xml.etree.ElementTree import iterparse
+
+# Transitional and Strict OOXML WordprocessingML namespaces
+_W_NAMESPACES = ('http://schemas.openxmlformats.org/wordprocessingml/2006/main',
+                 'http://purl.oclc.org/ooxml/wordprocessingml/main')
+
+
+def _tags(name):
+    return frozenset(f'{{{namespace}}}{name}' for namespace in _W_NAMESPACES)
+
+
+_TEXT_TAGS = _tags('t')
+_PARAGRAPH_TAGS = _tags('p')
+_BLOCK_TAGS = _PARAGRAPH_TAGS | _tags('tbl') | _tags('sdt')
+_RUN_TAGS = _tags('r')
+_TAB_TAGS = _tags('tab') | _tags('ptab')
+_BREAK_TAGS = _tags('br') | _tags('cr')
+_HYPHEN_TAGS = _tags('noBreakHyphen')
+
+_HEADER_PART = re.compile(r'word/header\d*\.xml$')
+_FOOTER_PART = re.compile(r'word/footer\d*\.xml$')
+
+DocxSource = Union[str, bytes, io.IOBase]
+
+
+def iter_docx_paragraphs(source: DocxSource, include_headers: bool = True) -> Iterator[str]:
+    """
+    Yield the text of every paragraph of a DOCX file in document order
+
+    source is a path, the file's bytes or a binary file object. Table cells
+    contribute their paragraphs in reading order. With include_headers, header
+    paragraphs come first and footer paragraphs last, as resumes often keep
+    contact details there.
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    with zipfile.ZipFile(source) as archive:
+        names = archive.namelist()
+        parts = ['word/document.xml']
+        if include_headers:
+            parts = ([name for name in sorted(names) if _HEADER_PART.match(name)] + parts +
+                     [name for name in sorted(names) if _FOOTER_PART.match(name)])
+        for part in parts:
+            if part in names:
+                with archive.open(part) as stream:
+                    yield from _iter_part_paragraphs(stream)
+
+
+def _iter_part_paragraphs(stream) -> Iterator[str]:
+    """Paragraphs of one WordprocessingML part, parsed incrementally"""
+    pieces = []
+    open_elements = []
+    open_blocks = 0
+    for event, element in iterparse(stream, events=('start', 'end')):
+        tag = element.tag
+        if event == 'start':
+            open_elements.append(element)
+            if tag in _BLOCK_TAGS:
+                open_blocks += 1
+            continue
+
+        open_elements.pop()
+        if tag in _TEXT_TAGS:
+            if element.text:
+                pieces.append(element.text)
+        elif tag in _TAB_TAGS:
+            # w:tab is also a tab stop definition under w:pPr/w:tabs; only run content is text
+            if open_elements and open_elements[-1].tag in _RUN_TAGS:
+                pieces.append('\t')
+        elif tag in _BREAK_TAGS:
+            pieces.append('\n')
+        elif tag in _HYPHEN_TAGS:
+            pieces.append('-')
+        elif tag in _PARAGRAPH_TAGS:
+            yield ''.join(pieces)
+            pieces.clear()
+
+        if tag in _BLOCK_TAGS:
+            open_blocks -= 1
+            # A top-level paragraph or table is done: drop it from its parent
+            # (body, header or footer) so memory stays flat on big documents
+            if not open_blocks and open_elements:
+                open_elements[-1].clear()
+
+
+def extract_text_from_docx(source: DocxSource, include_headers: bool = True) -> str:
+    """Text of a DOCX file, one paragraph per line"""
+    return '\n'.join(iter_docx_paragraphs(source, include_headers))
+
+
+# WordDocument stream: FibBase, then the variable-length FIB sections
+_WORD_IDENT = 0xA5EC
+_FIB_FLAGS = struct.Struct('<HH6xH')
+_FIB_ENCRYPTED = 0x0100
+_FIB_WHICH_TABLE = 0x0200
+_FIB_BASE_SIZE = 32
+# Word 97 writes nFib 0xC1 (and later versions keep it in FibBase); early Word 97
+# builds wrote 0xC0. Word 6 (101) and Word 95 (104) use an incompatible FIB
+_MIN_WORD97_FIB = 0xC0
+# Indices into FibRgLw97 and FibRgFcLcb97
+_CCP_TEXT = 3
+_CCP_FTN = 4
+_CCP_HDD = 5
+_FC_CLX = 33
+
+_COMPRESSED_PIECE = 0x40000000
+_PCD_SIZE = 8
+
+# Word control characters: paragraph and cell marks become line breaks,
+# anchors for pictures, objects and notes disappear
+_DOC_CONTROL_CHARS = str.maketrans({
+    '\r': '\n', '\x0b': '\n', '\x0c': '\n', '\x0e': '\n', '\x07': '\t',
+    '\x1e': '-', '\x1f': None, '\x01': None, '\x02': None, '\x03': None, '\x04': None,
+    '\x05': None, '\x08': None, '\x00': None,
+})
+_FIELD_MARK = re.compile('[\x13\x14\x15]')
+
+
+def extract_text_from_doc(source: Union[str, bytes], include_headers: bool = True) -> str:
+    """
+    Text of a Word 97-2003 .doc file, decoded through its piece table
+
+    source is a path or the file's bytes. Raises ValueError for files that are
+    not Word 97+ documents or are encrypted, so callers can fall back.
+    """
+    import olefile
+
+    ole = olefile.OleFileIO(source)
+    try:
+        if not ole.exists('WordDocument'):
+            raise ValueError("no WordDocument stream")
+        word_document = ole.openstream('WordDocument').read()
+        try:
+            which_table, ccp, fc_clx, lcb_clx = _read_fib(word_document)
+        except struct.error as e:
+            raise ValueError(f"FIB is truncated ({e})") from e
+
+        table_name = '1Table' if which_table else '0Table'
+        if not ole.exists(table_name):
+            raise ValueError(f"missing {table_name} stream")
+        table = ole.openstream(table_name).read()
+    finally:
+        ole.close()
+
+    if fc_clx + lcb_clx > len(table):
+        raise ValueError("piece table is truncated")
+    try:
+        pieces = _read_piece_table(table[fc_clx:fc_clx + lcb_clx])
+    except struct.error as e:
+        raise ValueError(f"piece table is truncated ({e})") from e
+
+    ccp_text, ccp_ftn, ccp_hdd = ccp
+    stories = [(0, ccp_text)]
+    if include_headers and ccp_hdd:
+        header_start = ccp_text + ccp_ftn
+        stories.append((header_start, header_start + ccp_hdd))
+    text = '\n'.join(_decode_range(word_document, pieces, start, end) for start, end in stories)
+    return _strip_field_codes(text).translate(_DOC_CONTROL_CHARS)
+
+
+def _read_fib(word_document: bytes) -> Tuple[bool, Tuple[int, int, int], int, int]:
+    """(table stream is 1Table, (ccpText, ccpFtn, ccpHdd), fcClx, lcbClx) from the FIB"""
+    if len(word_document) < _FIB_BASE_SIZE + 2:
+        raise ValueError("WordDocument stream is truncated")
+    ident, n_fib, flags = _FIB_FLAGS.unpack_from(word_document)
+    if ident != _WORD_IDENT:
+        raise ValueError("not a Word binary document")
+    if n_fib < _MIN_WORD97_FIB:
+        raise ValueError(f"Word 6/95 documents are not supported (nFib {n_fib})")
+    if flags & _FIB_ENCRYPTED:
+        raise ValueError("document is encrypted")
+
+    offset = _FIB_BASE_SIZE
+    csw, = struct.unpack_from('<H', word_document, offset)
+    offset += 2 + csw * 2
+    cslw, = struct.unpack_from('<H', word_document, offset)
+    rg_lw = struct.unpack_from(f'<{cslw}i', word_document, offset + 2)
+    offset += 2 + cslw * 4
+    cb_rg_fc_lcb, = struct.unpack_from('<H', word_document, offset)
+    if cslw <= _CCP_HDD or cb_rg_fc_lcb <= _FC_CLX:
+        raise ValueError("FIB is too short")
+    fc_clx, lcb_clx = struct.unpack_from('<II', word_document, offset + 2 + _FC_CLX * 8)
+
+    return bool(flags & _FIB_WHICH_TABLE), (rg_lw[_CCP_TEXT], rg_lw[_CCP_FTN], rg_lw[_CCP_HDD]), fc_clx, lcb_clx
+
+
+def _read_piece_table(clx: bytes) -> List[Tuple[int, int, int, bool]]:
+    """(cp_start, cp_end, byte offset, compressed) of every piece in the CLX"""
+    offset = 0
+    # Skip the Prc entries (property modifiers) in front of the Pcdt
+    while offset < len(clx) and clx[offset] == 0x01:
+        cb_grpprl, = struct.unpack_from('<h', clx, offset + 1)
+        offset += 3 + cb_grpprl
+    if offset >= len(clx) or clx[offset] != 0x02:
+        raise ValueError("piece table not found")
+    lcb, = struct.unpack_from('<I', clx, offset + 1)
+    plc = clx[offset + 5:offset + 5 + lcb]
+    if len(plc) != lcb or lcb < 4 or (lcb - 4) % (4 + _PCD_SIZE):
+        raise ValueError("piece table is malformed")
+
+    count = (lcb - 4) // (4 + _PCD_SIZE)
+    cps = struct.unpack_from(f'<{count + 1}I', plc)
+    pieces = []
+    for index in range(count):
+        fc, = struct.unpack_from('<I', plc, 4 * (count + 1) + index * _PCD_SIZE + 2)
+        if fc & _COMPRESSED_PIECE:
+            pieces.append((cps[index], cps[index + 1], (fc & ~_COMPRESSED_PIECE) // 2, True))
+        else:
+            pieces.append((cps[index], cps[index + 1], fc, False))
+    return pieces
+
+
+def _decode_range(word_document: bytes, pieces, start: int, end: int) -> str:
+    """Characters [start, end) of the document, gathered from the pieces that cover them"""
+    parts = []
+    for cp_start, cp_end, fc, compressed in pieces:
+        lo, hi = max(start, cp_start), min(end, cp_end)
+        if lo >= hi:
+            continue
+        if compressed:
+            first = fc + (lo - cp_start)
+            parts.append(word_document[first:first + (hi - lo)].decode('cp1252', errors='replace'))
+        else:
+            first = fc + 2 * (lo - cp_start)
+            parts.append(word_document[first:first + 2 * (hi - lo)].decode('utf-16-le', errors='replace'))
+    return ''.join(parts)
+
+
+def _strip_field_codes(text: str) -> str:
+    """Keep only field results: drop everything between field begin (0x13) and separator (0x14)"""
+    if '\x13' not in text:
+        return text
+    parts = []
+    in_code = []  # per open field, whether we are still in its code part
+    position = 0
+    for mark in _FIELD_MARK.finditer(text):
+        if not any(in_code):
+            parts.append(text[position:mark.start()])
+        char = mark.group()
+        if char == '\x13':
+            in_code.append(True)
+        elif in_code:
+            if char == '\x14':
+                in_code[-1] = False
+            else:
+                in_code.pop()
+        position = mark.end()
+    if not any(in_code):
+        parts.append(text[position:])
+    return ''.join(parts)
+
+
+# Printable runs worth keeping from a binary file: names, emails, phone numbers
+_PRINTABLE_RUN = re.compile(rb'[A-Za-z0-9\s@._()\-+]{8,}')
+# Upper bound on the text scraped from one file
+MAX_SCRAPED_BYTES = 1024 * 1024
+
+
+def scrape_printable_text(path: str, max_bytes: int = MAX_SCRAPED_BYTES) -> str:
+    """
+    Printable ASCII runs of a binary file, space separated, at most max_bytes
+
+    The file is scanned through a read-only memory map with an incremental
+    match iterator, so memory use is bounded by max_bytes however large the
+    file is.
+    """
+    parts = []
+    remaining = max_bytes
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            for match in _PRINTABLE_RUN.finditer(mapped):
+                part = match.group()
+                if len(part) >= remaining:
+                    if remaining:
+                        parts.append(part[:remaining])
+                    break
+                parts.append(part)
+                remaining -= len(part) + 1
+    return b' '.join(parts).decode('ascii')
+
+
+class _BinaryTextTable(dict):
+    """
+    str.translate table for clean_mixed_binary_text
+
+    Control characters become spaces; line breaks, tabs and characters beyond
+    the Basic Multilingual Plane become segment breaks. Other characters map to
+    themselves; each one is looked up in Python once and then memoized, so
+    translate stays in C for the rest of the text.
+    """
+
+    def __init__(self):
+        super().__init__()
+        for code in (*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), *range(0x7F, 0xA0)):
+            self[code] = ' '
+        for code in (0x09, 0x0A, 0x0D):
+            self[code] = '\n'
+
+    def __missing__(self, code):
+        value = '\n' if code > 0xFFFF else code
+        self[code] = value
+        return value
+
+
+_BINARY_TEXT_TABLE = _BinaryTextTable()
+# The same mapping for Latin-1 text, applied to its bytes at C speed
+_LATIN1_BINARY_TEXT_TABLE = bytes(range(256)).decode('latin-1').translate(_BINARY_TEXT_TABLE).encode('latin-1')
+
+
+def clean_mixed_binary_text(raw_text: str) -> str:
+    """
+    Readable segments of text that has binary data mixed in, one per line
+
+    A segment is a run of printable characters; it is kept when it has more
+    than two characters after trimming and collapsing whitespace and contains
+    at least one word or space character.
+    """
+    try:
+        translated = raw_text.encode('latin-1').translate(_LATIN1_BINARY_TEXT_TABLE).decode('latin-1')
+    except UnicodeEncodeError:
+        translated = raw_text.translate(_BINARY_TEXT_TABLE)
+
+    cleaned_lines = []
+    for segment in translated.split('\n'):
+        segment = segment.strip()
+        if len(segment) > 2 and any(char.isalnum() or char == '_' or char.isspace() for char in segment):
+            # Every whitespace character except the plain space is unprintable,
+            # so only segments with a double space or an unprintable one need collapsing
+            if '  ' in segment or not segment.isprintable():
+                segment = ' '.join(segment.split())
+            if len(segment) > 2:
+                cleaned_lines.append(segment)
+    return '\n'.join(cleaned_lines)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Parse result cache - parsed resumes keyed by the uploaded bytes and the parser version
+
+Results are stored as JSON: a bounded in-memory LRU tier (evicted by total size)
+in front of an optional SQLite tier that survives restarts. Every lookup hands
+out a fresh copy, so callers may add response metadata to what they get back.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(data: Union[bytes, str]) -> str:
+    """SHA-256 of an uploaded file, given its bytes or the path of a copy on disk"""
+    if isinstance(data, str):
+        with open(data, 'rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+    return hashlib.sha256(data).hexdigest()
+
+
+class ParseCache:
+    """
+    Two-tier cache of parse results
+
+    max_bytes bounds the serialized size of the in-memory tier (0 disables it);
+    db_path enables the SQLite tier. Disk hits are promoted to memory.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, db_path: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._size = 0
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            with self._db:
+                self._db.execute('CREATE TABLE IF NOT EXISTS parse_results '
+                                 '(key TEXT PRIMARY KEY, result BLOB NOT NULL, version TEXT)')
+                columns = {row[1] for row in self._db.execute('PRAGMA table_info(parse_results)')}
+                if 'version' not in columns:
+                    # Files written before versions were recorded; purge() drops their rows
+                    self._db.execute('ALTER TABLE parse_results ADD COLUMN version TEXT')
+
+    @staticmethod
+    def key(digest: str, version: str, *options) -> str:
+        """Cache key of a file digest parsed by a given parser version with the given options"""
+        return hashlib.sha256('\0'.join(map(str, (digest, version) + options)).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return json.loads(blob)
+
+            if self._db is not None:
+                row = self._db.execute('SELECT result FROM parse_results WHERE key = ?', (key,)).fetchone()
+                if row is not None:
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                    return json.loads(row[0])
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, result: Dict[str, Any], version: Optional[str] = None):
+        """Store a result; version (the one in its key) lets purge() find it once it is stale"""
+        blob = json.dumps(result, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        with self._lock:
+            self._remember(key, blob)
+            if self._db is not None:
+                try:
+                    with self._db:
+                        self._db.execute('INSERT OR REPLACE INTO parse_results (key, result, version) VALUES (?, ?, ?)',
+                                         (key, blob, version))
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not store parse result in {self.db_path}: {e}")
+
+    def _remember(self, key: str, blob: bytes):
+        """Add to the memory tier, evicting least recently used entries beyond max_bytes"""
+        if len(blob) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = blob
+        self._size += len(blob)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def purge(self, keep_version: str) -> int:
+        """
+        Delete stored results of any other version; returns how many were removed
+
+        Only the SQLite tier is pruned: stale memory entries are never looked
+        up again and age out of the LRU.
+        """
+        if self._db is None:
+            return 0
+        with self._lock, self._db:
+            return self._db.execute('DELETE FROM parse_results WHERE version IS NOT ?', (keep_version,)).rowcount
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            if self._db is not None:
+                with self._db:
+                    self._db.execute('DELETE FROM parse_results')
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+            }
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Parse metrics - per-stage timing of a single parse and the in-process aggregates
+
+A StageTimer splits one request into consecutive stages (file extraction, each
+extractor, date enhancement, serialization); StageStats, RequestStats and
+CacheStats accumulate every request handled by the process, and
+render_prometheus() exports them for a /metrics endpoint.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class StageTimer:
+    """Durations in seconds of consecutive stages, measured lap by lap"""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self._last = time.perf_counter()
+
+    def lap(self, stage: str):
+        """Close the current stage, charging it everything since the previous lap"""
+        now = time.perf_counter()
+        self.timings[stage] = self.timings.get(stage, 0.0) + (now - self._last)
+        self._last = now
+
+    def merge(self, timings: Optional[Dict[str, float]]):
+        """Add stages measured by another timer (e.g. the parser's own breakdown)"""
+        for stage, seconds in (timings or {}).items():
+            self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+        self._last = time.perf_counter()
+
+
+class _NullTimer:
+    """Stand-in used when timing is disabled, so call sites never branch"""
+
+    timings = None
+
+    def lap(self, stage: str):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+# Upper bounds (seconds) of the stage latency histogram buckets
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class StageStats:
+    """Thread-safe latency histogram, total and maximum of every stage across requests"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # stage -> [count, total, max, per-bucket counts (not cumulative)]
+        self._stages: Dict[str, list] = {}
+
+    def observe(self, timings: Dict[str, float]):
+        with self._lock:
+            for stage, seconds in timings.items():
+                stats = self._stages.get(stage)
+                if stats is None:
+                    stats = self._stages[stage] = [0, 0.0, 0.0, [0] * len(self.buckets)]
+                stats[0] += 1
+                stats[1] += seconds
+                if seconds > stats[2]:
+                    stats[2] = seconds
+                index = bisect_left(self.buckets, seconds)
+                if index < len(self.buckets):
+                    stats[3][index] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """{stage: {'count', 'total_seconds', 'max_seconds', 'buckets'}} at this moment"""
+        with self._lock:
+            return {stage: {'count': count, 'total_seconds': total, 'max_seconds': maximum,
+                            'buckets': list(zip(self.buckets, accumulate(bucket_counts)))}
+                    for stage, (count, total, maximum, bucket_counts) in self._stages.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+
+class RequestStats:
+    """Thread-safe parse request counters: by file type and outcome, bytes received, in flight"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str], int] = {}
+        self.bytes_received = 0
+        self.in_flight = 0
+
+    def started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, file_type: str, outcome: str, size: int = 0):
+        with self._lock:
+            self.in_flight -= 1
+            key = (file_type, outcome)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self.bytes_received += size
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'requests': dict(self._requests), 'bytes_received': self.bytes_received,
+                    'in_flight': self.in_flight}
+
+
+class CacheStats:
+    """Registry of caches whose hit and miss counts are exported as metrics"""
+
+    def __init__(self):
+        self._sources: Dict[str, Callable[[], Tuple[int, int]]] = {}
+
+    def register(self, name: str, source: Callable[[], Tuple[int, int]]):
+        """source returns the cache's (hits, misses) so far"""
+        self._sources[name] = source
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        return {name: source() for name, source in list(self._sources.items())}
+
+
+# Aggregates of every request handled by this process
+STAGE_STATS = StageStats()
+REQUEST_STATS = RequestStats()
+CACHE_STATS = CacheStats()
+
+
+def render_prometheus(prefix: str = 'resume_parser') -> str:
+    """All process metrics in the Prometheus text exposition format (version 0.0.4)"""
+    lines = []
+
+    def family(name, kind, help_text):
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+    def sample(name, value, **labels):
+        label_text = ','.join(f'{key}="{_escape_label(str(label))}"' for key, label in labels.items())
+        lines.append(f"{prefix}_{name}{{{label_text}}} {_format_value(value)}" if label_text
+                     else f"{prefix}_{name} {_format_value(value)}")
+
+    requests = REQUEST_STATS.snapshot()
+    family('requests_total', 'counter', "Parse requests by uploaded file type and outcome")
+    for (file_type, outcome), count in sorted(requests['requests'].items()):
+        sample('requests_total', count, file_type=file_type, outcome=outcome)
+    family('request_bytes_total', 'counter', "Bytes of parse request bodies received")
+    sample('request_bytes_total', requests['bytes_received'])
+    family('requests_in_flight', 'gauge', "Parse requests currently being processed")
+    sample('requests_in_flight', requests['in_flight'])
+
+    family('stage_duration_seconds', 'histogram', "Time spent in each stage of a parse request")
+    for stage, stats in sorted(STAGE_STATS.snapshot().items()):
+        for bound, count in stats['buckets']:
+            sample('stage_duration_seconds_bucket', count, stage=stage, le=bound)
+        sample('stage_duration_seconds_bucket', stats['count'], stage=stage, le='+Inf')
+        sample('stage_duration_seconds_sum', stats['total_seconds'], stage=stage)
+        sample('stage_duration_seconds_count', stats['count'], stage=stage)
+
+    caches = sorted(CACHE_STATS.snapshot().items())
+    family('cache_hits_total', 'counter', "Cache lookups answered from the cache")
+    for name, (hits, _) in caches:
+        sample('cache_hits_total', hits, cache=name)
+    family('cache_misses_total', 'counter', "Cache lookups that had to compute the value")
+    for name, (_, misses) in caches:
+        sample('cache_misses_total', misses, cache=name)
+    family('cache_hit_ratio', 'gauge', "Share of cache lookups answered from the cache")
+    for name, (hits, misses) in caches:
+        sample('cache_hit_ratio', hits / (hits + misses) if hits + misses else 0.0, cache=name)
+
+    return '\n'.join(lines) + '\n'
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
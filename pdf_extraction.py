@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+PDF text extraction with PyMuPDF
+
+Pages are extracted one at a time and joined once. Large PDFs can be split
+into contiguous page ranges extracted by a pool of worker processes. This
+module has no import side effects, so the worker tasks only pull in it and
+PyMuPDF, not the server that uses it.
+"""
+
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz  # PyMuPDF
+
+# Pages of a PDF that are extracted (unset or 0 extracts them all)
+PDF_MAX_PAGES = int(os.environ.get('PDF_MAX_PAGES', '0')) or None
+
+# PDFs with at least this many pages are extracted by a pool of worker processes. Off by
+# default (0): set it from benchmarks/pdf_extraction_benchmark.py on the serving hardware
+PARALLEL_PDF_MIN_PAGES = int(os.environ.get('PARALLEL_PDF_MIN_PAGES', '0'))
+PDF_WORKERS = int(os.environ.get('PDF_WORKERS', '0')) or min(4, os.cpu_count() or 1)
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+
+def open_pdf(source):
+    """Open a PDF with PyMuPDF from a file path or the file's bytes"""
+    return fitz.open(stream=source, filetype='pdf') if isinstance(source, bytes) else fitz.open(source)
+
+
+def _page_limit(doc, max_pages):
+    return doc.page_count if max_pages is None else min(max_pages, doc.page_count)
+
+
+def _page_texts(doc, start, stop):
+    for page_number in range(start, stop):
+        yield doc.load_page(page_number).get_text()
+
+
+def iter_pdf_pages(source, max_pages=None):
+    """Yield the text of each page in order, stopping after max_pages pages"""
+    doc = open_pdf(source)
+    try:
+        yield from _page_texts(doc, 0, _page_limit(doc, max_pages))
+    finally:
+        doc.close()
+
+
+def _extract_pdf_page_range(path, start, stop):
+    """Worker task: open the PDF file independently and extract pages [start, stop)"""
+    doc = fitz.open(path)
+    try:
+        return ''.join(_page_texts(doc, start, stop))
+    finally:
+        doc.close()
+
+
+def _pool_context():
+    """
+    Start method for the worker pool
+
+    Forking the server would copy its running request and watcher threads'
+    state, so workers come from a fork server that only preloads this module;
+    where that is unavailable they are spawned. Either way a server started as
+    a script is re-run once per worker, outside its __main__ block.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def _get_pdf_pool():
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=_pool_context())
+        return _pdf_pool
+
+
+def extract_text_from_pdf_parallel(source, page_count, workers=None):
+    """
+    Extract pages in contiguous ranges on the worker pool and reassemble them in page order
+
+    Workers are handed a file path; PDF bytes are written to a temporary file
+    once rather than pickled into every task.
+    """
+    if isinstance(source, bytes):
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
+            tmp_file.write(source)
+        try:
+            return extract_text_from_pdf_parallel(tmp_file.name, page_count, workers)
+        finally:
+            os.unlink(tmp_file.name)
+
+    workers = workers or PDF_WORKERS
+    chunk = -(-page_count // workers)
+    starts = range(0, page_count, chunk)
+    stops = [min(start + chunk, page_count) for start in starts]
+    return ''.join(_get_pdf_pool().map(_extract_pdf_page_range, [source] * len(starts), starts, stops))
+
+
+def extract_text_from_pdf(source, max_pages=PDF_MAX_PAGES, parallel_min_pages=PARALLEL_PDF_MIN_PAGES):
+    """
+    Extract text from PDF using PyMuPDF; source is a file path or the file's bytes
+
+    PDFs with at least parallel_min_pages pages are split across the worker
+    pool; smaller ones, or all of them when the threshold is 0, stay serial.
+    """
+    try:
+        doc = open_pdf(source)
+        try:
+            page_count = _page_limit(doc, max_pages)
+            if not (parallel_min_pages and PDF_WORKERS > 1 and page_count >= parallel_min_pages):
+                return ''.join(_page_texts(doc, 0, page_count))
+        finally:
+            doc.close()
+        return extract_text_from_pdf_parallel(source, page_count)
+    except Exception as e:
+        print(f"Error extracting PDF: {e}")
+        return ""
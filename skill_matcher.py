@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Multi-pattern skill matcher - finds every skill of a taxonomy in one pass over the text
+"""
+
+import re
+from array import array
+from collections import deque
+from itertools import accumulate
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Text is split into maximal word runs and single non-word characters. Every
+# \b position in the text falls on a token edge, so a skill that matches with
+# word boundaries always lines up with whole tokens.
+TOKEN_PATTERN = re.compile(r'\w+|\W')
+_WORD_CHAR = re.compile(r'\w')
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over word/punctuation tokens
+
+    Matching a term is equivalent to re.search(r'\\b' + re.escape(term) + r'\\b', text).
+    Scanning is linear in the number of tokens and does not depend on the number of
+    terms, so it scales to taxonomies with tens of thousands of skills.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms = list(terms)
+
+        # Token vocabulary of all terms - any other text token resets the automaton
+        self.vocab = {}
+        # (state * len(vocab) + token id) -> next state, filled in after the vocabulary is known
+        self.goto = {}
+        self.term_lengths = []
+        self.state_count = 1
+
+        term_tokens = []
+        for term in self.terms:
+            token_ids = [self.vocab.setdefault(token, len(self.vocab)) for token in TOKEN_PATTERN.findall(term)]
+            term_tokens.append(token_ids)
+            self.term_lengths.append(len(token_ids))
+
+        self.vocab_size = max(len(self.vocab), 1)
+        children = [[]]
+        # state -> ids of the terms ending there (only for states that end a term)
+        outputs = {}
+        for term_id, token_ids in enumerate(term_tokens):
+            if not token_ids:
+                continue
+            state = 0
+            for token_id in token_ids:
+                key = state * self.vocab_size + token_id
+                next_state = self.goto.get(key)
+                if next_state is None:
+                    next_state = self.state_count
+                    self.state_count += 1
+                    self.goto[key] = next_state
+                    children.append([])
+                    children[state].append((token_id, next_state))
+                state = next_state
+            outputs.setdefault(state, []).append(term_id)
+
+        self._build_failure_links(children, outputs)
+
+        # Terms ending at a state are output_terms[output_start[state]:output_start[state + 1]]
+        self.output_start = [0] * (self.state_count + 1)
+        self.output_terms = []
+        for state in range(self.state_count):
+            self.output_terms.extend(outputs.get(state, ()))
+            self.output_start[state + 1] = len(self.output_terms)
+
+    @classmethod
+    def from_arrays(cls, terms: List[str], vocab: List[str], arrays: Dict[str, array]) -> 'SkillMatcher':
+        """Rebuild a compiled matcher from to_arrays() output without recompiling it"""
+        matcher = cls.__new__(cls)
+        matcher.terms = list(terms)
+        matcher.vocab = dict(zip(vocab, range(len(vocab))))
+        matcher.vocab_size = max(len(vocab), 1)
+        matcher.goto = dict(zip(arrays['goto_keys'], arrays['goto_states']))
+        matcher.fail = arrays['fail'].tolist()
+        matcher.output_link = arrays['output_link'].tolist()
+        matcher.state_count = len(matcher.fail)
+        matcher.term_lengths = arrays['term_lengths'].tolist()
+        matcher.output_start = arrays['output_start'].tolist()
+        matcher.output_terms = arrays['output_terms'].tolist()
+        matcher.reports = arrays['reports'].tolist()
+        return matcher
+
+    def to_arrays(self) -> Tuple[List[str], Dict[str, array]]:
+        """Flatten the automaton into its token vocabulary and typed integer arrays"""
+        vocab = sorted(self.vocab, key=self.vocab.get)
+        arrays = {
+            'goto_keys': array('q', self.goto.keys()),
+            'goto_states': array('i', self.goto.values()),
+            'fail': array('i', self.fail),
+            'output_link': array('i', self.output_link),
+            'term_lengths': array('i', self.term_lengths),
+            'output_start': array('i', self.output_start),
+            'output_terms': array('i', self.output_terms),
+            'reports': array('b', self.reports),
+        }
+        return vocab, arrays
+
+    def _build_failure_links(self, children, outputs):
+        """Breadth-first construction of failure and output links"""
+        state_count = self.state_count
+        self.fail = [0] * state_count
+        # Nearest state along the failure chain that ends a term
+        self.output_link = [0] * state_count
+
+        queue = deque(child for _, child in children[0])
+        while queue:
+            state = queue.popleft()
+            for token_id, child in children[state]:
+                fallback = self.fail[state]
+                while True:
+                    target = self.goto.get(fallback * self.vocab_size + token_id)
+                    if target is not None or fallback == 0:
+                        break
+                    fallback = self.fail[fallback]
+                self.fail[child] = target if target is not None else 0
+                linked = self.fail[child]
+                self.output_link[child] = linked if linked in outputs else self.output_link[linked]
+                queue.append(child)
+
+        # States that end a term themselves or through their output links
+        self.reports = [int(state in outputs or self.output_link[state] != 0) for state in range(state_count)]
+
+    def _scan(self, tokens: List[str]):
+        """Yield (term_id, first_token, last_token) for every boundary-respecting occurrence"""
+        vocab_get = self.vocab.get
+        goto_get = self.goto.get
+        fail = self.fail
+        reports = self.reports
+        output_start = self.output_start
+        output_terms = self.output_terms
+        vocab_size = self.vocab_size
+        last_token = len(tokens) - 1
+
+        state = 0
+        for index, token in enumerate(tokens):
+            token_id = vocab_get(token)
+            if token_id is None:
+                state = 0
+                continue
+
+            while True:
+                next_state = goto_get(state * vocab_size + token_id)
+                if next_state is not None:
+                    state = next_state
+                    break
+                if state == 0:
+                    break
+                state = fail[state]
+
+            if not reports[state]:
+                continue
+
+            reporting = state
+            while reporting:
+                for term_id in output_terms[output_start[reporting]:output_start[reporting + 1]]:
+                    first = index - self.term_lengths[term_id] + 1
+                    if self._at_boundaries(tokens, first, index, last_token):
+                        yield term_id, first, index
+                reporting = self.output_link[reporting]
+
+    @staticmethod
+    def _at_boundaries(tokens: List[str], first: int, last: int, last_token: int) -> bool:
+        """Same test as \\b on both sides of tokens[first:last + 1]"""
+        # A word run is never adjacent to another word run, so only
+        # punctuation at either end of the match needs a word neighbour
+        if not _WORD_CHAR.match(tokens[first]):
+            if first == 0 or not _WORD_CHAR.match(tokens[first - 1]):
+                return False
+        if not _WORD_CHAR.match(tokens[last]):
+            if last == last_token or not _WORD_CHAR.match(tokens[last + 1]):
+                return False
+        return True
+
+    def find_all(self, text: str) -> List[Tuple[int, int, int]]:
+        """Return (term_id, start, end) character offsets into text for every hit, in text order"""
+        tokens = TOKEN_PATTERN.findall(text)
+        hits = list(self._scan(tokens))
+        if not hits:
+            return []
+        token_starts = list(accumulate(map(len, tokens), initial=0))
+        return [(term_id, token_starts[first], token_starts[last + 1]) for term_id, first, last in hits]
+
+    def find_ids(self, text: str) -> Set[int]:
+        """Return the ids of all terms found in text"""
+        return {term_id for term_id, _, _ in self._scan(TOKEN_PATTERN.findall(text))}
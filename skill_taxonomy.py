@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Skills taxonomy - the skills database compiled once into an immutable lookup structure
+
+A taxonomy can come from the built-in database or from a JSON file of the form
+{"Category": ["Skill", {"name": "Skill", "aliases": ["Alias", ...]}, ...], ...}.
+Compiling a large file takes a while, so the compiled form is saved next to it as
+a binary artifact and reloaded on later starts:
+
+    python3 skill_taxonomy.py skills.json [-o skills.taxonomy]
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from skill_matcher import SkillMatcher
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the artifact layout or the matcher's tokenization changes
+TAXONOMY_FORMAT_VERSION = 1
+
+ARTIFACT_MAGIC = b'SKTX'
+ARTIFACT_SUFFIX = '.taxonomy'
+_HEADER_PREFIX = struct.Struct('<4sI')
+
+
+class SkillTaxonomy:
+    """
+    Precomputed, read-only view of a {category: [skill, ...]} database
+
+    Everything the parser needs per resume is computed here once: uppercase
+    names, the category of every skill and the compiled matcher. Nothing is
+    mutated after construction, so one instance can be shared by all parser
+    instances and request threads.
+    """
+
+    def __init__(self, database: Dict[str, list], version: Optional[str] = None):
+        names, categories, terms = _flatten_database(database)
+        if version is None:
+            version = _digest(json.dumps(database, sort_keys=True).encode('utf-8'))
+        self._setup(names, categories, terms, version, SkillMatcher(terms))
+
+    def _setup(self, names: List[str], categories: List[str], terms: List[str], version: str, matcher: SkillMatcher):
+        """Bind the parallel name / category / matched term columns"""
+        self.version = version
+
+        # (name, category) in database order - a skill listed under two categories
+        # gets one entry per category, an alias gets an entry under its skill's name
+        self.entries: Tuple[Tuple[str, str], ...] = tuple(zip(names, categories))
+        self.upper_names: Tuple[str, ...] = tuple(terms)
+        self.matcher = matcher
+
+    def __len__(self):
+        return len(self.entries)
+
+    def find_entries(self, text_upper: str) -> List[Tuple[str, str]]:
+        """Return (name, category) for every skill found in the uppercased text, in database order"""
+        return [self.entries[skill_id] for skill_id in sorted(self.matcher.find_ids(text_upper))]
+
+    @classmethod
+    def from_file(cls, path: str) -> 'SkillTaxonomy':
+        """Compile a taxonomy straight from its JSON source file"""
+        with open(path, 'rb') as f:
+            source = f.read()
+        return cls(json.loads(source.decode('utf-8')), version=_digest(source))
+
+    @classmethod
+    def load(cls, path: str, artifact_path: Optional[str] = None) -> 'SkillTaxonomy':
+        """
+        Load a taxonomy file through its compiled artifact
+
+        The artifact is reused when its version stamp matches the source file,
+        otherwise the source is compiled again and the artifact rewritten.
+        """
+        artifact_path = artifact_path or default_artifact_path(path)
+        with open(path, 'rb') as f:
+            source = f.read()
+        version = _digest(source)
+
+        try:
+            return cls.load_artifact(artifact_path, expected_version=version)
+        except FileNotFoundError:
+            logger.info(f"📚 No compiled taxonomy at {artifact_path}, compiling {path}")
+        except ValueError as e:
+            logger.info(f"📚 Recompiling {path}: {e}")
+
+        taxonomy = cls(json.loads(source.decode('utf-8')), version=version)
+        try:
+            taxonomy.save(artifact_path)
+        except OSError as e:
+            logger.warning(f"Could not write compiled taxonomy {artifact_path}: {e}")
+        return taxonomy
+
+    def save(self, artifact_path: str):
+        """Write the compiled taxonomy as a binary artifact (atomically replaced)"""
+        vocab, arrays = self.matcher.to_arrays()
+        header = {
+            'format_version': TAXONOMY_FORMAT_VERSION,
+            'version': self.version,
+            'byteorder': sys.byteorder,
+            'names': [name for name, _ in self.entries],
+            'categories': [category for _, category in self.entries],
+            'terms': list(self.upper_names),
+            'vocab': vocab,
+            'arrays': [[name, values.typecode, len(values)] for name, values in arrays.items()],
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(artifact_path)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_HEADER_PREFIX.pack(ARTIFACT_MAGIC, len(header_bytes)))
+                f.write(header_bytes)
+                for values in arrays.values():
+                    values.tofile(f)
+            os.replace(tmp_path, artifact_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    @classmethod
+    def load_artifact(cls, artifact_path: str, expected_version: Optional[str] = None) -> 'SkillTaxonomy':
+        """Read a compiled taxonomy; raises ValueError if it is corrupt or stale"""
+        with open(artifact_path, 'rb') as f:
+            data = f.read()
+
+        try:
+            return cls._from_artifact_bytes(data, expected_version)
+        except (KeyError, TypeError, IndexError) as e:
+            # A header that parses as JSON but lacks fields or has the wrong shapes
+            raise ValueError(f"artifact header is malformed ({type(e).__name__}: {e})") from e
+
+    @classmethod
+    def _from_artifact_bytes(cls, data: bytes, expected_version: Optional[str]) -> 'SkillTaxonomy':
+        if len(data) < _HEADER_PREFIX.size:
+            raise ValueError("artifact is truncated")
+        magic, header_length = _HEADER_PREFIX.unpack_from(data)
+        if magic != ARTIFACT_MAGIC:
+            raise ValueError("not a compiled taxonomy")
+        offset = _HEADER_PREFIX.size + header_length
+        header = json.loads(data[_HEADER_PREFIX.size:offset].decode('utf-8'))
+        if not isinstance(header, dict):
+            raise ValueError("artifact header is not an object")
+
+        if header['format_version'] != TAXONOMY_FORMAT_VERSION:
+            raise ValueError(f"artifact format {header['format_version']} != {TAXONOMY_FORMAT_VERSION}")
+        if expected_version is not None and header['version'] != expected_version:
+            raise ValueError("artifact is stale (source file changed)")
+
+        arrays = {}
+        view = memoryview(data)
+        for name, typecode, length in header['arrays']:
+            values = array(typecode)
+            size = values.itemsize * length
+            if offset + size > len(data):
+                raise ValueError("artifact is truncated")
+            values.frombytes(view[offset:offset + size])
+            if header['byteorder'] != sys.byteorder:
+                values.byteswap()
+            arrays[name] = values
+            offset += size
+
+        terms = header['terms']
+        matcher = SkillMatcher.from_arrays(terms, header['vocab'], arrays)
+
+        taxonomy = cls.__new__(cls)
+        taxonomy._setup(header['names'], header['categories'], terms, header['version'], matcher)
+        return taxonomy
+
+
+def default_artifact_path(path: str) -> str:
+    """skills.json -> skills.taxonomy"""
+    return os.path.splitext(path)[0] + ARTIFACT_SUFFIX
+
+
+def _digest(source: bytes) -> str:
+    return hashlib.sha256(source).hexdigest()
+
+
+def _flatten_database(database: Dict[str, list]) -> Tuple[List[str], List[str], List[str]]:
+    """Name, category and uppercase matched term of every skill and alias, in database order"""
+    names, categories, terms = [], [], []
+    for category, skill_list in database.items():
+        for skill in skill_list:
+            if isinstance(skill, dict):
+                name = skill['name']
+                spellings = [name] + list(skill.get('aliases', []))
+            else:
+                name = skill
+                spellings = [skill]
+            for spelling in spellings:
+                names.append(name)
+                categories.append(category)
+                terms.append(spelling.upper())
+    return names, categories, terms
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Compile a skills taxonomy file into a binary artifact")
+    arg_parser.add_argument('taxonomy')
+    arg_parser.add_argument('-o', '--output', help="artifact path (default: <taxonomy>.taxonomy)")
+    args = arg_parser.parse_args()
+
+    output = args.output or default_artifact_path(args.taxonomy)
+    taxonomy = SkillTaxonomy.from_file(args.taxonomy)
+    taxonomy.save(output)
+    print(f"✅ Compiled {len(taxonomy)} skills and aliases into {output} (version {taxonomy.version[:12]})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())